@@ -5,14 +5,19 @@ A package for serializing and deserializing complex Python objects, extending JS
 # --------------------------------------------------------------------------------------------- #
 
 
-from .api import encode, decode, to_file, from_file
+from .api import encode, decode, dump, load, to_file, from_file, iter_file
+from .api import write_frame, append_frame, compact_frame, read_frame
 from .file.api import File
+from .session import Pyon
 
 
 # --------------------------------------------------------------------------------------------- #
 
 
-__all__ = ["encode", "decode", "to_file", "from_file", "File"]
+__all__ = [
+    "encode", "decode", "dump", "load", "to_file", "from_file", "iter_file",
+    "write_frame", "append_frame", "compact_frame", "read_frame", "File", "Pyon"
+]
 
 
 # --------------------------------------------------------------------------------------------- #
@@ -2,11 +2,11 @@
 # --------------------------------------------------------------------------------------------- #
 
 import logging
-import os
 
 # --------------------------------------------------------------------------------------------- #
 
-from .encoder import PyonEncoder
+from .frame.store import ROW_GROUP_SIZE
+from .session import Pyon
 
 # --------------------------------------------------------------------------------------------- #
 
@@ -15,54 +15,62 @@ logger = logging.getLogger(__name__)
 # --------------------------------------------------------------------------------------------- #
 
 
-def encode(obj, enc_protected: bool = False, enc_private: bool = False) -> str | None:
+def encode(
+    obj,
+    enc_protected: bool = False,
+    enc_private: bool = False,
+    compact: bool = False,
+    short_tags: bool = False,
+    native: bool = False,
+    refs: bool = False,
+    format: str = "text",  # pylint: disable=redefined-builtin
+) -> str | bytes | None:
     """Encodes a Python object into a Pyon-formatted string.
 
     Args:
         obj: The Python object to encode.
         enc_protected (bool): Whether to encode protected attributes.
         enc_private (bool): Whether to encode private attributes.
+        compact (bool): Minimal separators and no indentation.
+        short_tags (bool): Writes short tags (`~T`, `~D`, ...) instead of `__type__`, ...
+        native (bool): Writes subtrees made only of JSON-native types untagged.
+        refs (bool): Writes each shared container or object once, with an id; repeated
+            occurrences, including cycles, become back-references.
+        format (str): `text` (JSON), or `binary`: length-prefixed tagged values with raw
+            buffers, 8-byte numbers and a string table, returned as bytes. `compact` and
+            `short_tags` only apply to text.
 
     Returns:
-        str or None: The encoded Pyon string, or None if obj is None.
+        str, bytes or None: The encoded Pyon document, or None if obj is None.
     """
 
     # 1. ...
-    output = None
-    if obj is not None:
-
-        # 1.1 ...
-        encoder = PyonEncoder(enc_protected=enc_protected, enc_private=enc_private)
-        output = encoder.encode_str(obj)
+    session = Pyon.get(
+        enc_protected=enc_protected, enc_private=enc_private, native=native, refs=refs
+    )
 
     # 2. ...
-    return output
+    return session.encode(obj, compact=compact, short_tags=short_tags, format=format)
 
 
 # --------------------------------------------------------------------------------------------- #
 
 
-def decode(pyon_str: str | None):
+def decode(pyon_str: str | bytes | None):
     """
     Decodes a Pyon-formatted string into a Python object.
 
     Args:
-        pyon_str (str | None): The Pyon string to decode.
+        pyon_str (str | bytes | None): The Pyon document to decode: text (or UTF-8 bytes),
+            or a binary document from `encode(..., format="binary")`, detected by its
+            magic bytes.
 
     Returns:
         The decoded Python object, or None if pyon_str is None.
     """
 
     # 1. ...
-    output = None
-    if pyon_str is not None:
-
-        # 1.1 ...
-        encoder = PyonEncoder()
-        output = encoder.decode_str(pyon_str)
-
-    # 2. ...
-    return output
+    return Pyon.get().decode(pyon_str)
 
 
 # --------------------------------------------------------------------------------------------- #
@@ -74,59 +82,238 @@ def to_file(
     enc_protected: bool = False,
     enc_private: bool = False,
     verbose: bool = True,
+    compact: bool = False,
+    short_tags: bool = False,
+    native: bool = False,
+    refs: bool = False,
+    extern_threshold: int | None = None,
+    format: str = "text",  # pylint: disable=redefined-builtin
+    compression: str | None = None,
+):
+    """
+    Saves to file, streaming the text. Returns the file path (0.2.6 and earlier: the text).
+
+    With `extern_threshold`, buffers (arrays, bytes...) larger than it, in bytes, are
+    written as raw files in a `<file>.d` directory next to the document. With `format`
+    set to `binary`, the binary container is written instead of text; `from_file` detects
+    it. With `compression` (`gzip`, `bz2`, `lzma` or `zlib`), the document is compressed
+    while it is written, large documents in blocks on a thread pool; `from_file` and
+    `iter_file` detect the codec and decompress on the fly.
+    """
+
+    # 1. ...
+    session = Pyon.get(
+        enc_protected=enc_protected, enc_private=enc_private, native=native, refs=refs
+    )
+
+    # 2. ...
+    return session.to_file(
+        obj,
+        file_path=file_path,
+        verbose=verbose,
+        compact=compact,
+        short_tags=short_tags,
+        extern_threshold=extern_threshold,
+        format=format,
+        compression=compression,
+    )
+
+
+# --------------------------------------------------------------------------------------------- #
+
+
+def dump(
+    obj,
+    fp,
+    enc_protected: bool = False,
+    enc_private: bool = False,
+    compact: bool = False,
+    short_tags: bool = False,
+    native: bool = False,
+    refs: bool = False,
+    format: str = "text",  # pylint: disable=redefined-builtin
 ):
-    """ Saves to file """
+    """
+    Encodes a Python object and writes it to a file object, chunk by chunk.
+
+    Works on any writable text or binary file object: files, pipes, socket files, `BytesIO`.
+    Binary targets receive UTF-8. The full text is never held in memory.
+
+    Args:
+        obj: The Python object to encode.
+        fp: The writable file object.
+        enc_protected (bool): Whether to encode protected attributes.
+        enc_private (bool): Whether to encode private attributes.
+        compact (bool): Minimal separators and no indentation.
+        short_tags (bool): Writes short tags (`~T`, `~D`, ...) instead of `__type__`, ...
+        native (bool): Writes subtrees made only of JSON-native types untagged.
+        refs (bool): Writes each shared container or object once, with an id; repeated
+            occurrences, including cycles, become back-references.
+        format (str): `text`, or `binary` for the binary container (binary file objects).
+    """
 
     # 1. ...
-    pyon_text = encode(obj, enc_protected=enc_protected, enc_private=enc_private)
+    session = Pyon.get(
+        enc_protected=enc_protected, enc_private=enc_private, native=native, refs=refs
+    )
 
     # 2. ...
-    if ((pyon_text is not None) and (len(pyon_text) > 0) and file_path
-        and file_path.endswith(".pyon")):
+    session.dump(obj, fp, compact=compact, short_tags=short_tags, format=format)
 
-        # 1.1 ...
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
 
-        # 1.2 ...
-        with open(file_path, "w", encoding="utf-8") as file:
-            file.write(pyon_text)
+# --------------------------------------------------------------------------------------------- #
 
-        # 1.3 ...
-        if verbose:
-            logger.info("Data saved at %s", file_path)
 
-    # 3. ...
-    else:
-        raise ValueError(f"Not a valid pyon output file: '{file_path}'")
+def load(fp):
+    """
+    Reads and decodes a Pyon document from a text or binary (UTF-8) file object.
 
-    # 4. ...
-    return pyon_text
+    Args:
+        fp: The readable file object.
+
+    Returns:
+        The decoded Python object, or None if the file object is empty.
+    """
+
+    # 1. ...
+    return Pyon.get().load(fp)
 
 
 # --------------------------------------------------------------------------------------------- #
 
 
-def from_file(file_path: str):
+def from_file(file_path: str, mmap: bool = False):
     """
     Loads and decodes a Pyon-formatted file into a Python object.
 
     Args:
         file_path (str): The path to the Pyon file.
+        mmap (bool): Memory-maps external buffers (written with `extern_threshold`):
+            arrays are backed by the files and paged in on access.
 
     Returns:
         The decoded Python object, or None if the file does not exist or is invalid.
     """
 
     # 1. ...
-    pyon_str = None
-    if os.path.isfile(file_path):
+    return Pyon.get().from_file(file_path, mmap=mmap)
 
-        # 1.1. ...
-        with open(file=file_path, mode="r", encoding="utf-8") as file:
-            pyon_str = file.read()
 
-    # 2. ...
-    return decode(pyon_str)
+# --------------------------------------------------------------------------------------------- #
+
+
+def iter_file(file_path: str, mmap: bool = False):
+    """
+    Iterates a Pyon file whose top level is a collection, decoding one entry at a time.
+
+    The file is scanned incrementally: memory is bounded by the largest single entry, so
+    files far bigger than RAM can be processed.
+
+    Args:
+        file_path (str): The path to the Pyon file.
+        mmap (bool): Memory-maps external buffers instead of reading them.
+
+    Yields:
+        The elements of a top-level list, tuple, set, frozenset or deque, or the
+        `(key, value)` pairs of a top-level dict.
+    """
+
+    # 1. ...
+    yield from Pyon.get().iter_file(file_path, mmap=mmap)
+
+
+# --------------------------------------------------------------------------------------------- #
+
+
+def write_frame(frame, file_path: str, row_group_size: int = ROW_GROUP_SIZE):
+    """
+    Writes a DataFrame as a chunked frame file: rows are split into groups, and each group
+    into one chunk per column, so that `read_frame` decodes only what it needs.
+
+    Args:
+        frame (pandas.DataFrame): The frame to write.
+        file_path (str): The output path.
+        row_group_size (int): Rows per group.
+
+    Returns:
+        str: The file path.
+    """
+
+    # 1. ...
+    return Pyon.get().write_frame(frame, file_path, row_group_size=row_group_size)
+
+
+# --------------------------------------------------------------------------------------------- #
+
+
+def append_frame(frame, file_path: str, row_group_size: int = ROW_GROUP_SIZE):
+    """
+    Appends rows to a frame file written by `write_frame`, as new row groups: only the new
+    rows and the footer are written, so appends stay O(new rows). The columns, dtypes and
+    index levels (names and dtypes) must match those of the file. A missing file is written
+    as new.
+
+    Args:
+        frame (pandas.DataFrame): The rows to append.
+        file_path (str): The frame file.
+        row_group_size (int): Rows per new group.
+
+    Returns:
+        str: The file path.
+    """
+
+    # 1. ...
+    return Pyon.get().append_frame(frame, file_path, row_group_size=row_group_size)
+
+
+# --------------------------------------------------------------------------------------------- #
+
+
+def compact_frame(file_path: str, row_group_size: int = ROW_GROUP_SIZE):
+    """
+    Rewrites a frame file with its row groups merged into groups of `row_group_size` rows,
+    e.g. after many small appends. The file is replaced once the new one is complete.
+
+    Args:
+        file_path (str): The frame file.
+        row_group_size (int): Rows per group.
+
+    Returns:
+        str: The file path.
+    """
+
+    # 1. ...
+    return Pyon.get().compact_frame(file_path, row_group_size=row_group_size)
+
+
+# --------------------------------------------------------------------------------------------- #
+
+
+def read_frame(
+    file_path: str,
+    columns: list | None = None,
+    rows: slice | None = None,
+    filters: list | None = None,
+):
+    """
+    Reads columns and rows of a frame file written by `write_frame`, decoding only the
+    chunks that hold them. `from_file` reads whole frame files too.
+
+    Args:
+        file_path (str): The frame file.
+        columns (list | None): Column labels, in the order wanted. All if None.
+        rows (slice | None): Row positions, e.g. `slice(1000, 2000)`. All if None.
+        filters (list | None): Conditions rows must all meet, e.g.
+            `[("ts", ">=", t0), ("sym", "==", "X")]`; operators: `==`, `!=`, `<`, `<=`,
+            `>`, `>=`, `in`, `not in`. Row groups whose min/max statistics rule out a
+            match are skipped without being decoded.
+
+    Returns:
+        pandas.DataFrame: The selected part of the frame.
+    """
+
+    # 1. ...
+    return Pyon.get().read_frame(file_path, columns=columns, rows=rows, filters=filters)
 
 
 # --------------------------------------------------------------------------------------------- #
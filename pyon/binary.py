@@ -0,0 +1,499 @@
+""" Pyon: Python Object Notation - Binary Container """
+# --------------------------------------------------------------------------------------------- #
+
+import io
+import logging
+import os
+import struct
+
+# --------------------------------------------------------------------------------------------- #
+
+logger = logging.getLogger(__name__)
+
+# --------------------------------------------------------------------------------------------- #
+
+# First bytes of a binary document (a non-ASCII first byte, so it never reads as text), then
+# the layout version...
+BINARY_MAGIC = b"\x89PYON\r\n\x1a"
+_VERSION = 1
+
+# Value tags...
+_NONE = 0x00
+_FALSE = 0x01
+_TRUE = 0x02
+_INT = 0x03          # 8 bytes, little-endian, signed
+_BIGINT = 0x04       # length, then little-endian two's complement bytes
+_FLOAT = 0x05        # 8 bytes, little-endian IEEE 754
+_STR = 0x06          # length, then UTF-8
+_STR_NEW = 0x07      # length, then UTF-8; appended to the string table
+_STR_REF = 0x08      # position in the string table
+_BLOB = 0x09         # length, then raw bytes
+_LIST = 0x0A         # item count, then items
+_DICT = 0x0B         # pair count, then key (a string) and value pairs
+
+# Strings up to this length go to the string table: tags, class names, keys...
+_TABLE_MAX_LEN = 64
+
+# Bytes buffered before each write, when writing to a file object...
+_WRITE_CHUNK_SIZE = 1 << 16
+
+# Bytes read at a time past the expected size, when reading from a file object...
+_READ_CHUNK_SIZE = 1 << 20
+
+# ...
+_INT64 = struct.Struct("<q")
+_FLOAT64 = struct.Struct("<d")
+_INT64_MIN = -(1 << 63)
+_INT64_MAX = (1 << 63) - 1
+
+# --------------------------------------------------------------------------------------------- #
+
+
+class BinaryWriter():
+    """
+    Writes a Pyon node tree (the same tagged dictionaries and lists as the text format) as
+    length-prefixed tagged values:
+
+        BINARY_MAGIC, version byte, one value
+
+    Integers and floats are written in 8 bytes (larger integers by length), bytes-like
+    values as raw blobs, and short strings once: later occurrences refer to their position
+    in a string table that the reader rebuilds as it goes.
+    """
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def __init__(self, fp=None, default=None):
+        """
+        Initializes a Binary Writer.
+
+        Args:
+            fp: Writable binary file object. None collects the output (see `getvalue`).
+            default: Called with values of other types, like `json.JSONEncoder.default`: it
+                returns a value to write instead, or raises TypeError.
+        """
+
+        # 1. ...
+        self.fp = fp
+        self.default = default
+        self.buffer = bytearray()
+        self.strings = {}
+
+        # 2. Exact types; subclasses go through `isinstance`...
+        self._writers = {
+            type(None): self._write_none,
+            bool: self._write_bool,
+            int: self._write_int,
+            float: self._write_float,
+            str: self._write_str,
+            list: self._write_list,
+            tuple: self._write_list,
+            dict: self._write_dict,
+            bytes: self._write_blob,
+            bytearray: self._write_blob,
+            memoryview: self._write_blob,
+        }
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def write(self, value):
+        """ Writes a whole document: the header, then `value`. """
+
+        # 1. ...
+        self.buffer += BINARY_MAGIC
+        self.buffer.append(_VERSION)
+        self._write_value(value)
+
+        # 2. ...
+        self._flush()
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def getvalue(self) -> bytes:
+        """ The document, when written without a file object. """
+        return bytes(self.buffer)
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _write_value(self, value):
+        """ Writes one value, by exact type first. """
+
+        # 1. ...
+        writer = self._writers.get(type(value))
+        if writer is None:
+            writer = self._resolve(value)
+
+        # 2. Other types: replaced by `default`...
+        if writer is not None:
+            writer(value)
+        elif self.default is not None:
+            self._write_value(self.default(value))
+        else:
+            raise TypeError(f"Object of type {type(value).__name__} is not serializable")
+
+        # 3. Flushes the batch...
+        if (self.fp is not None) and (len(self.buffer) >= _WRITE_CHUNK_SIZE):
+            self._flush()
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _resolve(self, value):
+        """ Writer for subclasses (`IntEnum`, `numpy.float64`...). None for other types. """
+
+        # 1. ...
+        output = None
+        for cls in (bool, int, float, str, tuple, list, dict, bytes, bytearray, memoryview):
+            if isinstance(value, cls):
+                output = self._writers[cls]
+                break
+
+        # 2. ...
+        return output
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _write_none(self, value):
+        """ Writes None. """
+        self.buffer.append(_NONE)
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _write_bool(self, value: bool):
+        """ Writes a bool. """
+        self.buffer.append(_TRUE if value else _FALSE)
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _write_int(self, value: int):
+        """ Writes an int: 8 bytes if it fits, else by length. """
+
+        # 1. ...
+        if _INT64_MIN <= value <= _INT64_MAX:
+            self.buffer.append(_INT)
+            self.buffer += _INT64.pack(value)
+
+        # 2. ...
+        else:
+            data = int(value).to_bytes((value.bit_length() + 8) // 8, "little", signed=True)
+            self.buffer.append(_BIGINT)
+            self._write_size(len(data))
+            self.buffer += data
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _write_float(self, value: float):
+        """ Writes a float. """
+        self.buffer.append(_FLOAT)
+        self.buffer += _FLOAT64.pack(value)
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _write_str(self, value: str):
+        """ Writes a str: short ones once, then by position in the string table. """
+
+        # 1. Already in the table...
+        position = self.strings.get(value)
+        if position is not None:
+            self.buffer.append(_STR_REF)
+            self._write_size(position)
+
+        # 2. ...
+        else:
+            data = value.encode("utf-8")
+            if len(value) <= _TABLE_MAX_LEN:
+                self.strings[value] = len(self.strings)
+                self.buffer.append(_STR_NEW)
+            else:
+                self.buffer.append(_STR)
+            self._write_size(len(data))
+            self.buffer += data
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _write_list(self, value):
+        """ Writes a list (or tuple). """
+
+        # 1. ...
+        self.buffer.append(_LIST)
+        self._write_size(len(value))
+        for item in value:
+            self._write_value(item)
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _write_dict(self, value: dict):
+        """ Writes a dict: its keys must be strings, as in JSON. """
+
+        # 1. ...
+        buffer = self.buffer
+        buffer.append(_DICT)
+        self._write_size(len(value))
+        for key, item in value.items():
+
+            # 1.1 Keys: mostly early entries of the string table, one byte...
+            position = self.strings.get(key)
+            if (position is not None) and (position < 0x80):
+                buffer.append(_STR_REF)
+                buffer.append(position)
+            elif isinstance(key, str):
+                self._write_str(key)
+            else:
+                raise TypeError(f"Keys must be str, not {type(key).__name__}")
+
+            # 1.2 ...
+            self._write_value(item)
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _write_blob(self, value):
+        """ Writes raw bytes. Large ones go straight to the file object, without a copy. """
+
+        # 1. ...
+        view = memoryview(value)
+        self.buffer.append(_BLOB)
+        self._write_size(view.nbytes)
+
+        # 2. ...
+        if (self.fp is not None) and (view.nbytes >= _WRITE_CHUNK_SIZE):
+            self._flush()
+            self.fp.write(view)
+        else:
+            self.buffer += view
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _write_size(self, size: int):
+        """ Writes a size or position as an unsigned LEB128 varint. """
+
+        # 1. ...
+        while size >= 0x80:
+            self.buffer.append((size & 0x7F) | 0x80)
+            size >>= 7
+
+        # 2. ...
+        self.buffer.append(size)
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _flush(self):
+        """ Writes the buffered bytes to the file object, if any. """
+
+        # 1. ...
+        if (self.fp is not None) and self.buffer:
+            self.fp.write(self.buffer)
+            self.buffer = bytearray()
+
+    # ----------------------------------------------------------------------------------------- #
+
+
+# --------------------------------------------------------------------------------------------- #
+
+
+class BinaryReader():
+    """
+    Reads a document written by `BinaryWriter`. Dictionaries are passed to `object_hook` as
+    they complete (children first), like `json.JSONDecoder`, and blobs are returned as
+    `memoryview` slices of the document, without copies.
+    """
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def __init__(self, data, object_hook=None):
+        """
+        Initializes a Binary Reader.
+
+        Args:
+            data: The document (bytes-like). Blobs share its memory, and are read-only if it
+                is (see `read_buffer` for a writable one from a file).
+            object_hook: Called with each decoded dict; its result replaces the dict.
+        """
+
+        # 1. ...
+        self.data = memoryview(data)
+        self.object_hook = object_hook
+        self.strings = []
+        self.pos = 0
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def read(self):
+        """ Reads the whole document. Raises ValueError if it is not a valid one. """
+
+        # 1. Header...
+        if bytes(self.data[:len(BINARY_MAGIC)]) != BINARY_MAGIC:
+            raise ValueError("Not a binary Pyon document.")
+        self.pos = len(BINARY_MAGIC) + 1
+        if self.data[self.pos - 1] != _VERSION:
+            raise ValueError(f"Unsupported binary Pyon version: {self.data[self.pos - 1]}")
+
+        # 2. One value, and nothing after it...
+        try:
+            output = self._read_value()
+        except (IndexError, TypeError, RecursionError, struct.error, UnicodeDecodeError) as err:
+            raise ValueError(f"Invalid binary Pyon document: {err}") from err
+        if self.pos != len(self.data):
+            raise ValueError("Invalid binary Pyon document: trailing data.")
+
+        # 3. ...
+        return output
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _read_value(self):
+        """ Reads one value. """
+
+        # 1. ...
+        data = self.data
+        tag = data[self.pos]
+        self.pos += 1
+
+        # 2. Scalars: sizes and table positions below 128 take one byte...
+        if tag == _STR_REF:
+            position = data[self.pos]
+            if position < 0x80:
+                self.pos += 1
+            else:
+                position = self._read_size()
+            output = self.strings[position]
+        elif tag == _INT:
+            output = _INT64.unpack_from(data, self.pos)[0]
+            self.pos += 8
+        elif tag == _FLOAT:
+            output = _FLOAT64.unpack_from(data, self.pos)[0]
+            self.pos += 8
+        elif tag in (_STR, _STR_NEW):
+            output = str(self._read_bytes(), "utf-8")
+            if tag == _STR_NEW:
+                self.strings.append(output)
+        elif tag == _NONE:
+            output = None
+        elif tag in (_FALSE, _TRUE):
+            output = tag == _TRUE
+        elif tag == _BIGINT:
+            output = int.from_bytes(self._read_bytes(), "little", signed=True)
+        elif tag == _BLOB:
+            output = self._read_bytes()
+
+        # 3. Lists...
+        elif tag == _LIST:
+            output = [self._read_value() for _ in range(self._read_size())]
+
+        # 4. Dictionaries: keys are mostly early entries of the string table, values often
+        # numbers; both are read inline...
+        elif tag == _DICT:
+            output = {}
+            strings = self.strings
+            for _ in range(self._read_size()):
+
+                # 4.1 Key...
+                pos = self.pos
+                if (data[pos] == _STR_REF) and (data[pos + 1] < 0x80):
+                    key = strings[data[pos + 1]]
+                    self.pos = pos + 2
+                else:
+                    key = self._read_value()
+                    if type(key) is not str:  # pylint: disable=unidiomatic-typecheck
+                        raise ValueError(f"Invalid dict key at byte {pos}: {type(key)}.")
+
+                # 4.2 Value...
+                pos = self.pos
+                tag = data[pos]
+                if tag == _INT:
+                    output[key] = _INT64.unpack_from(data, pos + 1)[0]
+                    self.pos = pos + 9
+                elif tag == _FLOAT:
+                    output[key] = _FLOAT64.unpack_from(data, pos + 1)[0]
+                    self.pos = pos + 9
+                elif (tag == _STR_REF) and (data[pos + 1] < 0x80):
+                    output[key] = strings[data[pos + 1]]
+                    self.pos = pos + 2
+                else:
+                    output[key] = self._read_value()
+
+            # 4.1 ...
+            if self.object_hook is not None:
+                output = self.object_hook(output)
+
+        # 5. ...
+        else:
+            raise ValueError(f"Invalid binary Pyon tag {tag} at byte {self.pos - 1}.")
+
+        # 6. ...
+        return output
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _read_bytes(self) -> memoryview:
+        """ Reads a length, then as many bytes. """
+
+        # 1. ...
+        size = self._read_size()
+        end = self.pos + size
+        if end > len(self.data):
+            raise IndexError("value past the end of the document")
+
+        # 2. ...
+        output = self.data[self.pos:end]
+        self.pos = end
+
+        # 3. ...
+        return output
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _read_size(self) -> int:
+        """ Reads an unsigned LEB128 varint. """
+
+        # 1. ...
+        output = 0
+        shift = 0
+        while True:
+            byte = self.data[self.pos]
+            self.pos += 1
+            output |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                break
+            shift += 7
+
+        # 2. ...
+        return output
+
+    # ----------------------------------------------------------------------------------------- #
+
+
+# --------------------------------------------------------------------------------------------- #
+
+
+def read_buffer(fp) -> bytearray:
+    """
+    Reads the rest of a binary file object into a writable buffer, allocated once from the
+    file size when it is known, so that blobs of the document can be used in place.
+    """
+
+    # 1. Expected size: the rest of a plain file (a hint only, compressed streams differ)...
+    try:
+        size = max(os.fstat(fp.fileno()).st_size - fp.tell(), 0)
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        size = 0
+
+    # 2. Reads in place, then in chunks past the expected size...
+    output = bytearray(size)
+    filled = 0
+    while True:
+        if filled < len(output):
+            with memoryview(output) as view, view[filled:] as rest:
+                count = fp.readinto(rest)
+        else:
+            chunk = fp.read(_READ_CHUNK_SIZE)
+            output += chunk
+            count = len(chunk)
+        if not count:
+            break
+        filled += count
+
+    # 3. Short reads: drops the unused end...
+    del output[filled:]
+    return output
+
+
+# --------------------------------------------------------------------------------------------- #
@@ -0,0 +1,349 @@
+""" Pyon: Python Object Notation - Compressed Files """
+# --------------------------------------------------------------------------------------------- #
+
+import bz2
+import gzip
+import io
+import logging
+import lzma
+import os
+import zlib
+
+# --------------------------------------------------------------------------------------------- #
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+# --------------------------------------------------------------------------------------------- #
+
+logger = logging.getLogger(__name__)
+
+# --------------------------------------------------------------------------------------------- #
+
+# Codecs, by name...
+CODECS = ("gzip", "bz2", "lzma", "zlib")
+
+# Uncompressed bytes per block: blocks are compressed independently, on a thread pool...
+_BLOCK_SIZE = 1 << 22
+
+# Compression threads; blocks in flight are bounded to twice as many...
+_WORKERS = min(8, os.cpu_count() or 1)
+
+# Magic bytes, checked in order (zlib: see `_is_zlib`)...
+_MAGIC = (
+    (b"\x1f\x8b", "gzip"),
+    (b"BZh", "bz2"),
+    (b"\xfd7zXZ\x00", "lzma"),
+)
+_SNIFF_SIZE = 6
+
+# zlib stream: header (deflate, 32K window, default level), and the empty final block...
+_ZLIB_HEADER = b"\x78\x9c"
+_ZLIB_END = b"\x03\x00"
+
+# Compressed bytes read per refill, when decompressing zlib...
+_READ_CHUNK_SIZE = 1 << 16
+
+# --------------------------------------------------------------------------------------------- #
+
+
+def detect_compression(head: bytes) -> str | None:
+    """ The codec of a file from its first bytes, or None if it is not compressed. """
+
+    # 1. ...
+    output = None
+    for magic, codec in _MAGIC:
+        if head.startswith(magic):
+            output = codec
+            break
+
+    # 2. zlib has no magic: a header checksum (Pyon text never starts with `x`)...
+    if (output is None) and _is_zlib(head):
+        output = "zlib"
+
+    # 3. ...
+    return output
+
+
+# --------------------------------------------------------------------------------------------- #
+
+
+def open_writer(file, compression: str, level: int | None = None):
+    """
+    Wraps a binary file object in a compressing writer.
+
+    Written bytes are cut into blocks of `_BLOCK_SIZE`, compressed independently on a
+    thread pool (the codecs release the GIL) and written in order, so memory stays bounded.
+    Documents of one block are compressed in the calling thread. Blocks are complete streams
+    (gzip members, bz2 and xz streams) that standard tools read back as one, or flushed
+    pieces of a single zlib stream.
+
+    Args:
+        file: Writable binary file object.
+        compression (str): One of `CODECS`.
+        level (int | None): Compression level (`preset` for lzma). Codec default if None.
+
+    Returns:
+        A writable binary file object; closing it finishes the stream (not `file`).
+    """
+
+    # 1. ...
+    if compression not in CODECS:
+        raise ValueError(f"Invalid compression: '{compression}'. Expected one of: {CODECS}")
+
+    # 2. ...
+    return _BlockWriter(file, compression, level)
+
+
+# --------------------------------------------------------------------------------------------- #
+
+
+def open_reader(file):
+    """
+    Wraps a binary file object in a decompressing reader, detected from its first bytes.
+    Returns `file` itself if it is not compressed.
+    """
+
+    # 1. ...
+    codec = detect_compression(file.peek(_SNIFF_SIZE)[:_SNIFF_SIZE])
+
+    # 2. Multi-member gzip and multi-stream bz2 / xz files are read as one...
+    if codec == "gzip":
+        output = gzip.GzipFile(fileobj=file, mode="rb")
+    elif codec == "bz2":
+        output = bz2.BZ2File(file, mode="rb")
+    elif codec == "lzma":
+        output = lzma.LZMAFile(file, mode="rb")
+    elif codec == "zlib":
+        output = io.BufferedReader(_ZlibReader(file))
+    else:
+        output = file
+
+    # 3. ...
+    return output
+
+
+# --------------------------------------------------------------------------------------------- #
+
+
+def _is_zlib(head: bytes) -> bool:
+    """ If bytes start a zlib stream as written here: deflate, 32K window, no dictionary. """
+
+    # 1. ...
+    return (
+        (len(head) >= 2)
+        and (head[0] == _ZLIB_HEADER[0])
+        and (((head[0] << 8) | head[1]) % 31 == 0)
+        and (not head[1] & 0x20)
+    )
+
+
+# --------------------------------------------------------------------------------------------- #
+
+
+def _compress_block(codec: str, level: int | None, data: bytes) -> bytes:
+    """ Compresses one block as an independent stream (zlib: a flushed deflate piece). """
+
+    # 1. ...
+    if codec == "gzip":
+        output = gzip.compress(data, compresslevel=6 if level is None else level, mtime=0)
+    elif codec == "bz2":
+        output = bz2.compress(data, 9 if level is None else level)
+    elif codec == "lzma":
+        output = lzma.compress(data, preset=level)
+
+    # 2. Raw deflate, ending on a byte boundary so pieces join into one stream...
+    else:
+        compressor = zlib.compressobj(-1 if level is None else level, zlib.DEFLATED, -15)
+        output = compressor.compress(data) + compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    # 3. ...
+    return output
+
+
+# --------------------------------------------------------------------------------------------- #
+
+
+class _BlockWriter(io.RawIOBase):
+    """ Compressing writer over a binary file object: see `open_writer`. """
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def __init__(self, file, codec: str, level: int | None):
+        """ Initializes the writer; nothing is compressed until a block is full. """
+
+        # 1. ...
+        super().__init__()
+        self.file = file
+        self.codec = codec
+        self.level = level
+
+        # 2. Blocks: the one being filled, and those being compressed (in order)...
+        self.pending = bytearray()
+        self.futures = deque()
+        self.executor = None
+
+        # 3. zlib: one stream around all pieces, with a running checksum...
+        self.checksum = zlib.adler32(b"")
+        if codec == "zlib":
+            self.file.write(_ZLIB_HEADER)
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def writable(self) -> bool:
+        return True
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def write(self, data) -> int:
+        """ Buffers bytes, submitting each full block. """
+
+        # 1. Bytes...
+        view = memoryview(data)
+        if (view.ndim != 1) or (view.format != "B"):
+            view = view.cast("B")
+
+        # 2. Completes the pending block...
+        pos = min(len(view), _BLOCK_SIZE - len(self.pending))
+        self.pending += view[:pos]
+        if len(self.pending) == _BLOCK_SIZE:
+            self._submit(bytes(self.pending))
+            self.pending = bytearray()
+
+        # 3. Full blocks straight from the data, the rest is kept...
+        while len(view) - pos >= _BLOCK_SIZE:
+            self._submit(bytes(view[pos:pos + _BLOCK_SIZE]))
+            pos += _BLOCK_SIZE
+        self.pending += view[pos:]
+
+        # 4. ...
+        return view.nbytes
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def close(self):
+        """ Compresses the last block, writes all blocks in order and ends the stream. """
+
+        # 1. ...
+        if not self.closed:
+            try:
+
+                # 1.1 Last block (the only one, for small documents: no threads)...
+                if self.pending or (self.executor is None):
+                    self._submit(bytes(self.pending))
+                    self.pending = bytearray()
+
+                # 1.2 ...
+                while self.futures:
+                    self.file.write(self.futures.popleft().result())
+
+                # 1.3 zlib: final empty block and checksum...
+                if self.codec == "zlib":
+                    self.file.write(_ZLIB_END + self.checksum.to_bytes(4, "big"))
+
+            # 2. ...
+            finally:
+                self._shutdown()
+                super().close()
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """ On errors, pending blocks are dropped instead of written. """
+
+        # 1. ...
+        if exc_type is not None:
+            self.futures.clear()
+            self._shutdown()
+            super().close()
+
+        # 2. ...
+        else:
+            self.close()
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _submit(self, block: bytes):
+        """ Compresses a block: in the calling thread if it is the last and only one. """
+
+        # 1. ...
+        if self.codec == "zlib":
+            self.checksum = zlib.adler32(block, self.checksum)
+
+        # 2. Only block...
+        if (self.executor is None) and (len(block) < _BLOCK_SIZE):
+            self.file.write(_compress_block(self.codec, self.level, block))
+
+        # 3. Thread pool: at most two blocks in flight per thread...
+        else:
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(max_workers=_WORKERS)
+            self.futures.append(
+                self.executor.submit(_compress_block, self.codec, self.level, block)
+            )
+            while len(self.futures) > 2 * _WORKERS:
+                self.file.write(self.futures.popleft().result())
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _shutdown(self):
+        """ Stops the thread pool, if any. """
+
+        # 1. ...
+        if self.executor is not None:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+            self.executor = None
+
+    # ----------------------------------------------------------------------------------------- #
+
+
+# --------------------------------------------------------------------------------------------- #
+
+
+class _ZlibReader(io.RawIOBase):
+    """ Decompressing reader over a zlib stream. """
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def __init__(self, file):
+        """ Initializes the reader. """
+
+        # 1. ...
+        super().__init__()
+        self.file = file
+        self.decompressor = zlib.decompressobj()
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def readable(self) -> bool:
+        return True
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def readinto(self, buffer) -> int:
+        """
+        Fills `buffer` with decompressed bytes; 0 at the end of the stream. Output is capped
+        at the buffer size: input it leaves unconsumed is decompressed by the next calls.
+        """
+
+        # 1. Decompresses until there is output, or the stream ends: pending input first...
+        output = b""
+        while len(buffer) and (not output) and (not self.decompressor.eof):
+            chunk = self.decompressor.unconsumed_tail
+            if not chunk:
+                chunk = self.file.read(_READ_CHUNK_SIZE)
+                if not chunk:
+                    raise EOFError("Compressed file ended before the end of the zlib stream.")
+            output = self.decompressor.decompress(chunk, len(buffer))
+
+        # 2. ...
+        size = len(output)
+        buffer[:size] = output
+
+        # 3. ...
+        return size
+
+    # ----------------------------------------------------------------------------------------- #
+
+
+# --------------------------------------------------------------------------------------------- #
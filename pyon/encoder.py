@@ -1,16 +1,33 @@
 """ Pyon: Python Object Notation - Encoder """
 # --------------------------------------------------------------------------------------------- #
 
+import base64
+import io
 import json
 import logging
+import threading
 
 # --------------------------------------------------------------------------------------------- #
 
+from collections import deque
+from contextlib import contextmanager
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+from uuid import UUID
+
+# --------------------------------------------------------------------------------------------- #
+
+from .binary import BINARY_MAGIC, BinaryReader, BinaryWriter, read_buffer
 from .encoders import BaseEnc, ColEnc, DateEnc, SpecEnc, NumEnc, MapEnc
+from .refs import RefScope, is_tracked
+from .sidecar import Sidecar
+from .supported_types import SupportedTypes
 
 # --------------------------------------------------------------------------------------------- #
 
 from . import utils as ut
+from .utils import EConst
 
 # --------------------------------------------------------------------------------------------- #
 
@@ -18,14 +35,123 @@ logger = logging.getLogger(__name__)
 
 # --------------------------------------------------------------------------------------------- #
 
+_UNRESOLVED = object()
+
+# --------------------------------------------------------------------------------------------- #
+
+# Keys cache: entries kept per encoder before the cache is reset...
+_KEY_CACHE_SIZE = 4096
+
+# Key types whose equality implies an identical encoding (safe to cache on encode)...
+_KEY_ENC_TYPES = (str, int, bool, type(None), UUID, date)
+
+# Immutable key types that can be shared between decoded dicts...
+_KEY_DEC_TYPES = (
+    int, float, bool, str, type(None), complex, Decimal, UUID, date, datetime, time, Enum
+)
+
+# Compact JSON, used for tagged keys...
+_KEY_SEPARATORS = (",", ":")
+
+# String keys that would read as structural tags: written as tagged keys...
+_KEY_TAGS = frozenset((EConst.TYPE, EConst.CLASS, EConst.ID, EConst.REF))
+
+# Keys written by 0.2.6 and earlier are JSON texts (`"a"`, `2`, `{...}`): how they can start...
+_JSON_HEADS = frozenset('"{[-0123456789 \t\n\r')
+_JSON_WORD_HEADS = frozenset("tfnNI")
+_JSON_WORDS = frozenset(("true", "false", "null", "NaN", "Infinity"))
+
+# --------------------------------------------------------------------------------------------- #
+
+# JSON-native scalars (exact types: subclasses such as IntEnum keep their tags)...
+_NATIVE_SCALARS = frozenset((int, float, str, bool, type(None)))
+
+# Sequences written as a tagged native list, and rebuilt from it...
+_NATIVE_SEQUENCES = {
+    tuple: SupportedTypes.TUPLE.value,
+    set: SupportedTypes.SET.value,
+    frozenset: SupportedTypes.FROZENSET.value,
+    deque: SupportedTypes.DEQUE.value,
+}
+_NATIVE_BUILDERS = {tag: cls for cls, tag in _NATIVE_SEQUENCES.items()}
+
+# --------------------------------------------------------------------------------------------- #
+
+# Characters buffered before each write, when dumping to a file object...
+_WRITE_CHUNK_SIZE = 1 << 16
+
+# Compact dumps: nodes encoded in one shot (the C encoder); larger subtrees are walked...
+_STREAM_NODES = 1 << 12
+
+# --------------------------------------------------------------------------------------------- #
+
+
+class _Deferred():
+    """ A child value, encoded only when the JSON encoder reaches it. """
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+
+# --------------------------------------------------------------------------------------------- #
+
+
+class _PyonJSONEncoder(json.JSONEncoder):
+    """ JSON encoder that expands deferred children through a Pyon Encoder, node by node. """
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def __init__(self, encoder: "PyonEncoder", short_tags: bool = False, **kwargs):
+        """ Initializes the JSON encoder """
+
+        # 1. ...
+        super().__init__(**kwargs)
+        self.encoder = encoder
+        self.short_tags = short_tags
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def default(self, o):
+        """ Encodes one deferred node; its own children stay deferred. """
+
+        # 1. ...
+        if isinstance(o, _Deferred):
+            expand = self.encoder._expand  # pylint: disable=protected-access
+            return expand(o.value, self.short_tags)
+
+        # 2. ...
+        return super().default(o)
+
+    # ----------------------------------------------------------------------------------------- #
+
+
+# --------------------------------------------------------------------------------------------- #
+
 
 class PyonEncoder():
     """ Pyon Encoder """
 
     # ----------------------------------------------------------------------------------------- #
 
-    def __init__(self, enc_protected: bool = False, enc_private: bool = False):
-        """ Initializes a Pyon Encoder """
+    def __init__(
+        self,
+        enc_protected: bool = False,
+        enc_private: bool = False,
+        native: bool = False,
+        refs: bool = False,
+    ):
+        """
+        Initializes a Pyon Encoder
+
+        Args:
+            enc_protected (bool): Whether to encode protected attributes.
+            enc_private (bool): Whether to encode private attributes.
+            native (bool): Writes subtrees made only of JSON-native types untagged.
+            refs (bool): Writes each container or object once, with an id, and repeated
+                occurrences (shared or cyclic) as back-references.
+        """
 
         # 1. ...
         self.base_enc = BaseEnc()
@@ -39,40 +165,117 @@ class PyonEncoder():
         # 3. ...
         self.map_enc = MapEnc(self, enc_protected=enc_protected, enc_private=enc_private)
 
+        # 4. Resolution order for types without an exact match (subclasses)...
+        self._chain = (
+            self.base_enc,
+            self.num_enc,
+            self.col_enc,
+            self.date_enc,
+            self.spec_enc,
+            self.map_enc,
+        )
+
+        # 5. Dispatch tables: exact type -> handler, `__type__` -> handler...
+        self._encoders = {}
+        self._decoders = {}
+        for enc in self._chain:
+            self._encoders.update(enc.get_type_encoders())
+
+        # 6. Base Types are decoded untagged, all others by `__type__`...
+        for enc in self._chain[1:]:
+            self._decoders.update(enc.get_type_decoders())
+
+        # 7. Dictionary keys: encoded and decoded caches...
+        self._enc_keys = {}
+        self._dec_keys = {}
+
+        # 8. JSON encoders, per output layout and tag dialect...
+        self._json_encoders = {}
+
+        # 9. JSON-native passthrough...
+        self.native = native
+
+        # 10. Per-thread state: parsing (decode), streaming (encode), reference scopes...
+        self._state = threading.local()
+
+        # 11. Shared and cyclic references: tracked types are cached per class...
+        self.refs = refs
+        self._tracked = {}
+
+        # 12. Single-pass decoders: tagged nodes are rebuilt while parsing...
+        self._json_decoder = json.JSONDecoder(object_hook=self._decode_hook)
+        self._json_short_decoder = json.JSONDecoder(object_hook=self._decode_short_hook)
+
     # ----------------------------------------------------------------------------------------- #
 
     def encode_dict(self, value):
         """ Encodes the Entity object """
 
-        # 1. ...
+        # 1. While streaming, children are encoded when the JSON encoder reaches them...
         encoded = None
-        if value is not None:
+        if getattr(self._state, "streaming", False) and (type(value) not in _NATIVE_SCALARS):
+            encoded = _Deferred(value)
 
-            # 1.1 Base Types...
-            if self.base_enc.is_encode(value):
-                encoded = self.base_enc.encode(value)
+        # 2. Top-level call with references: opens the scope...
+        elif self.refs and (getattr(self._state, "enc_scope", None) is None):
+            with self._using("enc_scope", RefScope()):
+                encoded = self._encode_node(value)
 
-            # 1.2 Numeric Types...
-            elif self.num_enc.is_encode(value):
-                encoded = self.num_enc.encode(value)
+        # 3. ...
+        else:
+            encoded = self._encode_node(value)
 
-            # 1.3 Collection Types...
-            elif self.col_enc.is_encode(value):
-                encoded = self.col_enc.encode(value)
+        # 4. ...
+        return encoded
 
-            # 1.4 Datetime Types...
-            elif self.date_enc.is_encode(value):
-                encoded = self.date_enc.encode(value)
+    # ----------------------------------------------------------------------------------------- #
 
-            # 1.5 Specialized Types...
-            elif self.spec_enc.is_encode(value):
-                encoded = self.spec_enc.encode(value)
+    def _encode_node(self, value):
+        """ Encodes one node: tagged dictionary, type reference, or native value. """
 
-            # 1.6 Mapping Types...
-            elif self.map_enc.is_encode(value):
-                encoded = self.map_enc.encode(value)
+        # 1. JSON-native subtrees: written untagged...
+        cls = type(value)
+        encoded = None
+        if self.native and (cls not in _NATIVE_SCALARS):
+            encoded = self._encode_native(value)
 
-        # 2. ...
+        # 2. Containers and objects: repeated occurrences are back-references...
+        ref_id = None
+        if (encoded is None) and self.refs and (cls not in _NATIVE_SCALARS):
+            tracked = self._tracked.get(cls)
+            if tracked is None:
+                tracked = self._tracked[cls] = is_tracked(cls)
+
+            # 1.1 ...
+            scope = self._state.enc_scope
+            if tracked and (scope is not None):
+                ref_id = scope.lookup(value)
+                if ref_id is not None:
+                    encoded = {EConst.REF: ref_id}
+                else:
+                    ref_id = scope.add(value)
+
+        # 3. Exact type or previously resolved subclass...
+        if encoded is None:
+            handler = self._encoders.get(cls, _UNRESOLVED)
+
+            # 1.1 First time seen: resolves through the chain and caches...
+            if handler is _UNRESOLVED:
+                handler = self._resolve_encoder(value)
+                self._encoders[cls] = handler
+
+            # 1.2 ...
+            if handler is not None:
+                encoded = handler(value)
+
+            # 1.3 First occurrence: the node carries its id, else the id is dropped...
+            if ref_id is not None:
+                if isinstance(encoded, dict) and (EConst.TYPE in encoded):
+                    encoded[EConst.ID] = ref_id
+                else:
+                    self._state.enc_scope.remove(value, ref_id)
+
+        # 4. ...
         return encoded
 
     # ----------------------------------------------------------------------------------------- #
@@ -80,79 +283,837 @@ class PyonEncoder():
     def decode_dict(self, value):
         """ Decodes the value """
 
-        # 1. ...
-        decoded = None
-        if ut.is_decode_able(value):
+        # 1. While parsing, children reach their parent already decoded...
+        decoded = value
+        if getattr(self._state, "parsing", False):
+            pass
+
+        # 2. Top-level call: opens the reference scope...
+        elif getattr(self._state, "dec_scope", None) is None:
+            with self._using("dec_scope", RefScope()):
+                decoded = self._decode_node(value)
+
+        # 3. ...
+        else:
+            decoded = self._decode_node(value)
+
+        # 4. ...
+        return decoded
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _decode_node(self, value):
+        """ Decodes one node: tagged dictionary, type reference, or native value. """
 
-            # 1.1 Numeric Types...
-            if self.num_enc.is_decode(value):
-                decoded = self.num_enc.decode(value)
+        # 1. Back-references...
+        decoded = None
+        if (
+            (type(value) is dict)  # pylint: disable=unidiomatic-typecheck
+            and (EConst.REF in value)
+            and (len(value) == 1)
+        ):
+            decoded = self._state.dec_scope.resolve(value[EConst.REF])
 
-            # 1.2 Collection Types...
-            elif self.col_enc.is_decode(value):
-                decoded = self.col_enc.decode(value)
+        # 2. ...
+        elif ut.is_decode_able(value):
 
-            # 1.3 Datetime Types...
-            elif self.date_enc.is_decode(value):
-                decoded = self.date_enc.decode(value)
+            # 1.1 Native sequences...
+            if EConst.NATIVE in value:
+                builder = _NATIVE_BUILDERS.get(value[EConst.TYPE])
+                if builder is not None:
+                    decoded = builder(value[EConst.NATIVE])
 
-            # 1.4 Specialized Types...
-            elif self.spec_enc.is_decode(value):
-                decoded = self.spec_enc.decode(value)
+            # 1.2 Tagged Types...
+            else:
+                handler = self._decoders.get(value[EConst.TYPE])
+                if handler is not None:
+                    decoded = handler(value)
 
-            # 1.5 Mapping Types...
-            elif self.map_enc.is_decode(value):
-                decoded = self.map_enc.decode(value)
+            # 1.3 Identified objects: cycles may wait for them...
+            if EConst.ID in value:
+                scope = self._state.dec_scope
+                if scope.pending:
+                    scope.taint(value, decoded)
+                scope.register(value[EConst.ID], decoded)
 
-        # 2. Base Types...
+        # 3. Base Types...
         elif self.base_enc.is_decode(value):
             decoded = self.base_enc.decode(value)
 
-        # 3. ...
+        # 4. Untagged lists and dictionaries: JSON-native, taken as they are...
+        elif type(value) in (list, dict):  # pylint: disable=unidiomatic-typecheck
+            decoded = value
+
+        # 5. ...
         return decoded
 
     # ----------------------------------------------------------------------------------------- #
 
-    def encode_str(self, obj):
-        """ Exports to pyon. """
+    def encode_key(self, key) -> str:
+        """
+        Encodes a dictionary key.
+
+        `str` keys are written as they are (a leading `~` is doubled). Any other key, and the
+        `str` keys that read as tags (`__type__`, `__class__`) or may read as the JSON keys of
+        0.2.6 and earlier (`2`, `"a"`), is written as `~` followed by its compact Pyon
+        encoding, e.g. `~1`, `~"__type__"` or `~{...}`.
+        """
+
+        # 1. Plain strings...
+        if (
+            (type(key) is str)  # pylint: disable=unidiomatic-typecheck
+            and (key not in _KEY_TAGS)
+            and (not _is_json_like(key))
+        ):
+            output = (EConst.KEY + key) if key.startswith(EConst.KEY) else key
+
+        # 2. Tagged keys...
+        else:
+
+            # 1.1 Cached...
+            cache_key = (type(key), key)
+            cacheable = (type(key) in _KEY_ENC_TYPES) or isinstance(key, Enum)
+            output = self._enc_keys.get(cache_key) if cacheable else None
+
+            # 1.2 Encodes...
+            if output is None:
+
+                # 2.1 Strings: as JSON strings...
+                if type(key) is str:  # pylint: disable=unidiomatic-typecheck
+                    output = EConst.KEY + json.dumps(key, ensure_ascii=False)
+
+                # 2.2 Others: keys are small, built as a tree, with their own references...
+                else:
+                    with (
+                        self._using("streaming", False),
+                        self._using("enc_scope", None),
+                        self._using("sidecar", None),
+                        self._using("binary", False),
+                    ):
+                        encoded = self.encode_dict(key)
+                    output = EConst.KEY + json.dumps(
+                        encoded, ensure_ascii=False, separators=_KEY_SEPARATORS
+                    )
+
+                # 2.3 Caches...
+                if cacheable:
+                    if len(self._enc_keys) >= _KEY_CACHE_SIZE:
+                        self._enc_keys.clear()
+                    self._enc_keys[cache_key] = output
+
+        # 3. ...
+        return output
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def decode_key(self, key: str, legacy: bool = True):
+        """
+        Decodes a dictionary key written by `encode_key`, or by 0.2.6 and earlier: a JSON text,
+        which `encode_key` never writes as a plain key. Without `legacy` (containers whose keys
+        0.2.6 wrote as they were), plain keys are always strings. Keys that do not parse are
+        strings 0.2.6 wrote as they were (e.g. `~x` in a Counter).
+        """
+
+        # 1. Plain strings...
+        output = key
+        tagged = key.startswith(EConst.KEY)
+        legacy = legacy and (not tagged) and _is_json_like(key)
+        if tagged or legacy:
+
+            # 1.1 Escaped string...
+            if tagged and key.startswith(EConst.KEY, 1):
+                output = key[1:]
+
+            # 1.2 Tagged and legacy keys: strings skip the Pyon decoder...
+            else:
+                output = self._dec_keys.get(key, _UNRESOLVED)
+                if output is _UNRESOLVED:
+                    text = key[1:] if tagged else key
+                    try:
+                        if text.startswith('"'):
+                            output = json.loads(text)
+                        else:
+                            output = self._parse(self._json_decoder, text)
+                    except ValueError:
+                        output = key
+
+                    # 2.1 Caches immutable keys only...
+                    if self._is_value_key(output):
+                        if len(self._dec_keys) >= _KEY_CACHE_SIZE:
+                            self._dec_keys.clear()
+                        self._dec_keys[key] = output
+
+        # 2. ...
+        return output
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def encode_buffer(self, data) -> str | dict | memoryview:
+        """
+        Encodes a raw buffer (any contiguous bytes-like object) for the document.
+
+        Sub-encoders write binary payloads (bytes, arrays...) through here, so the storage
+        of buffers is decided in one place. Text documents hold them as Base64, binary ones
+        as they are; when writing with a `Sidecar`, large ones go to its files and a
+        reference is written instead.
+        """
+
+        # 1. Out of band...
+        sidecar = getattr(self._state, "sidecar", None)
+        if (sidecar is not None) and sidecar.accepts(memoryview(data).nbytes):
+            output = sidecar.write(data)
+
+        # 2. Binary documents: raw, without a copy...
+        elif getattr(self._state, "binary", False):
+            output = memoryview(data)
+
+        # 3. Inline...
+        else:
+            output = base64.b64encode(data).decode("ascii")
+
+        # 4. ...
+        return output
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def decode_buffer(self, value):
+        """ Decodes a buffer written by `encode_buffer`. Returns a bytes-like object. """
+
+        # 1. Out of band: only when reading a file...
+        output = None
+        if isinstance(value, dict):
+            sidecar = getattr(self._state, "sidecar", None)
+            if sidecar is not None:
+                output = sidecar.read(value)
+            else:
+                logger.error("External buffer outside of a file: %s", value.get(EConst.EXTERN))
+
+        # 2. Binary documents: raw...
+        elif isinstance(value, (bytes, bytearray, memoryview)):
+            output = value
+
+        # 3. Inline...
+        else:
+            output = base64.b64decode(value)
+
+        # 4. ...
+        return output
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _is_value_key(self, key) -> bool:
+        """ If a decoded key is immutable, and can be shared between dictionaries. """
+
+        # 1. Tuples and frozensets: checks their items...
+        if type(key) in (tuple, frozenset):
+            output = all(self._is_value_key(item) for item in key)
+
+        # 2. ...
+        else:
+            output = isinstance(key, _KEY_DEC_TYPES)
+
+        # 3. ...
+        return output
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _encode_native(self, value):
+        """ Returns `value` in its untagged form, or None if it is not JSON-native. """
+
+        # 1. Lists and dictionaries: written as they are...
+        output = None
+        cls = type(value)
+        if cls in (list, dict):
+            if self._is_native(value, set()):
+                output = value
+
+        # 2. Tuples, sets, deques: a list behind a cheap marker...
+        elif cls in _NATIVE_SEQUENCES:
+            if all(type(item) in _NATIVE_SCALARS for item in value):
+                output = {EConst.TYPE: _NATIVE_SEQUENCES[cls], EConst.NATIVE: list(value)}
+
+        # 3. ...
+        return output
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _is_native(self, value, visiting: set) -> bool:
+        """
+        If `value` is a JSON tree that decodes back unchanged: scalars, lists, and dictionaries
+        whose keys are strings that cannot be read as tags (`__...`) or encoded keys (`~...`).
+        """
+
+        # 1. Scalars...
+        cls = type(value)
+        output = cls in _NATIVE_SCALARS
+
+        # 2. Containers: reference cycles are left to the tagged encoders...
+        if (not output) and (cls in (list, dict)) and (id(value) not in visiting):
+            visiting.add(id(value))
+
+            # 1.1 Lists...
+            if cls is list:
+                output = all(self._is_native(item, visiting) for item in value)
+
+            # 1.2 Dictionaries...
+            else:
+                output = all(
+                    (type(key) is str)  # pylint: disable=unidiomatic-typecheck
+                    and not key.startswith(("__", EConst.KEY))
+                    and self._is_native(val, visiting)
+                    for key, val in value.items()
+                )
+
+            # 1.3 ...
+            visiting.discard(id(value))
+
+        # 3. ...
+        return output
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _resolve_encoder(self, value):
+        """ Finds the handler for a type without an exact entry (e.g. subclasses). """
+
+        # 1. ...
+        handler = None
+        for enc in self._chain:
+
+            # 1.1 First encoder that accepts the value wins...
+            handler = enc.get_encoder(value)
+            if handler is not None:
+                break
+
+        # 2. ...
+        return handler
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def encode_str(self, obj, compact: bool = False, short_tags: bool = False):
+        """
+        Exports to pyon.
+
+        Text is written while the object graph is walked: each node is encoded when the JSON
+        encoder reaches it, with its children deferred, so no mirror tree of the whole
+        document is built.
+
+        Args:
+            obj: The Python object to encode.
+            compact (bool): Minimal separators and no indentation.
+            short_tags (bool): Writes the short-tag dialect (`~T`, `~D`, ...) instead of
+                `__type__`, `__data__`, ...
+        """
+
+        # 1. ...
+        output = None
+        if obj is not None:
+
+            # 1.1 Encodes the root node, then streams...
+            with self._encoding():
+                encoded = self._expand(obj, short_tags)
+                if encoded is not None:
+                    output = self._get_json_encoder(compact, short_tags).encode(encoded)
+
+                # 2.1 ...
+                else:
+                    logger.error("Object '%s' failed to be encoded.", type(obj).__name__)
+
+        # 2. ...
+        return output
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def encode_bytes(self, obj) -> bytes | None:
+        """
+        Exports to the binary container format (see `binary.BinaryWriter`): the same nodes
+        as `encode_str`, with raw buffers, 8-byte numbers and a string table.
+        """
 
         # 1. ...
         output = None
         if obj is not None:
 
             # 1.1 ...
-            encoded = self.encode_dict(obj)
+            with self._encoding(), self._using("binary", True):
+                encoded = self._expand(obj, False)
+                if encoded is not None:
+                    writer = BinaryWriter(default=self._binary_default)
+                    writer.write(encoded)
+                    output = writer.getvalue()
 
-            # 1.2 ...
-            if encoded is not None:
-                output = json.dumps(encoded, ensure_ascii=False, indent=3)
+                # 2.1 ...
+                else:
+                    logger.error("Object '%s' failed to be encoded.", type(obj).__name__)
 
-            # 1.3 ...
-            else:
-                logger.error("Object '%s' failed to be encoded.", type(obj).__name__)
+        # 2. ...
+        return output
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def decode_bytes(self, data):
+        """
+        Imports from a binary container document. Buffers are decoded from slices of `data`,
+        without copies; arrays over a read-only `data` copy their own slice, to be writable.
+        """
+
+        # 1. ...
+        output = None
+        if data is not None:
+            with self._decoding():
+                output = BinaryReader(data, object_hook=self._decode_hook).read()
+
+        # 2. ...
+        return output
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def dump(
+        self,
+        obj,
+        fp,
+        compact: bool = False,
+        short_tags: bool = False,
+        sidecar: Sidecar = None,
+        binary: bool = False,
+    ) -> bool:
+        """
+        Exports to pyon, writing to a file object as the text is produced.
+
+        Args:
+            obj: The Python object to encode.
+            fp: Writable file object: text (`str` chunks) or binary (UTF-8 `bytes` chunks).
+            compact (bool): Minimal separators and no indentation.
+            short_tags (bool): Writes the short-tag dialect.
+            sidecar (Sidecar): Receives the large buffers, if provided.
+            binary (bool): Writes the binary container format instead of text (binary file
+                objects only; `compact` and `short_tags` do not apply).
+
+        Returns:
+            bool: True if the object was written, False if it could not be encoded.
+        """
+
+        # 1. Checks input...
+        if binary and self._is_text_file(fp):
+            raise ValueError("The binary format needs a binary file object.")
+
+        # 2. ...
+        written = False
+        if obj is not None:
+
+            # 1.1 Encodes the root node: nothing is written if it fails...
+            with self._encoding(sidecar), self._using("binary", binary):
+                encoded = self._expand(obj, short_tags and not binary)
+                if (encoded is not None) and binary:
+                    BinaryWriter(fp, default=self._binary_default).write(encoded)
+                    written = True
+                elif encoded is not None:
+                    json_encoder = self._get_json_encoder(compact, short_tags)
+                    if compact:
+                        chunks = self._iter_compact(encoded, json_encoder)
+                    else:
+                        chunks = json_encoder.iterencode(encoded)
+                    self._write_chunks(chunks, fp)
+                    written = True
+
+                # 2.1 ...
+                else:
+                    logger.error("Object '%s' failed to be encoded.", type(obj).__name__)
+
+        # 3. ...
+        return written
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def load(self, fp, sidecar: Sidecar = None):
+        """
+        Imports from a text or binary file object holding pyon, as text or in the binary
+        container format (detected by its magic bytes). External buffers are read through
+        `sidecar`.
+        """
+
+        # 1. Binary files: into a writable buffer, so that arrays use it in place...
+        if isinstance(fp, io.TextIOBase) or not hasattr(fp, "readinto"):
+            data = fp.read()
+        else:
+            data = read_buffer(fp)
+        output = None
+        with self._using("sidecar", sidecar):
+
+            # 1.1 Binary container...
+            if isinstance(data, (bytes, bytearray)) and data.startswith(BINARY_MAGIC):
+                output = self.decode_bytes(data)
+
+            # 1.2 Binary files otherwise hold UTF-8...
+            elif data:
+                if isinstance(data, (bytes, bytearray)):
+                    data = data.decode("utf-8")
+                output = self.decode_str(data)
 
         # 2. ...
         return output
 
     # ----------------------------------------------------------------------------------------- #
 
+    def _iter_compact(self, encoded, json_encoder: _PyonJSONEncoder):
+        """
+        Yields compact text. Subtrees of up to `_STREAM_NODES` nodes, and batches of sibling
+        ones, are encoded in one shot; larger ones are walked, so memory is bounded by the
+        batch size rather than by the document.
+        """
+
+        # 1. Deferred nodes...
+        if type(encoded) is _Deferred:  # pylint: disable=unidiomatic-typecheck
+            encoded = self._expand(encoded.value, json_encoder.short_tags)
+
+        # 2. Small subtrees...
+        if self._measure(encoded, json_encoder.short_tags, _STREAM_NODES) >= 0:
+            yield json_encoder.encode(encoded)
+
+        # 3. Dictionaries...
+        elif type(encoded) is dict:  # pylint: disable=unidiomatic-typecheck
+            yield "{"
+            yield from self._iter_members(encoded.items(), {}, json_encoder)
+            yield "}"
+
+        # 4. Lists...
+        else:
+            yield "["
+            yield from self._iter_members(enumerate(encoded), [], json_encoder)
+            yield "]"
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _iter_members(self, members, batch: dict | list, json_encoder: _PyonJSONEncoder):
+        """
+        Yields the members of a large dict or list (`(key, value)` pairs, with positions for
+        lists), gathering small ones in `batch` and walking the large ones.
+        """
+
+        # 1. ...
+        short_tags = json_encoder.short_tags
+        budget = _STREAM_NODES
+        sep = ""
+        for key, value in members:
+
+            # 1.1 ...
+            if type(value) is _Deferred:  # pylint: disable=unidiomatic-typecheck
+                value = self._expand(value.value, short_tags)
+            left = self._measure(value, short_tags, budget)
+
+            # 1.2 The batch is full: flushed, then the value measured again on its own...
+            if (left < 0) and batch:
+                yield sep + json_encoder.encode(batch)[1:-1]
+                sep = ","
+                batch.clear()
+                budget = _STREAM_NODES
+                left = self._measure(value, short_tags, budget)
+
+            # 1.3 Small: batched...
+            if left >= 0:
+                if type(batch) is dict:  # pylint: disable=unidiomatic-typecheck
+                    batch[key] = value
+                else:
+                    batch.append(value)
+                budget = left
+
+            # 1.4 Large: walked...
+            else:
+                if type(batch) is dict:  # pylint: disable=unidiomatic-typecheck
+                    yield sep + json_encoder.encode(key) + ":"
+                else:
+                    yield sep
+                sep = ","
+                yield from self._iter_compact(value, json_encoder)
+
+        # 2. ...
+        if batch:
+            yield sep + json_encoder.encode(batch)[1:-1]
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _measure(self, value, short_tags: bool, budget: int) -> int:
+        """
+        Counts the nodes of a subtree against `budget`, and returns what is left (negative
+        once exceeded, when counting stops). Deferred children are expanded in place, in
+        document order, so they are encoded once.
+        """
+
+        # 1. ...
+        budget -= 1
+        if type(value) is dict:  # pylint: disable=unidiomatic-typecheck
+            members = value.items()
+        elif type(value) is list:  # pylint: disable=unidiomatic-typecheck
+            members = enumerate(value)
+        else:
+            members = ()
+
+        # 2. ...
+        for key, child in members:
+            if budget < 0:
+                break
+            if type(child) is _Deferred:  # pylint: disable=unidiomatic-typecheck
+                child = value[key] = self._expand(child.value, short_tags)
+            budget = self._measure(child, short_tags, budget)
+
+        # 3. ...
+        return budget
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _write_chunks(self, chunks, fp):
+        """ Writes text chunks in batches of about `_WRITE_CHUNK_SIZE` characters. """
+
+        # 1. Text files take `str`, anything else UTF-8 `bytes`...
+        is_text = self._is_text_file(fp)
+
+        # 2. ...
+        buffer = []
+        size = 0
+        for chunk in chunks:
+            buffer.append(chunk)
+            size += len(chunk)
+
+            # 1.1 Flushes the batch...
+            if size >= _WRITE_CHUNK_SIZE:
+                text = "".join(buffer)
+                fp.write(text if is_text else text.encode("utf-8"))
+                buffer.clear()
+                size = 0
+
+        # 3. Remainder...
+        if buffer:
+            text = "".join(buffer)
+            fp.write(text if is_text else text.encode("utf-8"))
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _is_text_file(self, fp) -> bool:
+        """ If a file object takes `str` (text mode) rather than bytes. """
+
+        # 1. ...
+        mode = getattr(fp, "mode", None)
+        return isinstance(fp, io.TextIOBase) or (isinstance(mode, str) and ("b" not in mode))
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _binary_default(self, value):
+        """ Binary writer fallback: expands deferred children, like `_PyonJSONEncoder`. """
+
+        # 1. ...
+        if type(value) is not _Deferred:  # pylint: disable=unidiomatic-typecheck
+            raise TypeError(f"Object of type {type(value).__name__} is not serializable")
+
+        # 2. ...
+        return self._expand(value.value, False)
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _expand(self, value, short_tags: bool):
+        """ Encodes one node for the JSON encoder, in the requested tag dialect. """
+
+        # 1. ...
+        encoded = self._encode_node(value)
+        if short_tags and isinstance(encoded, dict):
+            encoded = self._shorten(encoded)
+
+        # 2. ...
+        return encoded
+
+    # ----------------------------------------------------------------------------------------- #
+
     def decode_str(self, pyon_str: str):
-        """ Imports from pyon string. """
+        """
+        Imports from pyon string. Both tag dialects are detected.
+
+        Tagged nodes are rebuilt bottom-up while the text is parsed, so each intermediate
+        dictionary is released as soon as its typed object exists.
+        """
 
         # 1. ...
         output = None
         if pyon_str is not None:
 
+            # 1.1 Parses and decodes: short tags are restored node by node, so both dialects go
+            # through one hook (the long dialect never writes `~T`, `~C` or `~R` object keys)...
+            output = self._parse(self._json_short_decoder, pyon_str)
+
+            # 1.2 ...
+            if output is None:
+                logger.error("Input failed to be decoded.")
+
+        # 2. ...
+        return output
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def decode_at(
+        self,
+        pyon_str: str,
+        idx: int = 0,
+        short_tags: bool = False,
+        scope: RefScope = None,
+        sidecar: Sidecar = None,
+    ):
+        """
+        Decodes the single value that starts at `idx` (leading whitespace is not skipped).
+
+        Args:
+            pyon_str (str): The text.
+            idx (int): Where the value starts.
+            short_tags (bool): If the text uses the short-tag dialect.
+            scope (RefScope): Shares back-references across calls (e.g. between the elements
+                of one document). A new scope is used if not provided.
+            sidecar (Sidecar): Reads the external buffers, if any.
+
+        Returns:
+            tuple: The decoded value and the index where it ends.
+        """
+
+        # 1. ...
+        json_decoder = self._json_short_decoder if short_tags else self._json_decoder
+        with self._decoding(scope), self._using("sidecar", sidecar):
+            output = json_decoder.raw_decode(pyon_str, idx)
+
+        # 2. ...
+        return output
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _parse(self, json_decoder: json.JSONDecoder, pyon_str: str):
+        """ Parses with `decode_dict` as identity: the object hook already decoded children. """
+
+        # 1. ...
+        with self._decoding():
+            output = json_decoder.decode(pyon_str)
+
+        # 2. ...
+        return output
+
+    # ----------------------------------------------------------------------------------------- #
+
+    @contextmanager
+    def _using(self, name: str, value):
+        """ Sets a per-thread state value, restoring the previous one on exit. """
+
+        # 1. ...
+        previous = getattr(self._state, name, None)
+        setattr(self._state, name, value)
+
+        # 2. ...
+        try:
+            yield
+        finally:
+            setattr(self._state, name, previous)
+
+    # ----------------------------------------------------------------------------------------- #
+
+    @contextmanager
+    def _encoding(self, sidecar: Sidecar = None):
+        """ Streaming encode: a new reference scope; deep or cyclic graphs fail clearly. """
+
+        # 1. ...
+        scope = RefScope() if self.refs else None
+        with (
+            self._using("streaming", True),
+            self._using("enc_scope", scope),
+            self._using("sidecar", sidecar),
+        ):
+
             # 1.1 ...
-            dictionary = json.loads(pyon_str)
-            if dictionary is not None:
+            try:
+                yield
+            except RecursionError as err:
+                raise ValueError(
+                    "Object graph too deep or cyclic (use refs=True for cyclic references)."
+                ) from err
 
-                # 2.1 ...
-                output = self.decode_dict(dictionary)
+    # ----------------------------------------------------------------------------------------- #
 
-            # 1.2 ...
+    @contextmanager
+    def _decoding(self, scope: RefScope = None):
+        """ Single-pass decode: children arrive decoded; back-references resolve in `scope`. """
+
+        # 1. ...
+        with self._using("parsing", True), self._using("dec_scope", scope or RefScope()):
+            yield
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _decode_hook(self, value: dict):
+        """ JSON object hook: decodes tagged nodes, keeps plain dictionaries. """
+
+        # 1. Tagged nodes, type references, back-references...
+        output = value
+        if (EConst.TYPE in value) or (
+            (len(value) == 1) and ((EConst.CLASS in value) or (EConst.REF in value))
+        ):
+            output = self._decode_node(value)
+
+        # 2. Plain dictionaries may hold placeholders of cycles...
+        elif self._state.dec_scope.pending:
+            self._state.dec_scope.taint(value, value)
+
+        # 3. ...
+        return output
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _decode_short_hook(self, value: dict):
+        """ JSON object hook for the short-tag dialect. """
+
+        # 1. ...
+        return self._decode_hook(self._lengthen(value))
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _get_json_encoder(self, compact: bool, short_tags: bool) -> json.JSONEncoder:
+        """ Returns the (reused) JSON encoder for the output layout and tag dialect. """
+
+        # 1. ...
+        key = (compact, short_tags)
+        json_encoder = self._json_encoders.get(key)
+        if json_encoder is None:
+
+            # 1.1 Compact: no indentation, minimal separators...
+            if compact:
+                json_encoder = _PyonJSONEncoder(
+                    self, short_tags, ensure_ascii=False, separators=(",", ":")
+                )
+
+            # 1.2 Readable...
             else:
-                logger.error("Input failed to be decoded.")
+                json_encoder = _PyonJSONEncoder(self, short_tags, ensure_ascii=False, indent=3)
+
+            # 1.3 ...
+            self._json_encoders[key] = json_encoder
+
+        # 2. ...
+        return json_encoder
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _shorten(self, value: dict):
+        """ Renames the structural keys of one tagged node to the short-tag dialect. """
+
+        # 1. Plain dictionaries: keys are data...
+        output = value
+        if (EConst.TYPE in value) or (
+            (len(value) == 1) and ((EConst.CLASS in value) or (EConst.REF in value))
+        ):
+            output = {ut.SHORT_TAGS.get(key, key): val for key, val in value.items()}
+
+        # 2. ...
+        return output
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _lengthen(self, value: dict):
+        """ JSON object hook: restores the structural keys of short-tag nodes. """
+
+        # 1. ...
+        output = value
+        if ("~T" in value) or ((len(value) == 1) and (("~C" in value) or ("~R" in value))):
+            output = {ut.LONG_TAGS.get(key, key): val for key, val in value.items()}
 
         # 2. ...
         return output
@@ -161,3 +1122,19 @@ class PyonEncoder():
 
 
 # --------------------------------------------------------------------------------------------- #
+
+
+def _is_json_like(key: str) -> bool:
+    """
+    If a `str` key may be a JSON text, as all keys written by 0.2.6 and earlier are: checks
+    its first character only (the whole key for words like `true`).
+    """
+
+    # 1. ...
+    head = key[:1]
+    return (head in _JSON_HEADS) or (
+        (head in _JSON_WORD_HEADS) and (key.rstrip(" \t\n\r") in _JSON_WORDS)
+    )
+
+
+# --------------------------------------------------------------------------------------------- #
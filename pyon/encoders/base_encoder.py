@@ -35,13 +35,23 @@ class BaseEncoder(ABC):
 
     # ----------------------------------------------------------------------------------------- #
 
-    def _encode_as_str(self, value) -> str:
-        return self.__encoder.encode_str(value)
+    def _encode_key(self, value) -> str:
+        return self.__encoder.encode_key(value)
 
     # ----------------------------------------------------------------------------------------- #
 
-    def _decode_from_str(self, value: str):
-        return self.__encoder.decode_str(value)
+    def _decode_key(self, value: str, legacy: bool = True):
+        return self.__encoder.decode_key(value, legacy)
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _encode_buffer(self, value):
+        return self.__encoder.encode_buffer(value)
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _decode_buffer(self, value):
+        return self.__encoder.decode_buffer(value)
 
     # ----------------------------------------------------------------------------------------- #
 
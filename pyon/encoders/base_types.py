@@ -29,15 +29,9 @@ class BaseEnc():
 
         # 1. ...
         encoded = None
-        if self.is_encode(value):
-
-            # 1.1 Type...
-            if isinstance(value, type):
-                encoded = self._encode_type(value)
-
-            # 1.2 Base...
-            else:
-                encoded = value
+        handler = self.get_encoder(value)
+        if handler is not None:
+            encoded = handler(value)
 
         # 2. ...
         return encoded
@@ -64,6 +58,41 @@ class BaseEnc():
 
     # ----------------------------------------------------------------------------------------- #
 
+    def get_encoder(self, value):
+        """ Returns the handler that encodes `value`, or None if not a Base Type. """
+
+        # 1. ...
+        handler = None
+        if self.is_encode(value):
+
+            # 1.1 Type...
+            if isinstance(value, type):
+                handler = self._encode_type
+
+            # 1.2 Base...
+            else:
+                handler = self._encode_base
+
+        # 2. ...
+        return handler
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def get_type_encoders(self) -> dict:
+        """ Returns the encode handlers keyed by exact type. """
+
+        # 1. ...
+        return {
+            bool: self._encode_base,
+            float: self._encode_base,
+            int: self._encode_base,
+            str: self._encode_base,
+            type: self._encode_type,
+            type(None): self._encode_base,
+        }
+
+    # ----------------------------------------------------------------------------------------- #
+
     def is_encode(self, value):
         """ 
             Checks if Base Types:
@@ -104,6 +133,14 @@ class BaseEnc():
 
     # ----------------------------------------------------------------------------------------- #
 
+    def _encode_base(self, value):
+        """ Base types are JSON native: encoded as they are. """
+
+        # 1. ...
+        return value
+
+    # ----------------------------------------------------------------------------------------- #
+
     def _encode_type(self, value: type):
         """ Encodes a type object. """
 
@@ -2,7 +2,6 @@
 """ Pyon: Collections Encoder """
 # --------------------------------------------------------------------------------------------- #
 
-import base64
 import logging
 
 # --------------------------------------------------------------------------------------------- #
@@ -39,113 +38,125 @@ class ColEnc(BaseEncoder):
 
         # 1. ...
         encoded = None
-        if self.is_encode(value):
+        handler = self.get_encoder(value)
+        if handler is not None:
+            encoded = handler(value)
 
-            # 1.1 Bytearray...
-            if isinstance(value, bytearray):
-                encoded = self._encode_bytearray(value)
+        # 2. ...
+        return encoded
 
-            # 1.2 Bytes...
-            elif isinstance(value, bytes):
-                encoded = self._encode_bytes(value)
+    # ----------------------------------------------------------------------------------------- #
 
-            # 1.3 ChainMap...
-            elif isinstance(value, ChainMap):
-                encoded = self._encode_chainmap(value)
+    def decode(self, value):
+        """ Decodes the value """
 
-            # 1.4 Counter...
-            elif isinstance(value, Counter):
-                encoded = self._encode_counter(value)
+        # 1. ...
+        decoded = None
 
-            # 1.5 Default Dict...
-            elif isinstance(value, defaultdict):
-                encoded = self._encode_defaultdict(value)
+        # 2. ...
+        if ut.is_decode_able(value):
+            handler = self.get_type_decoders().get(value.get(EConst.TYPE))
 
-            # 1.6 Deque...
-            elif isinstance(value, deque):
-                encoded = self._encode_deque(value)
+            # 1.1 Decodes...
+            if handler is not None:
+                decoded = handler(value)
 
-            # 1.7 Frozenset...
-            elif isinstance(value, frozenset):
-                encoded = self._encode_frozenset(value)
+        # 3. ...
+        return decoded
 
-            # 1.8 List...
-            elif isinstance(value, list):
-                encoded = self._encode_list(value)
+    # ----------------------------------------------------------------------------------------- #
 
-            # 1.9 NamedTuple...
-            elif self._is_named_tuple(value):
-                encoded = self._encode_namedtuple(value)
+    def get_encoder(self, value):
+        """ Returns the handler that encodes `value`, or None if not a Collection Type. """
 
-            # 1.10 Sets...
-            elif isinstance(value, set):
-                encoded = self._encode_set(value)
+        # 1. ...
+        handler = None
 
-            # 1.11 Tuplas...
-            elif isinstance(value, tuple):
-                encoded = self._encode_tuple(value)
+        # 2. Bytearray...
+        if isinstance(value, bytearray):
+            handler = self._encode_bytearray
 
-        # 2. ...
-        return encoded
+        # 3. Bytes...
+        elif isinstance(value, bytes):
+            handler = self._encode_bytes
 
-    # ----------------------------------------------------------------------------------------- #
+        # 4. ChainMap...
+        elif isinstance(value, ChainMap):
+            handler = self._encode_chainmap
 
-    def decode(self, value):
-        """ Decodes the value """
+        # 5. Counter...
+        elif isinstance(value, Counter):
+            handler = self._encode_counter
 
-        # 1. ...
-        decoded = None
+        # 6. Default Dict...
+        elif isinstance(value, defaultdict):
+            handler = self._encode_defaultdict
 
-        # 2. ...
-        if ut.is_decode_able(value):
-            _type = value.get(EConst.TYPE)
+        # 7. Deque...
+        elif isinstance(value, deque):
+            handler = self._encode_deque
 
-            # 1.1 Bytearray...
-            if _type == SupportedTypes.BYTEARRAY.value:
-                decoded = self._decode_bytearray(value)
+        # 8. Frozenset...
+        elif isinstance(value, frozenset):
+            handler = self._encode_frozenset
 
-            # 1.2 Bytes...
-            elif _type == SupportedTypes.BYTES.value:
-                decoded = self._decode_bytes(value)
+        # 9. List...
+        elif isinstance(value, list):
+            handler = self._encode_list
 
-            # 1.3 ChainMap...
-            elif _type == SupportedTypes.CHAINMAP.value:
-                decoded = self._decode_chainmap(value)
+        # 10. NamedTuple...
+        elif self._is_named_tuple(value):
+            handler = self._encode_namedtuple
 
-            # 1.4 Counter...
-            elif _type == SupportedTypes.COUNTER.value:
-                decoded = self._decode_counter(value)
+        # 11. Sets...
+        elif isinstance(value, set):
+            handler = self._encode_set
 
-            # 1.5 Default Dict...
-            elif _type == SupportedTypes.DEFAULTDICT.value:
-                decoded = self._decode_defaultdict(value)
+        # 12. Tuplas...
+        elif isinstance(value, tuple):
+            handler = self._encode_tuple
 
-            # 1.6 Deque...
-            elif _type == SupportedTypes.DEQUE.value:
-                decoded = self._decode_deque(value)
+        # 13. ...
+        return handler
 
-            # 1.7 Frozenset...
-            elif _type == SupportedTypes.FROZENSET.value:
-                decoded = self._decode_frozenset(value)
+    # ----------------------------------------------------------------------------------------- #
 
-            # 1.8 List...
-            elif _type == SupportedTypes.LIST.value:
-                decoded = self._decode_list(value)
+    def get_type_encoders(self) -> dict:
+        """ Returns the encode handlers keyed by exact type. """
 
-            # 1.9 NamedTuple...
-            elif _type == SupportedTypes.NAMEDTUPLE.value:
-                decoded = self._decode_namedtuple(value)
+        # 1. ...
+        return {
+            bytearray: self._encode_bytearray,
+            bytes: self._encode_bytes,
+            ChainMap: self._encode_chainmap,
+            Counter: self._encode_counter,
+            defaultdict: self._encode_defaultdict,
+            deque: self._encode_deque,
+            frozenset: self._encode_frozenset,
+            list: self._encode_list,
+            set: self._encode_set,
+            tuple: self._encode_tuple,
+        }
 
-            # 1.10 Sets...
-            elif _type == SupportedTypes.SET.value:
-                decoded = self._decode_set(value)
+    # ----------------------------------------------------------------------------------------- #
 
-            # 1.11  Tuples...
-            elif _type == SupportedTypes.TUPLE.value:
-                decoded = self._decode_tuple(value)
+    def get_type_decoders(self) -> dict:
+        """ Returns the decode handlers keyed by `__type__` value. """
 
-        # 3. ...
-        return decoded
+        # 1. ...
+        return {
+            SupportedTypes.BYTEARRAY.value: self._decode_bytearray,
+            SupportedTypes.BYTES.value: self._decode_bytes,
+            SupportedTypes.CHAINMAP.value: self._decode_chainmap,
+            SupportedTypes.COUNTER.value: self._decode_counter,
+            SupportedTypes.DEFAULTDICT.value: self._decode_defaultdict,
+            SupportedTypes.DEQUE.value: self._decode_deque,
+            SupportedTypes.FROZENSET.value: self._decode_frozenset,
+            SupportedTypes.LIST.value: self._decode_list,
+            SupportedTypes.NAMEDTUPLE.value: self._decode_namedtuple,
+            SupportedTypes.SET.value: self._decode_set,
+            SupportedTypes.TUPLE.value: self._decode_tuple,
+        }
 
     # ----------------------------------------------------------------------------------------- #
 
@@ -222,7 +233,7 @@ class ColEnc(BaseEncoder):
             # 1.1 ...
             output = {
                 EConst.TYPE: SupportedTypes.BYTEARRAY.value,
-                EConst.DATA: base64.b64encode(value).decode('utf-8')
+                EConst.DATA: self._encode_buffer(value)
             }
 
         # 2. ...
@@ -242,7 +253,8 @@ class ColEnc(BaseEncoder):
         if (value is not None) and isinstance(value, dict) and (EConst.DATA in value):
 
             # 1.1 ...
-            output = bytearray(base64.b64decode(value[EConst.DATA]))
+            buffer = self._decode_buffer(value[EConst.DATA])
+            output = bytearray(buffer) if buffer is not None else None
 
         # 2. ...
         else:
@@ -269,7 +281,7 @@ class ColEnc(BaseEncoder):
             # 1.1 Encodes...
             output = {
                 EConst.TYPE: SupportedTypes.BYTES.value,
-                EConst.DATA: base64.b64encode(value).decode('utf-8')
+                EConst.DATA: self._encode_buffer(value)
             }
 
         # 2. Logs if invalid...
@@ -289,7 +301,8 @@ class ColEnc(BaseEncoder):
         if (value is not None) and isinstance(value, dict) and (EConst.DATA in value):
 
             # 1.1 Decodes...
-            output = base64.b64decode(value[EConst.DATA])
+            buffer = self._decode_buffer(value[EConst.DATA])
+            output = bytes(buffer) if buffer is not None else None
 
         # 2. If invalid...
         else:
@@ -317,7 +330,7 @@ class ColEnc(BaseEncoder):
             output = {
                 EConst.TYPE: SupportedTypes.CHAINMAP.value,
                 EConst.DATA: [
-                    {k: self._encode_as_dict(v) for k, v in m.items()}
+                    {self._encode_key(k): self._encode_as_dict(v) for k, v in m.items()}
                     for m in value.maps
                 ]
             }
@@ -340,7 +353,7 @@ class ColEnc(BaseEncoder):
 
             # 1.1 Reconstructs...
             maps = [
-                {k: self._decode_from_dict(v) for k, v in m.items()}
+                {self._decode_key(k, legacy=False): self._decode_from_dict(v) for k, v in m.items()}
                 for m in value[EConst.DATA]
             ]
 
@@ -372,7 +385,9 @@ class ColEnc(BaseEncoder):
             # 1.1 Encodes...
             output = {
                 EConst.TYPE: SupportedTypes.COUNTER.value,
-                EConst.DATA: {k: self._encode_as_dict(v) for k, v in value.items()}
+                EConst.DATA: {
+                    self._encode_key(k): self._encode_as_dict(v) for k, v in value.items()
+                }
             }
 
         # 2. Logs if invalid...
@@ -392,7 +407,10 @@ class ColEnc(BaseEncoder):
         if (value is not None) and isinstance(value, dict) and (EConst.DATA in value):
 
             # 1.1 Decodes...
-            decoded_data = {k: self._decode_from_dict(v) for k, v in value[EConst.DATA].items()}
+            decoded_data = {
+                self._decode_key(k, legacy=False): self._decode_from_dict(v)
+                for k, v in value[EConst.DATA].items()
+            }
             output = Counter(decoded_data)
 
         # 2. If invalid...
@@ -421,7 +439,9 @@ class ColEnc(BaseEncoder):
             output = {
                 EConst.TYPE: SupportedTypes.DEFAULTDICT.value,
                 EConst.AUX1: ut.get_class_name(value.default_factory),
-                EConst.DATA: {k: self._encode_as_dict(v) for k, v in value.items()}
+                EConst.DATA: {
+                    self._encode_key(k): self._encode_as_dict(v) for k, v in value.items()
+                }
             }
 
         # 2. Logs if invalid...
@@ -448,7 +468,10 @@ class ColEnc(BaseEncoder):
                 default_factory = ut.get_class({EConst.CLASS: value[EConst.AUX1]})
 
             # 1.3 Decodes...
-            decoded_data = {k: self._decode_from_dict(v) for k, v in value[EConst.DATA].items()}
+            decoded_data = {
+                self._decode_key(k, legacy=False): self._decode_from_dict(v)
+                for k, v in value[EConst.DATA].items()
+            }
             output = defaultdict(default_factory, decoded_data)
 
         # 2. If invalid...
@@ -34,19 +34,9 @@ class DateEnc():
 
         # 1. ...
         encoded = None
-        if self.is_encode(value):
-
-            # 1.1 Datetime...
-            if isinstance(value, datetime):
-                encoded = self._encode_datetime(value)
-
-            # 1.2 Date...
-            elif isinstance(value, date):
-                encoded = self._encode_date(value)
-
-            # 1.3 Time...
-            elif isinstance(value, time):
-                encoded = self._encode_time(value)
+        handler = self.get_encoder(value)
+        if handler is not None:
+            encoded = handler(value)
 
         # 2. ...
         return encoded
@@ -61,25 +51,64 @@ class DateEnc():
 
         # 2. ...
         if ut.is_decode_able(value):
-            _type = value.get(EConst.TYPE)
+            handler = self.get_type_decoders().get(value.get(EConst.TYPE))
 
-            # 1.1 Date...
-            if _type == SupportedTypes.DATE.value:
-                decoded = self._decode_date(value)
-
-            # 1.2 Datetime...
-            elif _type == SupportedTypes.DATETIME.value:
-                decoded = self._decode_datetime(value)
-
-            # 1.3 Time...
-            elif _type == SupportedTypes.TIME.value:
-                decoded = self._decode_time(value)
+            # 1.1 Decodes...
+            if handler is not None:
+                decoded = handler(value)
 
         # 3. ...
         return decoded
 
     # ----------------------------------------------------------------------------------------- #
 
+    def get_encoder(self, value):
+        """ Returns the handler that encodes `value`, or None if not a Datetime Type. """
+
+        # 1. ...
+        handler = None
+
+        # 2. Datetime...
+        if isinstance(value, datetime):
+            handler = self._encode_datetime
+
+        # 3. Date...
+        elif isinstance(value, date):
+            handler = self._encode_date
+
+        # 4. Time...
+        elif isinstance(value, time):
+            handler = self._encode_time
+
+        # 5. ...
+        return handler
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def get_type_encoders(self) -> dict:
+        """ Returns the encode handlers keyed by exact type. """
+
+        # 1. ...
+        return {
+            datetime: self._encode_datetime,
+            date: self._encode_date,
+            time: self._encode_time,
+        }
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def get_type_decoders(self) -> dict:
+        """ Returns the decode handlers keyed by `__type__` value. """
+
+        # 1. ...
+        return {
+            SupportedTypes.DATE.value: self._decode_date,
+            SupportedTypes.DATETIME.value: self._decode_datetime,
+            SupportedTypes.TIME.value: self._decode_time,
+        }
+
+    # ----------------------------------------------------------------------------------------- #
+
     def is_encode(self, value):
         """ 
             Checks if Datetime Types:
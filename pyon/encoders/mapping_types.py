@@ -41,6 +41,9 @@ class MapEnc(BaseEncoder):
         self.enc_protected = enc_protected
         self.enc_private = enc_private
 
+        # 2. Per-class plans: (type, class name, mangled prefix)...
+        self._plans = {}
+
     # ----------------------------------------------------------------------------------------- #
 
     def encode(self, value):
@@ -48,15 +51,9 @@ class MapEnc(BaseEncoder):
 
         # 1. ...
         encoded = None
-        if self.is_encode(value):
-
-            # 1.1 Enum...
-            if isinstance(value, Enum):
-                encoded = self._encode_enum(value)
-
-            # 1.2 Dict, Class, Dataclass...
-            else:
-                encoded = self._encode_dict(value)
+        handler = self.get_encoder(value)
+        if handler is not None:
+            encoded = handler(value)
 
         # 2. ...
         return encoded
@@ -71,10 +68,9 @@ class MapEnc(BaseEncoder):
 
         # 2. ...
         if ut.is_decode_able(value):
-            _type = value.get(EConst.TYPE)
 
-            # 1.1 Date...
-            if _type == SupportedTypes.ENUM.value:
+            # 1.1 Enum...
+            if value.get(EConst.TYPE) == SupportedTypes.ENUM.value:
                 decoded = self._decode_enum(value)
 
             # 1.2 Dict, Class, Dataclass...
@@ -86,6 +82,49 @@ class MapEnc(BaseEncoder):
 
     # ----------------------------------------------------------------------------------------- #
 
+    def get_encoder(self, value):
+        """ Returns the handler that encodes `value`, or None if not a Mapping Type. """
+
+        # 1. ...
+        handler = None
+        if self.is_encode(value):
+
+            # 1.1 Enum...
+            if isinstance(value, Enum):
+                handler = self._encode_enum
+
+            # 1.2 Dict, Class, Dataclass...
+            else:
+                handler = self._encode_dict
+
+        # 2. ...
+        return handler
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def get_type_encoders(self) -> dict:
+        """ Returns the encode handlers keyed by exact type. """
+
+        # 1. ...
+        return {
+            dict: self._encode_dict,
+        }
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def get_type_decoders(self) -> dict:
+        """ Returns the decode handlers keyed by `__type__` value. """
+
+        # 1. ...
+        return {
+            SupportedTypes.CLASS.value: self._decode_dict,
+            SupportedTypes.DATACLASS.value: self._decode_dict,
+            SupportedTypes.DICT.value: self._decode_dict,
+            SupportedTypes.ENUM.value: self._decode_enum,
+        }
+
+    # ----------------------------------------------------------------------------------------- #
+
     def is_encode(self, value):
         """ 
             Checks if Mapping Types:
@@ -195,42 +234,34 @@ class MapEnc(BaseEncoder):
         if self._is_dict(value):
 
             # 1.1 ...
+            default_type, class_name, mangled_name = self._get_plan(value)
             serialized_dict = {}
             for key, val in vars(value).items() if hasattr(value, EConst.DICT) else value.items():
 
-                # 2.1 Validates...
-                if not (isinstance(key, str) and key.startswith("___")):
-                    mangled_name = ut.get_mangled_name(value)
+                # 2.1 Private and Protected: all start with underscore...
+                process = True
+                if isinstance(key, str) and key.startswith("_"):
 
-                    # 3.1 Private and Protected...
-                    process = True
-                    if isinstance(key, str):
+                    # 3.1 Skips...
+                    if key.startswith("___"):
+                        continue
 
-                        # 4.1 Private key (starts with double underscore)...
-                        if key.startswith("__") or key.startswith(mangled_name):
-                            if not self.enc_private:
-                                process = False
+                    # 3.2 Private key (starts with double underscore or mangled name)...
+                    if key.startswith("__") or key.startswith(mangled_name):
+                        process = self.enc_private
 
-                        # 4.2 Protected key (starts with double underscore)...
-                        elif key.startswith("_") and not self.enc_protected:
-                            process = False
+                    # 3.3 Protected key (starts with underscore)...
+                    else:
+                        process = self.enc_protected
 
-                        # 4.3 Private or Procted...
-                        if not process:
-                            enc_key = self._encode_as_str(key)
-                            serialized_dict[enc_key] = None
-
-                    # 3.2 Valid keys...
-                    if process:
-
-                        # 4.1 Encodes Key...
-                        enc_key = self._encode_as_str(key)
-                        serialized_dict[enc_key] = self._encode_as_dict(val)
+                # 2.2 Encodes Key and Value (None if private or protected)...
+                enc_key = self._encode_key(key)
+                serialized_dict[enc_key] = self._encode_as_dict(val) if process else None
 
             # 1.2 ...
             encoded = {
-                EConst.TYPE: self._get_defulat_type(value),
-                EConst.CLASS: ut.get_class_name(value),
+                EConst.TYPE: default_type,
+                EConst.CLASS: class_name,
                 EConst.DICT: serialized_dict,
             }
 
@@ -239,6 +270,27 @@ class MapEnc(BaseEncoder):
 
     # ----------------------------------------------------------------------------------------- #
 
+    def _get_plan(self, value):
+        """ Returns the cached (type, class name, mangled prefix) of the value's class. """
+
+        # 1. ...
+        cls = type(value)
+        plan = self._plans.get(cls)
+
+        # 2. First instance of the class...
+        if plan is None:
+            plan = (
+                self._get_defulat_type(value),
+                ut.get_class_name(value),
+                ut.get_mangled_name(value),
+            )
+            self._plans[cls] = plan
+
+        # 3. ...
+        return plan
+
+    # ----------------------------------------------------------------------------------------- #
+
     def _decode_dict(self, value):
         """ Decodes the value """
 
@@ -254,7 +306,7 @@ class MapEnc(BaseEncoder):
                 for key, val in dict_items:
 
                     # 3.1 ...
-                    dec_key = self._decode_from_str(key)
+                    dec_key = self._decode_key(key)
                     decoded[dec_key] = self._decode_from_dict(val)
 
             # 1.2 If decoded and class was provided...
@@ -34,15 +34,9 @@ class NumEnc():
 
         # 1. ...
         encoded = None
-        if self.is_encode(value):
-
-            # 1.1 Complex...
-            if isinstance(value, complex):
-                encoded = self._encode_complex(value)
-
-            # 1.2 Decimal...
-            elif isinstance(value, Decimal):
-                encoded = self._encode_decimal(value)
+        handler = self.get_encoder(value)
+        if handler is not None:
+            encoded = handler(value)
 
         # 2. ...
         return encoded
@@ -57,21 +51,58 @@ class NumEnc():
 
         # 2. ...
         if ut.is_decode_able(value):
-            _type = value.get(EConst.TYPE)
+            handler = self.get_type_decoders().get(value.get(EConst.TYPE))
 
-            # 1.1 Complex...
-            if _type == SupportedTypes.COMPLEX.value:
-                decoded = self._decode_complex(value)
-
-            # 1.2 Decimal...
-            elif _type == SupportedTypes.DECIMAL.value:
-                decoded = self._decode_decimal(value)
+            # 1.1 Decodes...
+            if handler is not None:
+                decoded = handler(value)
 
         # 3. ...
         return decoded
 
     # ----------------------------------------------------------------------------------------- #
 
+    def get_encoder(self, value):
+        """ Returns the handler that encodes `value`, or None if not a Numeric Type. """
+
+        # 1. ...
+        handler = None
+
+        # 2. Complex...
+        if isinstance(value, complex):
+            handler = self._encode_complex
+
+        # 3. Decimal...
+        elif isinstance(value, Decimal):
+            handler = self._encode_decimal
+
+        # 4. ...
+        return handler
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def get_type_encoders(self) -> dict:
+        """ Returns the encode handlers keyed by exact type. """
+
+        # 1. ...
+        return {
+            complex: self._encode_complex,
+            Decimal: self._encode_decimal,
+        }
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def get_type_decoders(self) -> dict:
+        """ Returns the decode handlers keyed by `__type__` value. """
+
+        # 1. ...
+        return {
+            SupportedTypes.COMPLEX.value: self._decode_complex,
+            SupportedTypes.DECIMAL.value: self._decode_decimal,
+        }
+
+    # ----------------------------------------------------------------------------------------- #
+
     def is_encode(self, value):
         """ 
             Checks if Numeric Types:
@@ -16,6 +16,8 @@ import pandas
 # --------------------------------------------------------------------------------------------- #
 
 from bitarray import bitarray
+from pandas.api.extensions import ExtensionArray
+from pandas.api.types import pandas_dtype
 from pandas.tseries.frequencies import to_offset
 
 # --------------------------------------------------------------------------------------------- #
@@ -38,6 +40,37 @@ logger = logging.getLogger(__name__)
 
 # --------------------------------------------------------------------------------------------- #
 
+# Cell types written as they are in an untagged column list...
+_JSON_SCALARS = frozenset((str, int, float, bool, type(None)))
+
+# Pandas extension arrays: layouts (`__aux1__` of `extarray` nodes)...
+_EXT_CATEGORICAL = "categorical"
+_EXT_MASKED = "masked"
+_EXT_DATETIMETZ = "datetimetz"
+_EXT_PERIOD = "period"
+_EXT_INTERVAL = "interval"
+_EXT_SPARSE = "sparse"
+_EXT_STRING = "string"
+_EXT_NUMPY = "numpy"
+_EXT_CELLS = "cells"
+
+# Pandas indexes: layouts (`__aux1__` of `index` nodes)...
+_IDX_RANGE = "range"
+_IDX_DATETIME = "datetime"
+_IDX_PERIOD = "period"
+_IDX_MULTI = "multi"
+_IDX_VALUES = "values"
+
+# Nullable arrays: values plus a mask...
+_MASKED_ARRAYS = (
+    pandas.arrays.BooleanArray, pandas.arrays.IntegerArray, pandas.arrays.FloatingArray
+)
+
+# Extension arrays over one plain ndarray (`PandasArray` before pandas 2.1)...
+_NUMPY_ARRAY = getattr(pandas.arrays, "NumpyExtensionArray", None) or pandas.arrays.PandasArray
+
+# --------------------------------------------------------------------------------------------- #
+
 
 class SpecEnc(BaseEncoder):
     """ Specialized Encoder """
@@ -64,31 +97,9 @@ class SpecEnc(BaseEncoder):
 
         # 1. ...
         encoded = None
-        if self.is_encode(value):
-
-            # 1.1 Bitarray...
-            if isinstance(value, bitarray):
-                encoded = self._encode_bitarray(value)
-
-            # 1.2 File...
-            elif isinstance(value, File):
-                encoded = self._encode_file(value)
-
-            # 1.3 Numpy...
-            elif isinstance(value, numpy.ndarray):
-                encoded = self._encode_ndarray(value)
-
-            # 1.4 UUID...
-            elif isinstance(value, UUID):
-                encoded = self._encode_uuid(value)
-
-            # 1.5 DataFrames...
-            elif isinstance(value, pandas.DataFrame):
-                encoded = self._encode_dataframe(value)
-
-            # 1.6 Series...
-            elif isinstance(value, pandas.Series):
-                encoded = self._encode_series(value)
+        handler = self.get_encoder(value)
+        if handler is not None:
+            encoded = handler(value)
 
         # 2. ...
         return encoded
@@ -103,34 +114,93 @@ class SpecEnc(BaseEncoder):
 
         # 2. ...
         if ut.is_decode_able(value):
-            _type = value.get(EConst.TYPE)
+            handler = self.get_type_decoders().get(value.get(EConst.TYPE))
 
-            # 1.1 Bitarray...
-            if _type == SupportedTypes.BITARRAY.value:
-                decoded = self._decode_bitarray(value)
+            # 1.1 Decodes...
+            if handler is not None:
+                decoded = handler(value)
 
-            # 1.2 File...
-            elif _type == SupportedTypes.FILE.value:
-                decoded = self._decode_file(value)
+        # 3. ...
+        return decoded
 
-            # 1.3 Numpy...
-            elif _type == SupportedTypes.NDARRAY.value:
-                decoded = self._decode_ndarray(value)
+    # ----------------------------------------------------------------------------------------- #
 
-            # 1.4 UUID...
-            elif _type == SupportedTypes.UUID.value:
-                decoded = self._decode_uuid(value)
+    def get_encoder(self, value):
+        """ Returns the handler that encodes `value`, or None if not a Specialized Type. """
 
-            # 1.5 Dataframe...
-            elif _type == SupportedTypes.DATAFRAME.value:
-                decoded = self._decode_dataframe(value)
+        # 1. ...
+        handler = None
 
-            # 1.6 Series...
-            elif _type == SupportedTypes.SERIES.value:
-                decoded = self._decode_series(value)
+        # 2. Bitarray...
+        if isinstance(value, bitarray):
+            handler = self._encode_bitarray
 
-        # 3. ...
-        return decoded
+        # 3. File...
+        elif isinstance(value, File):
+            handler = self._encode_file
+
+        # 4. Numpy...
+        elif isinstance(value, numpy.ndarray):
+            handler = self._encode_ndarray
+
+        # 5. UUID...
+        elif isinstance(value, UUID):
+            handler = self._encode_uuid
+
+        # 6. DataFrames...
+        elif isinstance(value, pandas.DataFrame):
+            handler = self._encode_dataframe
+
+        # 7. Series...
+        elif isinstance(value, pandas.Series):
+            handler = self._encode_series
+
+        # 8. Pandas extension arrays (Categorical, IntegerArray, ...)...
+        elif isinstance(value, ExtensionArray):
+            handler = self._encode_extarray
+
+        # 9. Pandas indexes...
+        elif isinstance(value, pandas.Index):
+            handler = self._encode_index
+
+        # 10. ...
+        return handler
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def get_type_encoders(self) -> dict:
+        """ Returns the encode handlers keyed by exact type. """
+
+        # 1. ...
+        return {
+            bitarray: self._encode_bitarray,
+            File: self._encode_file,
+            numpy.ndarray: self._encode_ndarray,
+            UUID: self._encode_uuid,
+            pandas.DataFrame: self._encode_dataframe,
+            pandas.Series: self._encode_series,
+            pandas.Categorical: self._encode_extarray,
+            pandas.Index: self._encode_index,
+            pandas.RangeIndex: self._encode_index,
+            pandas.DatetimeIndex: self._encode_index,
+        }
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def get_type_decoders(self) -> dict:
+        """ Returns the decode handlers keyed by `__type__` value. """
+
+        # 1. ...
+        return {
+            SupportedTypes.BITARRAY.value: self._decode_bitarray,
+            SupportedTypes.FILE.value: self._decode_file,
+            SupportedTypes.NDARRAY.value: self._decode_ndarray,
+            SupportedTypes.UUID.value: self._decode_uuid,
+            SupportedTypes.DATAFRAME.value: self._decode_dataframe,
+            SupportedTypes.SERIES.value: self._decode_series,
+            SupportedTypes.EXTARRAY.value: self._decode_extarray,
+            SupportedTypes.INDEX.value: self._decode_index,
+        }
 
     # ----------------------------------------------------------------------------------------- #
 
@@ -138,7 +208,7 @@ class SpecEnc(BaseEncoder):
         """ 
             Checks if encode of Specialized Types:
             - `bitarray.bitarray`, `numpy.ndarray`, `pyon.File`, `uuid.UUID`
-            - `pandas.DataFrame`, `pandas.Series`
+            - `pandas.DataFrame`, `pandas.Series`, `pandas.Index`, pandas extension arrays
         """
 
         # 1. ...
@@ -150,7 +220,9 @@ class SpecEnc(BaseEncoder):
                 File,
                 UUID,
                 pandas.DataFrame,
-                pandas.Series
+                pandas.Series,
+                pandas.Index,
+                ExtensionArray
             )
         )
 
@@ -160,7 +232,7 @@ class SpecEnc(BaseEncoder):
         """ 
             Checks if decode of Specialized Types:
             - `bitarray.bitarray`, `numpy.ndarray`, `pyon.File`, `uuid.UUID`
-            - `pandas.DataFrame`, `pandas.Series`
+            - `pandas.DataFrame`, `pandas.Series`, `pandas.Index`, pandas extension arrays
         """
 
         # 1. ...
@@ -177,7 +249,9 @@ class SpecEnc(BaseEncoder):
                 SupportedTypes.NDARRAY.value,
                 SupportedTypes.UUID.value,
                 SupportedTypes.DATAFRAME.value,
-                SupportedTypes.SERIES.value
+                SupportedTypes.SERIES.value,
+                SupportedTypes.EXTARRAY.value,
+                SupportedTypes.INDEX.value
             ):
 
                 # 2.1 ...
@@ -195,10 +269,15 @@ class SpecEnc(BaseEncoder):
         encoded = None
         if (value is not None) and isinstance(value, bitarray):
 
-            # 1.1 Encodes...
+            # 1.1 Bit order: a method in older bitarray releases, a property in newer ones...
+            endian = value.endian if isinstance(value.endian, str) else value.endian()
+
+            # 1.2 Encodes: packed bytes, bit order and padding bits of the last byte...
             encoded = {
                 EConst.TYPE: SupportedTypes.BITARRAY.value,
-                EConst.DATA: value.to01()
+                EConst.AUX1: endian,
+                EConst.AUX2: value.padbits,
+                EConst.DATA: self._encode_buffer(value.tobytes()),
             }
 
         # 2. Logs if invalid...
@@ -217,13 +296,24 @@ class SpecEnc(BaseEncoder):
         output = None
         if (value is not None) and isinstance(value, dict) and (EConst.DATA in value):
 
-            # 1.1 ...
-            output = bitarray(value[EConst.DATA])
+            # 1.1 Packed bytes...
+            if EConst.AUX1 in value:
+                buffer = self._decode_buffer(value[EConst.DATA])
+                padbits = value.get(EConst.AUX2, 0)
+                if (buffer is not None) and (padbits in range(8)):
+                    output = bitarray(endian=value[EConst.AUX1])
+                    output.frombytes(buffer)
+                    if padbits:
+                        del output[-padbits:]
+
+            # 1.2 Legacy: a string of 0s and 1s...
+            else:
+                output = bitarray(value[EConst.DATA])
 
         # 2. ...
         else:
 
-            # 1.1 ...
+            # 2.1 ...
             logger.error(
                 "Invalid bitarray input. Expected: dict with %s. Received: %s",
                 EConst.DATA,
@@ -242,10 +332,17 @@ class SpecEnc(BaseEncoder):
         output = None
         if (value is not None) and isinstance(value, File):
 
-            # 1.1 Encodes...
+            # 1.1 Content as a buffer: Base64, raw in binary documents, or a sidecar file...
+            data = value.to_dict(encode=False)
+            if data.get("content"):
+                data["content"] = self._encode_buffer(data["content"])
+            elif "content" in data:
+                data["content"] = None
+
+            # 1.2 Encodes...
             output = {
                 EConst.TYPE: SupportedTypes.FILE.value,
-                EConst.DATA: value.to_dict(encode=True)
+                EConst.DATA: data
             }
 
         # 2. Logs if invalid...
@@ -264,8 +361,14 @@ class SpecEnc(BaseEncoder):
         output = None
         if (value is not None) and isinstance(value, dict) and (EConst.DATA in value):
 
-            # 1.1 Decodes...
-            output = File.from_dict(value[EConst.DATA])
+            # 1.1 Content: a buffer...
+            data = value[EConst.DATA]
+            if isinstance(data, dict) and (data.get("content") is not None):
+                buffer = self._decode_buffer(data["content"])
+                data = {**data, "content": bytes(buffer) if buffer is not None else None}
+
+            # 1.2 Decodes...
+            output = File.from_dict(data)
 
         # 2. If invalid...
         else:
@@ -283,18 +386,35 @@ class SpecEnc(BaseEncoder):
     # ----------------------------------------------------------------------------------------- #
 
     def _encode_ndarray(self, value: numpy.ndarray):
-        """ Encodes the Numpy ndarray """
+        """
+        Encodes the Numpy ndarray: its raw buffer, with dtype (including byte order), shape
+        and memory order. Object arrays, and structured dtypes that do not round-trip through
+        their description, are written as nested lists.
+        """
 
         # 1. Checks input...
         output = None
         if (value is not None) and isinstance(value, numpy.ndarray):
 
-            # 1.1 Encodes...
-            output = {
-                EConst.TYPE: SupportedTypes.NDARRAY.value,
-                EConst.AUX1: value.shape,
-                EConst.DATA: value.tolist(),
-            }
+            # 1.1 Raw buffer...
+            dtype = self.__dtype_spec(value.dtype)
+            if dtype is not None:
+                order, data = self.__ndarray_bytes(value)
+                output = {
+                    EConst.TYPE: SupportedTypes.NDARRAY.value,
+                    EConst.AUX1: value.shape,
+                    EConst.AUX2: dtype,
+                    EConst.AUX3: order,
+                    EConst.DATA: self._encode_buffer(data),
+                }
+
+            # 1.2 Nested lists...
+            else:
+                output = {
+                    EConst.TYPE: SupportedTypes.NDARRAY.value,
+                    EConst.AUX1: value.shape,
+                    EConst.DATA: self._encode_as_dict(value.tolist()),
+                }
 
         # 2. Logs if invalid...
         else:
@@ -312,16 +432,25 @@ class SpecEnc(BaseEncoder):
         output = None
         if (
             isinstance(value, dict)
-            and isinstance(value.get(EConst.DATA), list)
+            and (EConst.DATA in value)
             and isinstance(value.get(EConst.AUX1), (list, tuple))
         ):
 
             # 1.1 ...
             try:
 
-                # 2.1 ...
-                np_array = numpy.array(value[EConst.DATA])
-                output = np_array.reshape(value[EConst.AUX1])
+                # 2.1 Raw buffer: no per-element work...
+                if EConst.AUX2 in value:
+                    buffer = self._decode_buffer(value[EConst.DATA])
+                    if (buffer is not None) and memoryview(buffer).readonly:
+                        buffer = bytearray(buffer)
+                    np_array = numpy.frombuffer(buffer, dtype=self.__to_dtype(value[EConst.AUX2]))
+                    output = np_array.reshape(value[EConst.AUX1], order=value.get(EConst.AUX3, "C"))
+
+                # 2.2 Nested lists...
+                else:
+                    np_array = numpy.array(self._decode_from_dict(value[EConst.DATA]))
+                    output = np_array.reshape(value[EConst.AUX1])
 
             # 1.2 ...
             except Exception:  # pylint: disable=broad-except
@@ -343,6 +472,66 @@ class SpecEnc(BaseEncoder):
 
     # ----------------------------------------------------------------------------------------- #
 
+    def __ndarray_bytes(self, value: numpy.ndarray):
+        """ Returns the memory order and a byte view of the array (a copy if not contiguous). """
+
+        # 1. C contiguous: as it is...
+        if value.flags.c_contiguous:
+            order, data = "C", value.reshape(-1)
+
+        # 2. Fortran contiguous: its transpose is C contiguous, same memory...
+        elif value.flags.f_contiguous:
+            order, data = "F", value.T.reshape(-1)
+
+        # 3. Strided: copied...
+        else:
+            order, data = "C", numpy.ascontiguousarray(value).reshape(-1)
+
+        # 4. ...
+        return order, data.view(numpy.uint8)
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def __dtype_spec(self, dtype: numpy.dtype):
+        """ The dtype as JSON (`str`, or descr lists for structured), None if not raw-able. """
+
+        # 1. ...
+        spec = None
+        if not dtype.hasobject:
+
+            # 1.1 Plain: byte order, kind and size, e.g. `<f4`, `>i8`, `<M8[ns]`...
+            if dtype.fields is None:
+                spec = dtype.str
+
+            # 1.2 Structured: only if the description rebuilds the same dtype...
+            elif self.__to_dtype(dtype.descr) == dtype:
+                spec = dtype.descr
+
+        # 2. ...
+        return spec
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def __to_dtype(self, spec) -> numpy.dtype:
+        """ Rebuilds a dtype from `__dtype_spec`. """
+
+        # 1. ...
+        if isinstance(spec, str):
+            return numpy.dtype(spec)
+
+        # 2. Structured: JSON lists back to field tuples...
+        fields = []
+        for field in spec:
+            name, fmt, *shape = field
+            name = tuple(name) if isinstance(name, list) else name
+            fmt = fmt if isinstance(fmt, str) else self.__to_dtype(fmt)
+            fields.append((name, fmt, tuple(shape[0])) if shape else (name, fmt))
+
+        # 3. ...
+        return numpy.dtype(fields)
+
+    # ----------------------------------------------------------------------------------------- #
+
     def _encode_uuid(self, value: UUID):
         """ Encodes a UUID object to a string representation. """
 
@@ -391,7 +580,7 @@ class SpecEnc(BaseEncoder):
     # ----------------------------------------------------------------------------------------- #
 
     def _encode_dataframe(self, value: pandas.DataFrame):
-        """ Encodes the DataFrame. """
+        """ Encodes the DataFrame: one vector per column, in column order. """
 
         # 1. Checks input...
         output = None
@@ -400,14 +589,11 @@ class SpecEnc(BaseEncoder):
             # 1.1 Encodes...
             output = {
                 EConst.TYPE: SupportedTypes.DATAFRAME.value,
-                EConst.DATA: self._encode_as_dict(value.to_dict(orient="records")),
-                EConst.AUX1: self.__pre_encode(value.columns),
-                EConst.AUX2: self.__pre_encode(value.index),
-                EConst.AUX3: list(value.index.names),
-                EConst.AUX4: type(value.index).__name__,
-                EConst.AUX5: list(value.columns.names),
-                EConst.AUX6: type(value.columns).__name__,
-                EConst.AUX7: self.__index_freq(value.index)
+                EConst.DATA: [
+                    self.__encode_column(value.iloc[:, pos]) for pos in range(value.shape[1])
+                ],
+                EConst.AUX1: self._encode_as_dict(value.columns),
+                EConst.AUX2: self._encode_as_dict(value.index),
             }
 
         # 2. Logs if invalid...
@@ -429,14 +615,28 @@ class SpecEnc(BaseEncoder):
             # 1.1 Extracts components...
             data = self._decode_from_dict(value[EConst.DATA])
 
-            # 1.2 Decodes: columns and index...
-            columns = self.__decode_columns(value)
-            index = self.__decode_index(value)
+            # 1.2 Decodes: columns and index (element lists up to 0.2.x)...
+            columns = self._decode_from_dict(value.get(EConst.AUX1))
+            if not isinstance(columns, pandas.Index):
+                columns = self.__decode_columns(value)
+            index = self._decode_from_dict(value.get(EConst.AUX2))
+            if not isinstance(index, pandas.Index):
+                index = self.__decode_index(value)
+
+            # 1.3 Columnar: one vector (array or list) per column...
+            if self.__is_columnar(data, columns):
+                output = pandas.DataFrame(
+                    {pos: self.__decode_column(column) for pos, column in enumerate(data)},
+                    index=index,
+                )
+                if columns is not None:
+                    output.columns = columns
 
-            # 1.3 Output...
-            output = pandas.DataFrame(
-                data=data, columns=columns, index=index
-            )
+            # 1.4 Records (0.2.x)...
+            else:
+                output = pandas.DataFrame(
+                    data=data, columns=columns, index=index
+                )
 
         # 2. If invalid...
         else:
@@ -463,12 +663,10 @@ class SpecEnc(BaseEncoder):
             # 1.1 Encodes...
             output = {
                 EConst.TYPE: SupportedTypes.SERIES.value,
-                EConst.DATA: self._encode_as_dict(value.tolist()),
-                EConst.AUX1: self.__pre_encode(value.index),
-                EConst.AUX2: list(value.index.names),
-                EConst.AUX3: type(value.index).__name__,
+                EConst.DATA: self.__encode_column(value),
+                EConst.AUX1: self._encode_as_dict(value.index),
                 EConst.AUX4: value.name,
-                EConst.AUX5: self.__index_freq(value.index)
+                EConst.AUX6: str(value.dtype)
             }
 
         # 2. Logs if invalid...
@@ -489,15 +687,18 @@ class SpecEnc(BaseEncoder):
 
             # 1.1 Extracts components...
             series_data = self._decode_from_dict(value[EConst.DATA])
-            index_data = value.get(EConst.AUX1)
-            index_names = value.get(EConst.AUX2)
-            index_type = value.get(EConst.AUX3)
+            if EConst.AUX6 in value:
+                series_data = self.__decode_column(series_data)
+            index = self._decode_from_dict(value.get(EConst.AUX1))
             series_name = value.get(EConst.AUX4)
-            series_freq = value.get(EConst.AUX5)
 
-            # 1.2 Pre-decodes and rebuilds index...
-            index_data = self.__pre_decode(index_data, index_type)
-            index = self.__rebuild_index(index_data, index_names, index_type, series_freq)
+            # 1.2 Index: element lists up to 0.2.x...
+            if not isinstance(index, pandas.Index):
+                index_type = value.get(EConst.AUX3)
+                index_data = self.__pre_decode(index, index_type)
+                index = self.__rebuild_index(
+                    index_data, value.get(EConst.AUX2), index_type, value.get(EConst.AUX5)
+                )
 
             # 1.3 Builds Series...
             output = pandas.Series(data=series_data, index=index, name=series_name)
@@ -515,6 +716,414 @@ class SpecEnc(BaseEncoder):
 
     # ----------------------------------------------------------------------------------------- #
 
+    def _encode_index(self, value: pandas.Index):
+        """
+        Encodes a pandas Index, with its names. Its size does not grow with its length when
+        regular: `RangeIndex` as start/stop/step, `DatetimeIndex` with a frequency and
+        consecutive `PeriodIndex` as start/frequency/length. `MultiIndex` is written as its
+        levels and codes. Other indexes are written as one vector (see `__encode_column`),
+        e.g. packed int64 instants for irregular datetimes.
+        """
+
+        # 1. Checks input...
+        output = None
+        if (value is not None) and isinstance(value, pandas.Index):
+
+            # 1.1 Common...
+            output = {
+                EConst.TYPE: SupportedTypes.INDEX.value,
+                EConst.AUX1: _IDX_VALUES,
+                EConst.AUX2: self._encode_as_dict(list(value.names)),
+            }
+
+            # 1.2 Range...
+            if isinstance(value, pandas.RangeIndex):
+                output[EConst.AUX1] = _IDX_RANGE
+                output[EConst.DATA] = [value.start, value.stop, value.step]
+
+            # 1.3 Multi: distinct values per level, and integer codes per row...
+            elif isinstance(value, pandas.MultiIndex):
+                output[EConst.AUX1] = _IDX_MULTI
+                output[EConst.DATA] = [self._encode_as_dict(level) for level in value.levels]
+                output[EConst.AUX3] = [self._encode_as_dict(codes) for codes in value.codes]
+
+            # 1.4 Datetime, with a frequency: first instant...
+            elif (
+                isinstance(value, pandas.DatetimeIndex) and (value.freq is not None) and len(value)
+            ):
+                output[EConst.AUX1] = _IDX_DATETIME
+                output[EConst.DATA] = int(value.asi8[0])
+                output[EConst.AUX3] = value.freqstr
+                output[EConst.AUX4] = len(value)
+                output[EConst.AUX5] = str(value.tz) if value.tz is not None else None
+                output[EConst.AUX6] = value.unit
+
+            # 1.5 Consecutive periods: first ordinal...
+            elif isinstance(value, pandas.PeriodIndex) and self.__is_period_range(value):
+                output[EConst.AUX1] = _IDX_PERIOD
+                output[EConst.DATA] = int(value.asi8[0])
+                output[EConst.AUX3] = value.freqstr
+                output[EConst.AUX4] = len(value)
+
+            # 1.6 Values...
+            else:
+                output[EConst.DATA] = self.__encode_column(value)
+                if isinstance(value, (pandas.DatetimeIndex, pandas.TimedeltaIndex)):
+                    output[EConst.AUX3] = value.freqstr
+
+        # 2. Logs if invalid...
+        else:
+            logger.error("Invalid input. Expected: pandas.Index. Received: %s", type(value))
+
+        # 3. Returns...
+        return output
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _decode_index(self, value: dict):
+        """ Decodes to a pandas Index. """
+
+        # 1. Checks input...
+        output = None
+        if isinstance(value, dict) and (EConst.DATA in value) and (EConst.AUX1 in value):
+
+            # 1.1 ...
+            try:
+                output = self.__build_index(value, self._decode_from_dict(value[EConst.DATA]))
+
+            # 1.2 ...
+            except Exception:  # pylint: disable=broad-except
+                logger.exception("Failed to decode %s index.", value.get(EConst.AUX1))
+
+        # 2. If invalid...
+        else:
+
+            # 1.1 Logs...
+            logger.error(
+                "Invalid index input. Expected: dict with %s and %s. Received: %s",
+                EConst.DATA,
+                EConst.AUX1,
+                type(value),
+            )
+
+        # 3. Returns...
+        return output
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def __build_index(self, value: dict, data):
+        """ Rebuilds an Index from its layout and decoded payload. """
+
+        # 1. ...
+        layout = value[EConst.AUX1]
+        names = self._decode_from_dict(value.get(EConst.AUX2)) or [None]
+        freq = value.get(EConst.AUX3) if layout != _IDX_MULTI else None
+
+        # 2. Range...
+        if layout == _IDX_RANGE:
+            output = pandas.RangeIndex(*data, name=names[0])
+
+        # 3. Multi: no re-factorization...
+        elif layout == _IDX_MULTI:
+            output = pandas.MultiIndex(
+                levels=data,
+                codes=self._decode_from_dict(value[EConst.AUX3]),
+                names=names,
+                verify_integrity=False,
+            )
+
+        # 4. Datetime, from its first instant (UTC for tz-aware indexes)...
+        elif layout == _IDX_DATETIME:
+            start = pandas.Timestamp(data, unit=value[EConst.AUX6])
+            if value.get(EConst.AUX5) is not None:
+                start = start.tz_localize("UTC").tz_convert(value[EConst.AUX5])
+            output = pandas.date_range(
+                start=start,
+                periods=value[EConst.AUX4],
+                freq=freq,
+                unit=value[EConst.AUX6],
+                name=names[0],
+            )
+
+        # 5. Periods, from the first ordinal...
+        elif layout == _IDX_PERIOD:
+            output = pandas.period_range(
+                start=pandas.Period(ordinal=data, freq=freq),
+                periods=value[EConst.AUX4],
+                name=names[0],
+            )
+
+        # 6. Values...
+        else:
+            output = pandas.Index(self.__decode_column(data), name=names[0], tupleize_cols=False)
+            if freq is not None:
+                output = type(output)(output, freq=freq)
+
+        # 7. ...
+        return output
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def __is_period_range(self, value: pandas.PeriodIndex) -> bool:
+        """ If a PeriodIndex is consecutive: rebuilt from its start, frequency and length. """
+
+        # 1. ...
+        return (len(value) > 0) and numpy.array_equal(
+            pandas.period_range(start=value[0], periods=len(value), freq=value.freq).asi8,
+            value.asi8,
+        )
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def __encode_column(self, column: pandas.Series | pandas.Index):
+        """
+        Encodes the values of a Series, DataFrame column or Index as one vector: a raw-buffer
+        ndarray for numpy dtypes (numbers, bool, datetime64, timedelta64), an `extarray` for
+        extension dtypes, or a list for object dtype. Lists of plain JSON scalars are written
+        as they are; other cells are encoded one by one.
+        """
+
+        # 1. Packed...
+        if isinstance(column.dtype, numpy.dtype) and (not column.dtype.hasobject):
+            output = self._encode_as_dict(column.to_numpy())
+
+        # 2. Extension dtypes...
+        elif not isinstance(column.dtype, numpy.dtype):
+            output = self._encode_as_dict(column.array)
+
+        # 3. JSON scalars only (e.g. strings): an untagged list, written in one go...
+        elif set(map(type, cells := column.tolist())) <= _JSON_SCALARS:
+            output = cells
+
+        # 4. Per cell...
+        else:
+            output = self._encode_as_dict(cells)
+
+        # 5. ...
+        return output
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def __decode_column(self, data):
+        """ Decodes a column vector: lists are object columns, kept as such. """
+
+        # 1. ...
+        output = data
+        if isinstance(data, list):
+            output = numpy.empty(len(data), dtype=object)
+            output[:] = data
+
+        # 2. ...
+        return output
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _encode_extarray(self, value: ExtensionArray):
+        """
+        Encodes a pandas extension array with its exact dtype:
+        - categorical: integer codes, plus the categories vector;
+        - nullable (`Int64`, `Float64`, `boolean`...): values, plus a validity bitmap;
+        - tz-aware datetimes and periods: int64 values;
+        - intervals: the left and right vectors;
+        - sparse: the stored values and their positions;
+        - strings: a list;
+        - numpy-backed (naive datetimes, timedeltas, `NumpyExtensionArray`): the ndarray;
+        - other dtypes: one cell at a time.
+        """
+
+        # 1. Checks input...
+        output = None
+        if (value is not None) and isinstance(value, ExtensionArray):
+
+            # 1.1 Common...
+            dtype = value.dtype
+            output = {
+                EConst.TYPE: SupportedTypes.EXTARRAY.value,
+                EConst.AUX1: _EXT_CELLS,
+                EConst.AUX2: str(dtype),
+            }
+
+            # 1.2 Categorical: dictionary encoded...
+            if isinstance(dtype, pandas.CategoricalDtype):
+                output[EConst.AUX1] = _EXT_CATEGORICAL
+                output[EConst.DATA] = self._encode_as_dict(value.codes)
+                output[EConst.AUX3] = self.__encode_column(dtype.categories)
+                output[EConst.AUX4] = bool(dtype.ordered)
+
+            # 1.3 Nullable: values, with NA slots zeroed...
+            elif isinstance(value, _MASKED_ARRAYS):
+                output[EConst.AUX1] = _EXT_MASKED
+                output[EConst.DATA] = self._encode_as_dict(
+                    value.to_numpy(dtype=dtype.numpy_dtype, na_value=dtype.numpy_dtype.type(0))
+                )
+                output[EConst.AUX3] = self._encode_buffer(
+                    numpy.packbits(~value.isna(), bitorder="little")
+                )
+
+            # 1.4 Tz-aware datetimes...
+            elif isinstance(dtype, pandas.DatetimeTZDtype):
+                output[EConst.AUX1] = _EXT_DATETIMETZ
+                output[EConst.DATA] = self._encode_as_dict(value.asi8)
+                output[EConst.AUX3] = dtype.unit
+                output[EConst.AUX4] = str(dtype.tz)
+
+            # 1.5 Periods: ordinals...
+            elif isinstance(dtype, pandas.PeriodDtype):
+                output[EConst.AUX1] = _EXT_PERIOD
+                output[EConst.DATA] = self._encode_as_dict(value.asi8)
+
+            # 1.6 Intervals: bounds...
+            elif isinstance(dtype, pandas.IntervalDtype):
+                output[EConst.AUX1] = _EXT_INTERVAL
+                output[EConst.DATA] = self.__encode_column(value.left)
+                output[EConst.AUX3] = self.__encode_column(value.right)
+                output[EConst.AUX4] = value.closed
+
+            # 1.7 Sparse...
+            elif isinstance(dtype, pandas.SparseDtype):
+                output[EConst.AUX1] = _EXT_SPARSE
+                output[EConst.DATA] = self._encode_as_dict(value.sp_values)
+                output[EConst.AUX3] = self._encode_as_dict(value.sp_index.indices)
+                output[EConst.AUX4] = len(value)
+                output[EConst.AUX5] = self._encode_as_dict(value.fill_value)
+                output[EConst.AUX6] = value.kind
+
+            # 1.8 Strings...
+            elif isinstance(dtype, pandas.StringDtype):
+                output[EConst.AUX1] = _EXT_STRING
+                output[EConst.AUX2] = f"string[{dtype.storage}]"
+                output[EConst.DATA] = value.to_numpy(dtype=object, na_value=None).tolist()
+
+            # 1.9 Numpy-backed: the ndarray (NaT included), packed unless of objects...
+            elif isinstance(dtype, numpy.dtype) or isinstance(value, _NUMPY_ARRAY):
+                output[EConst.AUX1] = _EXT_NUMPY
+                output[EConst.DATA] = self._encode_as_dict(value.to_numpy())
+
+            # 1.10 Other: per cell...
+            else:
+                output[EConst.DATA] = self._encode_as_dict(list(value))
+
+        # 2. Logs if invalid...
+        else:
+            logger.error(
+                "Invalid input. Expected: pandas ExtensionArray. Received: %s", type(value)
+            )
+
+        # 3. Returns...
+        return output
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _decode_extarray(self, value: dict):
+        """ Decodes to a pandas extension array. """
+
+        # 1. Checks input...
+        output = None
+        if isinstance(value, dict) and (EConst.DATA in value) and (EConst.AUX1 in value):
+
+            # 1.1 ...
+            try:
+                data = self._decode_from_dict(value[EConst.DATA])
+                output = self.__build_extarray(value[EConst.AUX1], value[EConst.AUX2], data, value)
+
+            # 1.2 ...
+            except Exception:  # pylint: disable=broad-except
+                logger.exception("Failed to decode %s extension array.", value.get(EConst.AUX2))
+
+        # 2. If invalid...
+        else:
+
+            # 1.1 Logs...
+            logger.error(
+                "Invalid extarray input. Expected: dict with %s and %s. Received: %s",
+                EConst.DATA,
+                EConst.AUX1,
+                type(value),
+            )
+
+        # 3. Returns...
+        return output
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def __build_extarray(self, layout: str, dtype: str, data, value: dict):
+        """ Rebuilds an extension array from its layout, dtype and decoded parts. """
+
+        # 1. Categorical...
+        if layout == _EXT_CATEGORICAL:
+            categories = pandas.Index(self.__decode_column(value[EConst.AUX3]), tupleize_cols=False)
+            output = pandas.Categorical.from_codes(
+                data, dtype=pandas.CategoricalDtype(categories, ordered=value.get(EConst.AUX4))
+            )
+
+        # 2. Nullable: mask from the validity bitmap...
+        elif layout == _EXT_MASKED:
+            bitmap = numpy.frombuffer(self._decode_buffer(value[EConst.AUX3]), dtype=numpy.uint8)
+            valid = numpy.unpackbits(bitmap, count=len(data), bitorder="little").astype(bool)
+            output = pandas_dtype(dtype).construct_array_type()(data, ~valid)
+
+        # 3. Tz-aware datetimes: UTC instants...
+        elif layout == _EXT_DATETIMETZ:
+            output = (
+                pandas.array(data.view(f"M8[{value[EConst.AUX3]}]"))
+                .tz_localize("UTC")
+                .tz_convert(value[EConst.AUX4])
+            )
+
+        # 4. Periods...
+        elif layout == _EXT_PERIOD:
+            output = pandas.arrays.PeriodArray(data, dtype=pandas_dtype(dtype))
+
+        # 5. Intervals...
+        elif layout == _EXT_INTERVAL:
+            output = pandas.arrays.IntervalArray.from_arrays(
+                self.__decode_column(data),
+                self.__decode_column(value[EConst.AUX3]),
+                closed=value[EConst.AUX4],
+                dtype=pandas_dtype(dtype),
+            )
+
+        # 6. Sparse: through a dense copy (public constructors only)...
+        elif layout == _EXT_SPARSE:
+            fill_value = self._decode_from_dict(value[EConst.AUX5])
+            dense = pandas.Series(data, index=value[EConst.AUX3]).reindex(
+                range(value[EConst.AUX4]), fill_value=fill_value
+            )
+            output = pandas.arrays.SparseArray(
+                dense.to_numpy(),
+                fill_value=fill_value,
+                kind=value[EConst.AUX6],
+                dtype=pandas_dtype(dtype),
+            )
+
+        # 7. Numpy-backed: datetimes and timedeltas by their ndarray dtype...
+        elif layout == _EXT_NUMPY:
+            if data.dtype.kind in "mM":
+                output = pandas.array(data)
+            else:
+                output = _NUMPY_ARRAY(data)
+
+        # 8. Strings, other...
+        else:
+            output = pandas.array(self.__decode_column(data), dtype=pandas_dtype(dtype))
+
+        # 9. ...
+        return output
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def __is_columnar(self, data, columns) -> bool:
+        """ If DataFrame data holds column vectors, rather than (0.2.x) row records. """
+
+        # 1. Records are dicts; empty frames only match when columns are empty too...
+        return (
+            isinstance(data, list)
+            and (len(data) == (len(columns) if columns is not None else len(data)))
+            and (not any(isinstance(item, dict) for item in data))
+        )
+
+    # ----------------------------------------------------------------------------------------- #
+
     def __decode_columns(self, value: dict):
         """ Decodes to a DataFrame. """
 
@@ -686,31 +1295,6 @@ class SpecEnc(BaseEncoder):
 
     # ----------------------------------------------------------------------------------------- #
 
-    def __pre_encode(self, index):
-        """ Converts the index into a JSON-safe list structure for serialization. """
-
-        # 1. Checks for MultiIndex...
-        if isinstance(index, pandas.MultiIndex):
-
-            # 1.1 Converts tuples to lists...
-            output = [list(x) for x in index.to_list()]
-
-        # 2. Handles pandas-specific temporal types...
-        else:
-
-            # 1.1 Converts each element as needed...
-            output = [
-                str(x)
-                if isinstance(x, (pandas.Timestamp, pandas.Period, pandas.Timedelta))
-                else x
-                for x in index
-            ]
-
-        # 3. Returns...
-        return output
-
-    # ----------------------------------------------------------------------------------------- #
-
     def __pre_decode(self, index_data, index_type):
         """ Reconstructs index elements after decoding from JSON-safe format. """
 
@@ -739,23 +1323,5 @@ class SpecEnc(BaseEncoder):
 
     # ----------------------------------------------------------------------------------------- #
 
-    def __index_freq(self, index):
-        """ Checks if the index has a frequency attribute. """
-
-        # 1. Checks for Frequency...
-        output = None
-        if (
-            isinstance(index, (pandas.DatetimeIndex, pandas.PeriodIndex))
-            and index.freq is not None
-        ):
-
-            # 1.1 Outputs...
-            output = index.freq.freqstr
-
-        # 3. Returns...
-        return output
-
-    # ----------------------------------------------------------------------------------------- #
-
 
 # --------------------------------------------------------------------------------------------- #
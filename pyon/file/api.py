@@ -2,19 +2,20 @@
 # --------------------------------------------------------------------------------------------- #
 
 import base64
+import contextlib
+import errno
+import hashlib
 import logging
 import mimetypes
+import mmap
 import os
 import shutil
 import tempfile
+import threading
 
 # --------------------------------------------------------------------------------------------- #
 
-from typing import Literal
-
-# --------------------------------------------------------------------------------------------- #
-
-import magic
+from typing import Iterator, Literal
 
 # --------------------------------------------------------------------------------------------- #
 
@@ -32,6 +33,26 @@ logger = logging.getLogger(__name__)
 
 TEMP_FOLDER = "pyon_file"
 
+# Bytes of content sniffed by libmagic: the first ones only...
+MIME_SNIFF_SIZE = 1 << 14
+
+# Sniffed MIME types, by path (size, mtime) or content prefix digest, before the cache is reset...
+_MIME_CACHE_SIZE = 4096
+_MIME_CACHE = {}
+
+# Bytes per chunk, when files are read, written or hashed...
+CHUNK_SIZE = 1 << 20
+
+# Kernel copy errors (unsupported by the system or the file systems) that fall back to a copy
+# through user space...
+_KERNEL_COPY_ERRORS = {
+    errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.ENOTSUP, errno.EBADF,
+    errno.ETXTBSY,
+}
+
+# libmagic handles, one per thread (they are not thread-safe), created on first use...
+_MAGIC = threading.local()
+
 # --------------------------------------------------------------------------------------------- #
 
 
@@ -46,7 +67,8 @@ class File:
         content: bytes | None = None,
         mime: str | None = None,
         export_mode: Literal["data", "reference"] = "reference",
-        export_reset: bool = False
+        export_reset: bool = False,
+        sniff: bool = False
     ):
         """
         Initializes a new instance of the class.
@@ -60,6 +82,8 @@ class File:
                 is exported, either as raw data or as a reference to the filesystem.
             export_reset (bool, optional): If should reset path on export with export_mode
                 `data`.
+            sniff (bool, optional): If the MIME type should be sniffed from the content by
+                libmagic even when the file extension is known. Defaults to False.
 
         Raises:
             ValueError: If both `path` and `content` are None.
@@ -75,7 +99,8 @@ class File:
 
         # 3. ...
         self._tmp_path = None
-        self.mime = self.__get_mime(mime)
+        self._digest = None
+        self.mime = self.__get_mime(mime, sniff)
 
         # 4. ...
         self.export_mode = export_mode
@@ -132,6 +157,29 @@ class File:
 
     # ----------------------------------------------------------------------------------------- #
 
+    @property
+    def content(self) -> bytes | None:
+        """ Returns the file content, if loaded """
+
+        # 1. ...
+        return self._content
+
+    # ----------------------------------------------------------------------------------------- #
+
+    @content.setter
+    def content(self, value: bytes | None):
+        """ Sets the file content. A digest computed from other content is dropped. """
+
+        # 1. ...
+        digest = getattr(self, "_digest", None)
+        if digest and (digest[1] != File._content_source(value)):
+            self._digest = None
+
+        # 2. ...
+        self._content = value
+
+    # ----------------------------------------------------------------------------------------- #
+
     @property
     def size(self) -> str:
         """ Returns the size of the file content """
@@ -206,11 +254,13 @@ class File:
 
         # 2. ...
         if self.content:
-            output = len(self.content)
+            output = memoryview(self.content).nbytes
 
-        # 3. ...
-        elif self.path:
-            output = os.path.getsize(self.path)
+        # 3. Not read...
+        else:
+            path = self._source_path()
+            if path:
+                output = os.path.getsize(path)
 
         # 4. ...
         return output
@@ -252,6 +302,30 @@ class File:
 
     # ----------------------------------------------------------------------------------------- #
 
+    def __getstate__(self) -> dict:
+        """ State for `pickle` and `copy`: mapped content is read into bytes (maps can't be). """
+
+        # 1. ...
+        output = self.__dict__.copy()
+        if self._mapped():
+            output["_content"] = self.content.tobytes()
+
+        # 2. ...
+        return output
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def __setstate__(self, state: dict):
+        """ Restores a state from `__getstate__`, or from a pickle with a plain `content`. """
+
+        # 1. ...
+        state = dict(state)
+        if "content" in state:
+            state["_content"] = state.pop("content")
+        self.__dict__.update(state)
+
+    # ----------------------------------------------------------------------------------------- #
+
     def __lt__(self, other: object) -> bool:
         """
         Returns True if this file is smaller than the other.
@@ -322,7 +396,8 @@ class File:
 
     def __eq__(self, other: object) -> bool:
         """
-        Compares files by identity: path or content.
+        Compares files by identity: path or content. Contents are compared in chunks, loaded
+        or not, after their sizes.
 
         Returns:
             bool: True if both files refer to the same logical file.
@@ -337,8 +412,10 @@ class File:
                 result = (self.path == other.path)
 
             # 2.2 Content-based fallback...
-            elif self.loaded and other.loaded:
-                result = (self.content == other.content)
+            elif (self.loaded or self._source_path()) and (other.loaded or other._source_path()):
+                result = (len(self) == len(other)) and all(
+                    a == b for a, b in zip(self.iter_chunks(), other.iter_chunks())
+                )
 
         # 2. Return result...
         return result
@@ -393,27 +470,44 @@ class File:
 
             # 1.5 ...
             obj._tmp_path = None
+            obj._digest = None
 
         # 2. ...
         return obj
 
     # ----------------------------------------------------------------------------------------- #
 
-    def load(self) -> bool:
+    def load(self, digest: str | None = None, use_mmap: bool = False) -> bool:
         """
         Loads the content of the file at the specified path into memory if not already loaded.
 
+        Args:
+            digest (str | None, optional): A `hashlib` algorithm: the content digest is
+                computed while the file is read, and kept for `get_digest`.
+            use_mmap (bool, optional): Maps the file instead of reading it: `content` is a
+                read-only `memoryview`, whose pages are read on access. The temp file, if any,
+                is kept while mapped. `unload` closes the map; copies and pickles read it.
+
         Returns:
             bool: True if the content is successfully loaded or already present, False otherwise.
         """
 
         # 1. ...
         if not self.content:
-            self.content = self._get_content()
 
-            # 1.1 ...
-            if self.temp and self.content:
-                self.clean()
+            # 1.1 Mapped...
+            if use_mmap and len(self):
+                self.content = memoryview(self.open_mmap())
+                if digest:
+                    self.get_digest(digest)
+
+            # 1.2 ...
+            else:
+                self.content = self._get_content(digest)
+
+                # 2.1 ...
+                if self.temp and self.content:
+                    self.clean()
 
         # 2. ...
         return self.content is not None
@@ -480,9 +574,16 @@ class File:
                 else:
                     done = True
 
-            # 1.4 ...
+            # 1.4 Mapped content: the map is closed, or on garbage collection if views of it
+            # are still in use...
             if done:
+                view = self.content if self._mapped() else None
                 self.content = None
+                if view is not None:
+                    mapped = view.obj
+                    with contextlib.suppress(BufferError):
+                        view.release()
+                        mapped.close()
 
         # 2. ...
         return self.content is None
@@ -543,12 +644,18 @@ class File:
 
     # ----------------------------------------------------------------------------------------- #
 
-    def write(self, outpath: str | None = None, verbose: bool = False) -> bool:
+    def write(
+        self, outpath: str | None = None, verbose: bool = False, digest: str | None = None
+    ) -> bool:
         """
-        Writes the file content to disk.
+        Writes the file content to disk, in chunks of `CHUNK_SIZE`.
             - If 'content' is available, it writes the content to 'outpath'.
             - If 'content' is not available but 'filepath' is, 
-                it copies the file from 'filepath' to 'outpath'.
+                it copies the file from 'filepath' to 'outpath', in the kernel if possible
+                (`copy_file_range`, `sendfile`).
+
+        With `digest` (a `hashlib` algorithm), the content digest is computed in the same
+        pass, and kept for `get_digest`.
         """
 
         # 1. ...
@@ -578,13 +685,21 @@ class File:
                 path = self.__clean_path(os.path.join(path, file_name)) # type: ignore
 
             # 1.4 ...
+            hasher = hashlib.new(digest) if digest else None
             if self.content:
 
-                # 2.1 ...
-                with open(path, 'wb') as f:
-                    f.write(self.content)
+                # 2.1 Mapped content is its own file: truncating it would fault the map...
+                source = self._source_path() if self._mapped() else None
+                if source and os.path.exists(path) and os.path.samefile(path, source):
+                    if hasher is not None:
+                        File._hash_chunks(hasher, self.content)
 
                 # 2.2 ...
+                else:
+                    with open(path, 'wb') as f:
+                        File._write_chunks(f, self.content, hasher)
+
+                # 2.3 ...
                 check = True
 
             # 1.5 ...
@@ -592,7 +707,8 @@ class File:
 
                 # 1.1 ...
                 if path != self.path:
-                    shutil.copy(self.path, path)
+                    File._copy_file(self.path, path, hasher)
+                    shutil.copymode(self.path, path)
 
                     # 2.1 ...
                     check = True
@@ -602,6 +718,9 @@ class File:
                 raise FileNotFoundError(f"Source file not found: {self.path}")
 
             # 1.7 ...
+            source = self._digest_source() if hasher is not None else None
+            if source is not None:
+                self._digest = (digest, source, hasher.hexdigest())
             if verbose:
                 logger.info("File.write(): data saved at %s", path)
 
@@ -656,31 +775,173 @@ class File:
 
     # ----------------------------------------------------------------------------------------- #
 
-    def _get_content(self) -> bytes | None:
+    def read(self, offset: int = 0, size: int = -1) -> bytes:
         """
-        Returns the file content as bytes.
+        Reads `size` bytes of content from `offset` (all the rest if negative), from memory or
+        from the file, without loading the rest.
+
+        Args:
+            offset (int, optional): Start, in bytes. Defaults to 0.
+            size (int, optional): Bytes to read; all the rest if negative. Defaults to -1.
+
+        Returns:
+            bytes: The bytes read: fewer than `size` at the end of the content.
         """
 
         # 1. ...
-        output = None
+        if offset < 0:
+            raise ValueError(f"Invalid offset: {offset}")
 
         # 2. ...
+        output = b""
         if self.content:
-            output = self.content
+            view = memoryview(self.content)
+            output = bytes(view[offset:] if size < 0 else view[offset:offset + size])
 
         # 3. ...
         else:
-            load_path = None
+            path = self._source_path()
+            if path:
+
+                # 1.1 ...
+                with open(path, "rb") as file:
+                    file.seek(offset)
+                    output = file.read(size)
+
+        # 4. ...
+        return output
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def iter_chunks(self, size: int = CHUNK_SIZE) -> Iterator[bytes | memoryview]:
+        """
+        Yields the content in chunks of `size` bytes (the last one shorter): views of the
+        content if loaded (no copies), else bytes read from the file one chunk at a time.
+        """
+
+        # 1. ...
+        if size <= 0:
+            raise ValueError(f"Invalid chunk size: {size}")
+
+        # 2. ...
+        if self.content:
+            view = memoryview(self.content)
+            for pos in range(0, len(view), size):
+                yield view[pos:pos + size]
+
+        # 3. ...
+        else:
+            path = self._source_path()
+            if path:
+
+                # 1.1 ...
+                with open(path, "rb") as file:
+                    yield from iter(lambda: file.read(size), b"")
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def open_mmap(self) -> mmap.mmap:
+        """
+        Maps the file read-only: pages are read on access, and shared with other processes
+        mapping it. The caller closes the map.
+
+        Raises:
+            FileNotFoundError: If there is no file to map.
+            ValueError: If the file is empty.
+        """
+
+        # 1. ...
+        path = self._source_path()
+        if not path:
+            raise FileNotFoundError(f"Source file not found: {self.path}")
+
+        # 2. The map keeps its own handle...
+        with open(path, "rb") as file:
+            output = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        # 3. ...
+        return output
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def get_digest(self, algorithm: str = "sha256") -> str | None:
+        """
+        Returns the hex digest of the content, or None if there is none. Reuses the digest
+        computed by `load` or `write`, if the content or file did not change since; otherwise
+        hashes the content, or streams the file in chunks. Mutable content (`bytearray`...)
+        is hashed on each call.
+
+        Args:
+            algorithm (str, optional): A `hashlib` algorithm. Defaults to `sha256`.
+        """
+
+        # 1. ...
+        output = None
+        source = self._digest_source()
+        cached = self._digest and (self._digest[0] == algorithm) and (self._digest[1] == source)
+        if cached and (source is not None):
+            output = self._digest[2]
+
+        # 2. ...
+        elif (source is not None) or self.content:
+            hasher = hashlib.new(algorithm)
 
             # 1.1 ...
-            if self._tmp_path and os.path.isfile(self._tmp_path):
-                load_path = self._tmp_path
+            for chunk in self.iter_chunks():
+                hasher.update(chunk)
 
             # 1.2 ...
-            elif self.path and os.path.isfile(self.path):
-                load_path = self.path
+            output = hasher.hexdigest()
+            if source is not None:
+                self._digest = (algorithm, source, output)
 
-            # 1.3 ...
+        # 3. ...
+        return output
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _digest_source(self):
+        """
+        Identifies the content a digest was computed from: the loaded content (see
+        `_content_source`), else the file path, size and mtime. None if there is no content,
+        or if it is mutable.
+        """
+
+        # 1. ...
+        output = None
+        if self.content:
+            output = File._content_source(self.content)
+
+        # 2. ...
+        else:
+            path = self._source_path()
+            if path:
+
+                # 1.1 ...
+                stat = os.stat(path)
+                output = (path, stat.st_size, stat.st_mtime_ns)
+
+        # 3. ...
+        return output
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _get_content(self, digest: str | None = None) -> bytes | None:
+        """
+        Returns the file content as bytes. With `digest`, its digest is computed in the same
+        pass and kept for `get_digest`.
+        """
+
+        # 1. ...
+        output = None
+
+        # 2. ...
+        if self.content:
+            output = self.content
+
+        # 3. ...
+        else:
+            load_path = self._source_path()
             if load_path:
 
                 # 2.1 ...
@@ -688,6 +949,37 @@ class File:
                     output = file.read()
 
         # 4. ...
+        if digest and output:
+            hasher = hashlib.new(digest)
+            File._hash_chunks(hasher, output)
+            self._digest = (digest, File._content_source(output), hasher.hexdigest())
+
+        # 5. ...
+        return output
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _mapped(self) -> bool:
+        """ If the content is a view of a memory-mapped file (see `load`) """
+
+        # 1. ...
+        return isinstance(self.content, memoryview) and isinstance(self.content.obj, mmap.mmap)
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _source_path(self) -> str | None:
+        """ The file the content is read from: the temp file if any, else the path, if it exists """
+
+        # 1. ...
+        output = None
+        if self._tmp_path and os.path.isfile(self._tmp_path):
+            output = self._tmp_path
+
+        # 2. ...
+        elif self.path and os.path.isfile(self.path):
+            output = self.path
+
+        # 3. ...
         return output
 
     # ----------------------------------------------------------------------------------------- #
@@ -744,33 +1036,32 @@ class File:
 
     # ----------------------------------------------------------------------------------------- #
 
-    def __get_mime(self, mime: str | None) -> str:
-        """ Returns the mime value """
+    def __get_mime(self, mime: str | None, sniff: bool = False) -> str:
+        """ Returns the mime value: from the extension if known, unless sniffing is forced """
 
         # 1. ...
         output = mime.strip() if mime else ''
         if not output:
 
-            # 1.1 ...
-            if self.path:
-
-                # 2.1 ...
-                if self.extension == PYON_EXT:
-                    output = PYON_MIME
-
-                # 2.2 ...
-                else:
-                    output = File.get_mime_from_path(self.path)
+            # 1.1 Known extensions: no libmagic...
+            if self.extension == PYON_EXT:
+                output = PYON_MIME
+            elif self.name and not sniff:
+                output = mimetypes.guess_type(self.name)[0] or ''
 
             # 1.2 ...
-            if not output and self.content:
-                output = File.get_mime_from_content(self.content)
+            if not output and self.path and os.path.isfile(self.path):
+                output = File.get_mime_from_path(self.path)
 
             # 1.3 ...
+            if not output and self.content:
+                output = File.get_mime_from_content(self.read(0, MIME_SNIFF_SIZE))
+
+            # 1.4 ...
             if not output and self.name:
                 output = File.get_mime_from_name(self.name)
 
-            # 1.4 ...
+            # 1.5 ...
             if not output:
                 output = "application/octet-stream"
 
@@ -862,24 +1153,77 @@ class File:
     @staticmethod
     def get_mime_from_path(filepath: str):
         """
-        Returns the mime of a filepath.
+        Returns the mime of a filepath, sniffed by libmagic from its first `MIME_SNIFF_SIZE`
+        bytes. Cached by path, size and mtime.
         """
 
         # 1. ...
-        mime = magic.Magic(mime=True)
-        return mime.from_file(filepath)
+        stat = os.stat(filepath)
+        key = ("path", filepath, stat.st_size, stat.st_mtime_ns)
+        output = _MIME_CACHE.get(key)
+
+        # 2. ...
+        if output is None:
+            with open(filepath, "rb") as file:
+                output = File.get_mime_from_content(file.read(MIME_SNIFF_SIZE))
+            File._cache_mime(key, output)
+
+        # 3. ...
+        return output
 
     # ----------------------------------------------------------------------------------------- #
 
     @staticmethod
     def get_mime_from_content(content: bytes):
         """
-        Returns the mime of the content.
+        Returns the mime of the content, sniffed by libmagic from its first `MIME_SNIFF_SIZE`
+        bytes. Cached by a digest of them.
         """
 
         # 1. ...
-        mime = magic.Magic(mime=True)
-        return mime.from_buffer(content)
+        head = bytes(memoryview(content)[:MIME_SNIFF_SIZE])
+        key = ("content", hashlib.blake2b(head, digest_size=16).digest())
+        output = _MIME_CACHE.get(key)
+
+        # 2. ...
+        if output is None:
+            output = File._get_magic().from_buffer(head)
+            File._cache_mime(key, output)
+
+        # 3. ...
+        return output
+
+    # ----------------------------------------------------------------------------------------- #
+
+    @staticmethod
+    def _get_magic():
+        """
+        Returns the libmagic handle of the current thread. libmagic is imported, and its
+        database loaded, on first use only.
+        """
+
+        # 1. ...
+        output = getattr(_MAGIC, "handle", None)
+        if output is None:
+
+            # 1.1 ...
+            import magic  # pylint: disable=import-outside-toplevel
+            output = magic.Magic(mime=True)
+            _MAGIC.handle = output
+
+        # 2. ...
+        return output
+
+    # ----------------------------------------------------------------------------------------- #
+
+    @staticmethod
+    def _cache_mime(key: tuple, mime: str):
+        """ Caches a sniffed MIME type, resetting the cache when full. """
+
+        # 1. ...
+        if len(_MIME_CACHE) >= _MIME_CACHE_SIZE:
+            _MIME_CACHE.clear()
+        _MIME_CACHE[key] = mime
 
     # ----------------------------------------------------------------------------------------- #
 
@@ -913,6 +1257,120 @@ class File:
 
     # ----------------------------------------------------------------------------------------- #
 
+    @staticmethod
+    def _content_source(content: bytes | None) -> tuple | None:
+        """
+        Identifies loaded content by object id and size, without a reference to it: a digest
+        must not keep a multi-GB buffer alive. Valid while it is the content (see `content`).
+        None for content that can change in place: only `bytes` and read-only maps qualify.
+        """
+
+        # 1. ...
+        output = None
+        if isinstance(content, bytes) or (
+            isinstance(content, memoryview)
+            and content.readonly
+            and isinstance(content.obj, mmap.mmap)
+        ):
+            output = ("content", id(content), memoryview(content).nbytes)
+
+        # 2. ...
+        return output
+
+    # ----------------------------------------------------------------------------------------- #
+
+    @staticmethod
+    def _hash_chunks(hasher, data: bytes):
+        """ Updates a hash with data, one chunk at a time, while each chunk is in cache. """
+
+        # 1. ...
+        view = memoryview(data)
+        for pos in range(0, len(view), CHUNK_SIZE):
+            hasher.update(view[pos:pos + CHUNK_SIZE])
+
+    # ----------------------------------------------------------------------------------------- #
+
+    @staticmethod
+    def _write_chunks(file, data: bytes, hasher=None):
+        """ Writes data to a binary file, one chunk at a time, hashing each if asked. """
+
+        # 1. ...
+        view = memoryview(data)
+        for pos in range(0, len(view), CHUNK_SIZE):
+
+            # 1.1 ...
+            chunk = view[pos:pos + CHUNK_SIZE]
+            file.write(chunk)
+            if hasher is not None:
+                hasher.update(chunk)
+
+    # ----------------------------------------------------------------------------------------- #
+
+    @staticmethod
+    def _copy_file(source: str, target: str, hasher=None):
+        """
+        Copies a file's content. Without a hash, the kernel copies it (`copy_file_range`, which
+        can share extents or copy server-side, else `sendfile`); with a hash, or where neither
+        is supported, it is copied through one reused buffer and hashed in the same pass.
+        """
+
+        # 1. ...
+        with open(source, "rb") as fin, open(target, "wb") as fout:
+            size = os.fstat(fin.fileno()).st_size
+            done = 0
+
+            # 1.1 Kernel copy, from the current offset...
+            if hasher is None:
+                for name in ("copy_file_range", "sendfile"):
+                    if (done < size) and hasattr(os, name):
+                        done = File._kernel_copy(name, fin.fileno(), fout.fileno(), done, size)
+
+            # 1.2 Copy through user space: the rest, if any...
+            fin.seek(done)
+            fout.seek(done)
+            buffer = bytearray(min(CHUNK_SIZE, max(size - done, 1)))
+            view = memoryview(buffer)
+            while count := fin.readinto(buffer):
+                fout.write(view[:count])
+                if hasher is not None:
+                    hasher.update(view[:count])
+
+    # ----------------------------------------------------------------------------------------- #
+
+    @staticmethod
+    def _kernel_copy(name: str, fin: int, fout: int, done: int, size: int) -> int:
+        """
+        Copies from `done` on between file descriptors with `os.copy_file_range` or
+        `os.sendfile`. Returns the bytes copied so far; stops early where unsupported.
+        """
+
+        # 1. ...
+        try:
+            while done < size:
+
+                # 1.1 ...
+                count = min(size - done, 1 << 30)
+                if name == "copy_file_range":
+                    copied = os.copy_file_range(fin, fout, count, done, done)
+                else:
+                    os.lseek(fout, done, os.SEEK_SET)
+                    copied = os.sendfile(fout, fin, done, count)
+
+                # 1.2 File shrunk while copied: the rest is read in user space...
+                if not copied:
+                    break
+                done += copied
+
+        # 2. ...
+        except OSError as e:
+            if e.errno not in _KERNEL_COPY_ERRORS:
+                raise
+
+        # 3. ...
+        return done
+
+    # ----------------------------------------------------------------------------------------- #
+
     @staticmethod
     def _encode_content(content: bytes | None) -> str | None:
         """ Encodes the content. """
@@ -0,0 +1,15 @@
+# --------------------------------------------------------------------------------------------- #
+"""
+This module initializes the `pyon.frame` package: chunked DataFrame files.
+Exports:
+    FrameStore: Reads and writes DataFrames split in row groups and column chunks.
+"""
+# --------------------------------------------------------------------------------------------- #
+
+from .store import FrameStore
+
+# --------------------------------------------------------------------------------------------- #
+
+__all__ = ["FrameStore"]
+
+# --------------------------------------------------------------------------------------------- #
@@ -0,0 +1,738 @@
+""" Pyon: Python Object Notation - Chunked DataFrame Files """
+# --------------------------------------------------------------------------------------------- #
+
+import logging
+import operator
+import os
+
+# --------------------------------------------------------------------------------------------- #
+
+import numpy
+import pandas
+
+# --------------------------------------------------------------------------------------------- #
+
+from ..encoder import PyonEncoder
+
+# --------------------------------------------------------------------------------------------- #
+
+logger = logging.getLogger(__name__)
+
+# --------------------------------------------------------------------------------------------- #
+
+# Rows per group, by default...
+ROW_GROUP_SIZE = 1 << 16
+
+# First line, and last line (footer position) of a frame file...
+FRAME_HEADER = b"#pyon-frame 1\n"
+_TRAILER = b"#pyon-frame-footer %020d\n"
+_TRAILER_SIZE = len(_TRAILER % 0)
+
+# Layout version, in the footer...
+_VERSION = 1
+
+# Filter operators, applied to the rows of the groups that are read...
+_COMPARISONS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+_MEMBERSHIPS = ("in", "not in")
+
+# --------------------------------------------------------------------------------------------- #
+
+
+class FrameStore():
+    """
+    Reads and writes DataFrames as chunked Pyon files.
+
+    Rows are split into groups, and each group into one chunk per column plus one for its
+    index. Every chunk is a compact Pyon document on its own line, so a reader decodes only
+    the chunks it needs. A footer (also Pyon) records the columns (and an empty frame with
+    their dtypes and index), where each chunk is, and per-group statistics (min, max, null
+    count) of each column; the last line points to it, so appends only rewrite the footer:
+
+        #pyon-frame 1
+        <group 0: index chunk>
+        <group 0: column 0 chunk>
+        ...
+        <footer>
+        #pyon-frame-footer <footer offset>
+    """
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def __init__(self, encoder: PyonEncoder):
+        """ Initializes a Frame Store over the encoder that writes its chunks. """
+
+        # 1. ...
+        if encoder is None:
+            raise ValueError("Invalid Pyon Encoder")
+
+        # 2. ...
+        self.encoder = encoder
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def write(self, frame: pandas.DataFrame, file_path: str, row_group_size: int = ROW_GROUP_SIZE):
+        """
+        Writes a DataFrame as a chunked frame file.
+
+        Args:
+            frame (pandas.DataFrame): The frame to write.
+            file_path (str): The output path.
+            row_group_size (int): Rows per group.
+        """
+
+        # 1. Checks input...
+        if not isinstance(frame, pandas.DataFrame):
+            raise ValueError(f"Expected a pandas.DataFrame. Received: {type(frame).__name__}")
+        if (not isinstance(row_group_size, int)) or (row_group_size < 1):
+            raise ValueError(f"Invalid row group size: {row_group_size}")
+
+        # 2. ...
+        directory = os.path.dirname(file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # 3. At least one group, so that an empty frame keeps its dtypes...
+        try:
+            with open(file_path, "wb") as fp:
+                fp.write(FRAME_HEADER)
+                groups = [
+                    self._write_group(fp, frame.iloc[start:start + row_group_size])
+                    for start in range(0, max(len(frame), 1), row_group_size)
+                ]
+                self._write_footer(fp, {
+                    "version": _VERSION,
+                    "columns": frame.columns,
+                    "schema": frame.iloc[0:0],
+                    "rows": len(frame),
+                    "groups": groups,
+                    "stats": self._collect_stats(frame, groups),
+                })
+
+        # 4. Does not leave partial files behind...
+        except BaseException:
+            if os.path.isfile(file_path):
+                os.remove(file_path)
+            raise
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def read(
+        self,
+        file_path: str,
+        columns: list | None = None,
+        rows: slice | None = None,
+        filters: list | None = None,
+    ):
+        """
+        Reads a frame file, decoding only the chunks of the requested columns and rows.
+
+        Args:
+            file_path (str): The frame file.
+            columns (list | None): Column labels, in the order wanted. All if None.
+            rows (slice | None): Row positions. All if None.
+            filters (list | None): `(column, op, value)` conditions, all of which rows must
+                meet; `op` is one of `==`, `!=`, `<`, `<=`, `>`, `>=`, `in`, `not in`. Groups
+                whose statistics rule out a match are not decoded.
+
+        Returns:
+            pandas.DataFrame: The selected part of the frame.
+        """
+
+        # 1. ...
+        with open(file_path, "rb") as fp:
+            footer = self._read_footer(fp)
+
+            # 1.1 Column positions, in the requested order (duplicate labels included)...
+            all_columns = footer["columns"]
+            if columns is None:
+                positions = numpy.arange(len(all_columns))
+            else:
+                positions = all_columns.get_indexer_for(list(columns))
+                if (positions < 0).any():
+                    missing = [label for label in columns if label not in all_columns]
+                    raise KeyError(f"Columns not in the frame file: {missing}")
+
+            # 1.2 Row positions...
+            rows = slice(None) if rows is None else rows
+            if not isinstance(rows, slice):
+                raise ValueError(f"Expected a slice of rows. Received: {type(rows).__name__}")
+            selected = range(*rows.indices(footer["rows"]))
+
+            # 1.3 Filters: on column positions...
+            conditions = self._parse_filters(all_columns, filters or [])
+
+            # 1.4 Reads the groups that hold them...
+            output = self._read_rows(fp, footer, positions, selected, conditions)
+
+        # 2. Labels of the selected columns...
+        output.columns = all_columns[positions]
+
+        # 3. ...
+        return output
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def append(
+        self, frame: pandas.DataFrame, file_path: str, row_group_size: int = ROW_GROUP_SIZE
+    ):
+        """
+        Appends rows to a frame file as new groups: only the new rows and the footer are
+        written. The columns, dtypes and index levels must match those of the file. A missing
+        file is written as new.
+
+        Args:
+            frame (pandas.DataFrame): The rows to append.
+            file_path (str): The frame file.
+            row_group_size (int): Rows per new group.
+        """
+
+        # 1. New file...
+        if not os.path.isfile(file_path):
+            self.write(frame, file_path, row_group_size=row_group_size)
+            return
+
+        # 2. Checks input...
+        if not isinstance(frame, pandas.DataFrame):
+            raise ValueError(f"Expected a pandas.DataFrame. Received: {type(frame).__name__}")
+        if (not isinstance(row_group_size, int)) or (row_group_size < 1):
+            raise ValueError(f"Invalid row group size: {row_group_size}")
+
+        # 3. ...
+        with open(file_path, "r+b") as fp:
+            offset = self._find_footer(fp)
+            footer = self._read_footer(fp)
+            self._check_schema(frame, self._schema(fp, footer))
+            if frame.empty:
+                return
+
+            # 3.1 Footer and trailer, kept to restore them on failure...
+            fp.seek(offset)
+            tail = fp.read()
+
+            # 3.2 New groups over the old footer, then the new footer...
+            try:
+                fp.seek(offset)
+                groups = [
+                    self._write_group(fp, frame.iloc[start:start + row_group_size])
+                    for start in range(0, len(frame), row_group_size)
+                ]
+                footer["stats"] = self._merge_stats(
+                    footer.get("stats"), self._collect_stats(frame, groups)
+                )
+                footer["groups"] = footer["groups"] + groups
+                footer["rows"] = footer["rows"] + len(frame)
+                self._write_footer(fp, footer)
+                fp.truncate()
+
+            # 3.3 The file is left as it was...
+            except BaseException:
+                fp.seek(offset)
+                fp.write(tail)
+                fp.truncate()
+                raise
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def compact(self, file_path: str, row_group_size: int = ROW_GROUP_SIZE):
+        """
+        Rewrites a frame file with its groups merged into groups of `row_group_size` rows
+        (e.g. after many small appends). Groups are read one at a time; the file is replaced
+        only once the new one is complete.
+
+        Args:
+            file_path (str): The frame file.
+            row_group_size (int): Rows per group.
+        """
+
+        # 1. Checks input...
+        if (not isinstance(row_group_size, int)) or (row_group_size < 1):
+            raise ValueError(f"Invalid row group size: {row_group_size}")
+
+        # 2. ...
+        temp_path = file_path + ".compact"
+        try:
+            with open(file_path, "rb") as src, open(temp_path, "wb") as fp:
+                footer = self._read_footer(src)
+                schema = self._schema(src, footer)
+                positions = range(len(footer["columns"]))
+                fp.write(FRAME_HEADER)
+
+                # 2.1 Full groups as soon as there are enough rows, the rest is carried...
+                groups = []
+                pending = []
+                for group in footer["groups"]:
+                    pending.append(self._read_group(src, group, positions, []))
+                    if sum(len(frame) for frame in pending) >= row_group_size:
+                        merged = pandas.concat(pending)
+                        full = len(merged) - (len(merged) % row_group_size)
+                        groups.extend(
+                            self._write_group(fp, merged.iloc[start:start + row_group_size])
+                            for start in range(0, full, row_group_size)
+                        )
+                        pending = [merged.iloc[full:]]
+
+                # 2.2 Last group: at least one, for the dtypes...
+                merged = pandas.concat(pending) if pending else schema
+                if len(merged) or (not groups):
+                    groups.append(self._write_group(fp, merged))
+
+                # 2.3 ...
+                footer["schema"] = schema
+                footer["stats"] = self._collect_stats(schema, groups)
+                footer["groups"] = groups
+                self._write_footer(fp, footer)
+
+            # 2.4 ...
+            os.replace(temp_path, file_path)
+
+        # 3. Does not leave partial files behind...
+        except BaseException:
+            if os.path.isfile(temp_path):
+                os.remove(temp_path)
+            raise
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def is_frame_file(self, file_path: str) -> bool:
+        """ If a file starts as a frame file. """
+
+        # 1. ...
+        with open(file_path, "rb") as fp:
+            return fp.read(len(FRAME_HEADER)) == FRAME_HEADER
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _write_group(self, fp, frame: pandas.DataFrame) -> dict:
+        """ Writes one row group: its index chunk, then one chunk per column. """
+
+        # 1. Columns as one-column frames over a range, so each keeps its exact dtype...
+        plain = frame.set_axis(pandas.RangeIndex(len(frame)), axis=0)
+        chunks = [
+            self._write_chunk(fp, plain.iloc[:, [pos]]) for pos in range(frame.shape[1])
+        ]
+
+        # 2. ...
+        return {
+            "rows": len(frame),
+            "index": self._write_chunk(fp, frame.index),
+            "columns": chunks,
+            "stats": [self._column_stats(frame.iloc[:, pos]) for pos in range(frame.shape[1])],
+        }
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _write_chunk(self, fp, value) -> list:
+        """ Writes one chunk on its own line. Returns its `[offset, size]`. """
+
+        # 1. ...
+        data = self.encoder.encode_str(value, compact=True)
+        if data is None:
+            raise ValueError(f"Frame chunk could not be encoded: '{type(value).__name__}'")
+
+        # 2. ...
+        offset = fp.tell()
+        size = fp.write(data.encode("utf-8") + b"\n")
+
+        # 3. ...
+        return [offset, size]
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _read_chunk(self, fp, location: list):
+        """ Reads and decodes one chunk. """
+
+        # 1. ...
+        offset, size = location
+        fp.seek(offset)
+
+        # 2. ...
+        return self.encoder.decode_str(fp.read(size).decode("utf-8"))
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _read_rows(
+        self, fp, footer: dict, positions, selected: range, conditions: list
+    ) -> pandas.DataFrame:
+        """ Reads the selected rows and columns, group by group, skipping ruled out groups. """
+
+        # 1. Row positions, ascending...
+        ascending = selected if selected.step > 0 else selected[::-1]
+        wanted = numpy.arange(ascending.start, ascending.stop, ascending.step, dtype=numpy.int64)
+
+        # 2. Groups...
+        frames = []
+        start = 0
+        for number, group in enumerate(footer["groups"]):
+            stop = start + group["rows"]
+
+            # 2.1 Rows of this group...
+            local = wanted[numpy.searchsorted(wanted, start):numpy.searchsorted(wanted, stop)]
+            if len(local) and self._may_match(footer.get("stats"), number, group, conditions):
+                frame = self._read_group(fp, group, positions, conditions)
+                frames.append(self._select_rows(frame, local - start, conditions, len(positions)))
+
+            # 2.2 ...
+            start = stop
+
+        # 3. Nothing read: an empty frame from the first group, for the dtypes...
+        if not frames:
+            frame = self._read_group(fp, footer["groups"][0], positions, [])
+            frames.append(frame.iloc[0:0])
+
+        # 4. Joins, in the requested order...
+        output = pandas.concat(frames) if len(frames) > 1 else frames[0]
+        if selected.step < 0:
+            output = output.iloc[::-1]
+
+        # 5. ...
+        return output
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _read_group(self, fp, group: dict, positions, conditions: list) -> pandas.DataFrame:
+        """
+        Decodes the index and the selected column chunks of one group, then the columns of
+        the filters (after them, by position).
+        """
+
+        # 1. Each chunk once, even for columns selected twice or filtered on...
+        positions = list(positions) + [pos for pos, _, _ in conditions]
+        chunks = {
+            pos: self._read_chunk(fp, group["columns"][pos]).iloc[:, 0] for pos in set(positions)
+        }
+        columns = [chunks[pos] for pos in positions]
+        index = self._read_chunk(fp, group["index"])
+
+        # 2. Columns by position (labels are set once, by the caller); sized without columns...
+        output = pandas.DataFrame(dict(enumerate(columns)), index=pandas.RangeIndex(len(index)))
+        output.index = index
+
+        # 3. ...
+        return output
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _select_rows(self, frame: pandas.DataFrame, local, conditions: list, width: int):
+        """ Keeps the rows at `local` positions that meet the conditions, and `width` columns. """
+
+        # 1. Positions: a slice when contiguous...
+        if len(local) == (local[-1] - local[0] + 1):
+            output = frame.iloc[local[0]:local[-1] + 1]
+        else:
+            output = frame.iloc[local]
+
+        # 2. Conditions, on the trailing filter columns...
+        if conditions:
+            mask = numpy.ones(len(output), dtype=bool)
+            for offset, (_, op, value) in enumerate(conditions):
+                column = output.iloc[:, width + offset]
+                if op in _MEMBERSHIPS:
+                    matches = column.isin(value).to_numpy()
+                    mask &= matches if op == "in" else ~matches
+                else:
+                    mask &= _COMPARISONS[op](column, value).fillna(False).to_numpy(dtype=bool)
+            output = output.iloc[mask, :width]
+
+        # 3. ...
+        return output
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _parse_filters(self, all_columns: pandas.Index, filters: list) -> list:
+        """ Checks filters, resolving their columns to positions. """
+
+        # 1. ...
+        output = []
+        for condition in filters:
+
+            # 1.1 Shape and operator...
+            if (not isinstance(condition, (list, tuple))) or (len(condition) != 3):
+                raise ValueError(f"Invalid filter, expected (column, op, value): {condition}")
+            label, op, value = condition
+            if (op not in _COMPARISONS) and (op not in _MEMBERSHIPS):
+                raise ValueError(f"Invalid filter operator: {op}")
+
+            # 1.2 Column: a single one...
+            position = all_columns.get_indexer_for([label])
+            if len(position) != 1:
+                raise KeyError(f"Filter column not in the frame file, or not unique: {label}")
+            if position[0] < 0:
+                raise KeyError(f"Filter column not in the frame file: {label}")
+
+            # 1.3 ...
+            output.append((int(position[0]), op, list(value) if op in _MEMBERSHIPS else value))
+
+        # 2. ...
+        return output
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _may_match(self, stats: list | None, number: int, group: dict, conditions: list) -> bool:
+        """ If a group may hold rows meeting all conditions, judging by its statistics. """
+
+        # 1. ...
+        output = True
+        for pos, op, value in conditions:
+            column_stats = stats[pos] if stats else None
+            if column_stats is not None:
+
+                # 1.1 Group statistics...
+                low = column_stats["min"].iloc[number]
+                high = column_stats["max"].iloc[number]
+                nulls = int(column_stats["nulls"][number])
+
+                # 1.2 Ruled out...
+                try:
+                    if not self._range_may_match(low, high, nulls, group["rows"], op, value):
+                        output = False
+                        break
+
+                # 1.3 Values not comparable with the statistics: kept...
+                except TypeError:
+                    pass
+
+        # 2. ...
+        return output
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _range_may_match(self, low, high, nulls: int, rows: int, op: str, value) -> bool:
+        """ If a column with values in `[low, high]` (plus `nulls` missing) may meet `op`. """
+
+        # 1. Only missing values: they only meet `!=` and `not in`...
+        if pandas.isna(low) or pandas.isna(high):
+            output = (op in ("!=", "not in")) and (nulls > 0)
+
+        # 2. Ranges...
+        elif op == "==":
+            output = bool(low <= value <= high)
+        elif op == "<":
+            output = bool(low < value)
+        elif op == "<=":
+            output = bool(low <= value)
+        elif op == ">":
+            output = bool(high > value)
+        elif op == ">=":
+            output = bool(high >= value)
+        elif op == "in":
+            output = any(bool(low <= item <= high) for item in value)
+
+        # 3. Only excluded when every value is the same excluded one...
+        elif op == "!=":
+            output = (nulls > 0) or (not bool(low == high == value))
+        else:
+            output = (nulls > 0) or (not any(bool(low == high == item) for item in value))
+
+        # 4. ...
+        return output or ((nulls == rows) and (op in ("!=", "not in")))
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _merge_stats(self, old: list | None, new: list) -> list | None:
+        """ Statistics of existing groups followed by those of appended ones. """
+
+        # 1. Files without statistics stay without...
+        output = None
+        if old is not None:
+            output = []
+            for before, after in zip(old, new):
+
+                # 1.1 ...
+                if (before is None) or (after is None):
+                    output.append(None)
+                    continue
+
+                # 1.2 ...
+                output.append({
+                    "min": pandas.concat([before["min"], after["min"]], ignore_index=True),
+                    "max": pandas.concat([before["max"], after["max"]], ignore_index=True),
+                    "nulls": numpy.concatenate([before["nulls"], after["nulls"]]),
+                })
+
+        # 2. ...
+        return output
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _schema(self, fp, footer: dict) -> pandas.DataFrame:
+        """
+        An empty frame with the columns, dtypes and index of a frame file. Files without one
+        in the footer take it from their first group.
+        """
+
+        # 1. ...
+        output = footer.get("schema")
+        if output is None:
+            positions = range(len(footer["columns"]))
+            output = self._read_group(fp, footer["groups"][0], positions, []).iloc[0:0]
+            output.columns = footer["columns"]
+
+        # 2. ...
+        return output
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _check_schema(self, frame: pandas.DataFrame, schema: pandas.DataFrame):
+        """ Checks that appended rows have the columns, dtypes and index levels of the file. """
+
+        # 1. Columns...
+        if not frame.columns.equals(schema.columns):
+            raise ValueError(
+                f"Columns do not match the frame file: {list(frame.columns)}. "
+                f"Expected: {list(schema.columns)}"
+            )
+
+        # 2. Dtypes...
+        mismatched = [
+            label for label, dtype, expected in zip(frame.columns, frame.dtypes, schema.dtypes)
+            if dtype != expected
+        ]
+        if mismatched:
+            raise ValueError(f"Column dtypes do not match the frame file: {mismatched}")
+
+        # 3. Index: levels, names and dtypes...
+        levels = [
+            (index.nlevels, list(index.names), [
+                index.get_level_values(level).dtype for level in range(index.nlevels)
+            ])
+            for index in (frame.index, schema.index)
+        ]
+        if levels[0] != levels[1]:
+            raise ValueError(f"Index does not match the frame file: {levels[0]}. "
+                             f"Expected: {levels[1]}")
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _collect_stats(self, frame: pandas.DataFrame, groups: list) -> list:
+        """
+        Moves the per-group statistics of the groups into one entry per column: `min` and
+        `max` as Series over the groups (in the column dtype when possible) and `nulls` as
+        an array. Columns without an order (or any group without one) get None.
+        """
+
+        # 1. ...
+        output = []
+        for pos in range(frame.shape[1]):
+            group_stats = [group["stats"][pos] for group in groups]
+
+            # 1.1 Not ordered...
+            if any(item is None for item in group_stats):
+                output.append(None)
+                continue
+
+            # 1.2 ...
+            lows, highs, nulls = zip(*group_stats)
+            output.append({
+                "min": self._stats_series(lows, frame.iloc[:, pos].dtype),
+                "max": self._stats_series(highs, frame.iloc[:, pos].dtype),
+                "nulls": numpy.asarray(nulls, dtype=numpy.int64),
+            })
+
+        # 2. ...
+        for group in groups:
+            del group["stats"]
+
+        # 3. ...
+        return output
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _stats_series(self, values: tuple, dtype) -> pandas.Series:
+        """ Statistics over the groups, in the column dtype (categories: their dtype). """
+
+        # 1. ...
+        if isinstance(dtype, pandas.CategoricalDtype):
+            dtype = dtype.categories.dtype
+
+        # 2. Missing values may not fit the dtype (e.g. int64): object then...
+        try:
+            output = pandas.Series(values, dtype=dtype)
+        except (TypeError, ValueError):
+            output = pandas.Series(values, dtype=object)
+
+        # 3. ...
+        return output
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _column_stats(self, column: pandas.Series):
+        """ `[min, max, nulls]` of a column chunk (min/max None if all missing), or None. """
+
+        # 1. Categorical: over the categories in use...
+        values = column.dropna()
+        if isinstance(column.dtype, pandas.CategoricalDtype):
+            codes = numpy.unique(column.cat.codes.to_numpy())
+            values = pandas.Series(column.cat.categories[codes[codes >= 0]])
+
+        # 2. ...
+        output = [None, None, int(len(column) - column.count())]
+        if len(values):
+            try:
+                output[0], output[1] = values.min(), values.max()
+            except (TypeError, ValueError):
+                output = None
+
+        # 3. ...
+        return output
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _write_footer(self, fp, footer: dict):
+        """ Writes the footer, then the trailer line pointing to it. """
+
+        # 1. ...
+        offset = fp.tell()
+        fp.write(self.encoder.encode_str(footer, compact=True).encode("utf-8") + b"\n")
+
+        # 2. ...
+        fp.write(_TRAILER % offset)
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _find_footer(self, fp) -> int:
+        """ Checks the header of a frame file, and returns the offset of its footer. """
+
+        # 1. Header...
+        fp.seek(0)
+        if fp.read(len(FRAME_HEADER)) != FRAME_HEADER:
+            raise ValueError("Not a Pyon frame file.")
+
+        # 2. Trailer...
+        end = fp.seek(0, os.SEEK_END)
+        fp.seek(max(end - _TRAILER_SIZE, 0))
+        trailer = fp.read(_TRAILER_SIZE)
+        prefix = _TRAILER.split(b"%")[0]
+        if not trailer.startswith(prefix):
+            raise ValueError("Invalid Pyon frame file: no footer.")
+
+        # 3. ...
+        return int(trailer[len(prefix):])
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _read_footer(self, fp) -> dict:
+        """ Finds and decodes the footer of a frame file. """
+
+        # 1. ...
+        offset = self._find_footer(fp)
+        end = fp.seek(0, os.SEEK_END)
+
+        # 2. ...
+        footer = self._read_chunk(fp, [offset, end - _TRAILER_SIZE - offset])
+        if (not isinstance(footer, dict)) or (footer.get("version") != _VERSION):
+            raise ValueError("Invalid Pyon frame file: unsupported footer.")
+
+        # 3. ...
+        return footer
+
+    # ----------------------------------------------------------------------------------------- #
+
+
+# --------------------------------------------------------------------------------------------- #
@@ -0,0 +1,324 @@
+""" Pyon: Python Object Notation - Incremental Reader """
+# --------------------------------------------------------------------------------------------- #
+
+import json
+import logging
+
+# --------------------------------------------------------------------------------------------- #
+
+from .encoder import PyonEncoder
+from .refs import RefScope
+from .sidecar import Sidecar
+from .supported_types import SupportedTypes
+from .utils import EConst
+
+# --------------------------------------------------------------------------------------------- #
+
+from . import utils as ut
+
+# --------------------------------------------------------------------------------------------- #
+
+logger = logging.getLogger(__name__)
+
+# --------------------------------------------------------------------------------------------- #
+
+# Characters read per refill (grows with the pending buffer, for large elements)...
+_READ_CHUNK_SIZE = 1 << 16
+
+# Top-level types iterated by element, and by key/value pair...
+_ITEM_TYPES = frozenset((
+    SupportedTypes.LIST.value,
+    SupportedTypes.TUPLE.value,
+    SupportedTypes.SET.value,
+    SupportedTypes.FROZENSET.value,
+    SupportedTypes.DEQUE.value,
+))
+_PAIR_TYPES = frozenset((SupportedTypes.DICT.value,))
+
+# JSON whitespace...
+_WHITESPACE = " \t\n\r"
+
+# --------------------------------------------------------------------------------------------- #
+
+
+class PyonReader():
+    """
+    Incremental reader over a Pyon document whose top level is a collection.
+
+    Scans a text file object chunk by chunk and decodes one element (or key/value pair) at a
+    time, so memory is bounded by the largest single element rather than by the document.
+    Documents written with `refs=True` also keep the objects that carry an id.
+    """
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def __init__(self, encoder: PyonEncoder, fp, sidecar: Sidecar = None):
+        """
+        Initializes a Pyon Reader
+
+        Args:
+            encoder (PyonEncoder): Decodes the elements.
+            fp: Readable text file object, positioned at the start of the document.
+            sidecar (Sidecar): Reads the external buffers of the document, if any.
+        """
+
+        # 1. ...
+        self.encoder = encoder
+        self.fp = fp
+        self.sidecar = sidecar
+
+        # 2. Pending text, and scan position in it...
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+        # 3. Plain JSON, for keys and header values...
+        self._plain = json.JSONDecoder()
+
+        # 4. Back-references may point to earlier elements: one scope for the document...
+        self._scope = RefScope()
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def __iter__(self):
+        """
+        Yields the decoded top-level elements: items of a list, tuple, set, frozenset or
+        deque, or `(key, value)` pairs of a dict.
+        """
+
+        # 1. Untagged list (native mode)...
+        char = self._peek()
+        if char == "[":
+            self._pos += 1
+            yield from self._iter_items(False)
+
+        # 2. Tagged collection, or untagged dict...
+        elif char == "{":
+            self._pos += 1
+            yield from self._iter_document()
+
+        # 3. ...
+        else:
+            raise ValueError("Not a Pyon collection: expected a top-level list or dict.")
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _iter_document(self):
+        """ Reads the tags of the top-level object, then iterates its payload. """
+
+        # 1. Empty untagged dict...
+        key = self._key()
+        if key is None:
+            return
+
+        # 2. Untagged dict (native mode): the first key is data, keys are taken as they are...
+        if key not in (EConst.TYPE, ut.SHORT_TAGS[EConst.TYPE]):
+            yield from self._iter_pairs(False, key, plain_keys=True)
+            return
+
+        # 3. Tagged collection...
+        short_tags = key != EConst.TYPE
+        value_type = self._plain_value()
+        if (value_type not in _ITEM_TYPES) and (value_type not in _PAIR_TYPES):
+            raise ValueError(f"Not a Pyon collection: top-level type '{value_type}'.")
+
+        # 4. Finds the payload, skipping other tags...
+        while self._next_member("}"):
+            key = self._key()
+            tag = ut.LONG_TAGS.get(key, key) if short_tags else key
+
+            # 1.1 Elements...
+            if (tag in (EConst.DATA, EConst.NATIVE)) and (value_type in _ITEM_TYPES):
+                self._expect("[")
+                yield from self._iter_items(short_tags)
+                return
+
+            # 1.2 Key/value pairs...
+            if (tag == EConst.DICT) and (value_type in _PAIR_TYPES):
+                self._expect("{")
+                yield from self._iter_pairs(short_tags, self._key())
+                return
+
+            # 1.3 Other tags...
+            self._plain_value()
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _iter_items(self, short_tags: bool):
+        """ Yields the decoded items of an array, the opening `[` already consumed. """
+
+        # 1. ...
+        if self._peek() == "]":
+            self._pos += 1
+            return
+
+        # 2. ...
+        yield self._value(short_tags)
+        while self._next_member("]"):
+            yield self._value(short_tags)
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _iter_pairs(self, short_tags: bool, key: str | None, plain_keys: bool = False):
+        """
+        Yields the decoded pairs of an object, from its first (already read) key. Keys of
+        untagged dicts (`plain_keys`) are not decoded.
+        """
+
+        # 1. Empty...
+        if key is None:
+            return
+
+        # 2. ...
+        decode_key = (lambda key: key) if plain_keys else self.encoder.decode_key
+        yield decode_key(key), self._value(short_tags)
+        while self._next_member("}"):
+            key = self._key()
+            yield decode_key(key), self._value(short_tags)
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _key(self) -> str | None:
+        """ Reads an object key and its `:`, or consumes `}` and returns None. """
+
+        # 1. End of object...
+        if self._peek() == "}":
+            self._pos += 1
+            return None
+
+        # 2. ...
+        key = self._plain_value()
+        if not isinstance(key, str):
+            raise ValueError(f"Invalid Pyon document: expected a key at {self._pos}.")
+        self._expect(":")
+
+        # 3. ...
+        return key
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _next_member(self, close: str) -> bool:
+        """ Consumes `,` (True: another member follows) or the closing char (False). """
+
+        # 1. ...
+        char = self._peek()
+        self._pos += 1
+
+        # 2. ...
+        if char not in (",", close):
+            raise ValueError(f"Invalid Pyon document: expected ',' or '{close}'.")
+
+        # 3. ...
+        return char == ","
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _value(self, short_tags: bool):
+        """ Decodes the next value, reading more text until it is complete. """
+
+        # 1. Each attempt starts from the scope as it was: a retry must not see the objects
+        # of an aborted one...
+        self._peek()
+        mark = self._scope.mark()
+
+        # 2. ...
+        def decode():
+            self._scope.rollback(mark)
+            return self.encoder.decode_at(
+                self._buf, self._pos, short_tags, self._scope, self.sidecar
+            )
+
+        # 3. ...
+        return self._read(decode)
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _plain_value(self):
+        """ Parses the next value as plain JSON (keys, tags). """
+
+        # 1. ...
+        self._peek()
+        return self._read(lambda: self._plain.raw_decode(self._buf, self._pos))
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _read(self, decode):
+        """ Runs `decode` on the buffer, refilling until the value is known to be complete. """
+
+        # 1. ...
+        while True:
+
+            # 1.1 A value ending at the buffer end may continue (e.g. a number)...
+            try:
+                value, end = decode()
+                if (end < len(self._buf)) or self._eof:
+                    self._pos = end
+                    return value
+
+            # 1.2 Truncated...
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+
+            # 1.3 ...
+            self._fill()
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _peek(self) -> str:
+        """ Skips whitespace and returns the next char, or "" at the end of the text. """
+
+        # 1. ...
+        while True:
+
+            # 1.1 ...
+            while (self._pos < len(self._buf)) and (self._buf[self._pos] in _WHITESPACE):
+                self._pos += 1
+
+            # 1.2 ...
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+
+            # 1.3 ...
+            if not self._fill():
+                return ""
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _expect(self, char: str):
+        """ Consumes `char`, or fails. """
+
+        # 1. ...
+        if self._peek() != char:
+            raise ValueError(f"Invalid Pyon document: expected '{char}' at {self._pos}.")
+
+        # 2. ...
+        self._pos += 1
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _fill(self) -> bool:
+        """ Drops consumed text and reads more. Returns False at the end of the file. """
+
+        # 1. ...
+        if self._eof:
+            return False
+
+        # 2. Consumed text...
+        pending = self._buf[self._pos:]
+        self._pos = 0
+
+        # 3. Reads at least as much as pending: a large element is re-scanned O(log n) times...
+        chunk = self.fp.read(max(_READ_CHUNK_SIZE, len(pending)))
+        if isinstance(chunk, (bytes, bytearray)):
+            raise TypeError("PyonReader expects a text file object.")
+        self._buf = pending + chunk
+        self._eof = not chunk
+
+        # 4. ...
+        return not self._eof
+
+    # ----------------------------------------------------------------------------------------- #
+
+
+# --------------------------------------------------------------------------------------------- #
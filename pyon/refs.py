@@ -0,0 +1,286 @@
+""" Pyon: Python Object Notation - Shared and Cyclic References """
+# --------------------------------------------------------------------------------------------- #
+
+import logging
+
+# --------------------------------------------------------------------------------------------- #
+
+from collections import ChainMap, deque
+from datetime import date, time
+from decimal import Decimal
+from enum import Enum
+from uuid import UUID
+
+# --------------------------------------------------------------------------------------------- #
+
+logger = logging.getLogger(__name__)
+
+# --------------------------------------------------------------------------------------------- #
+
+# Value types: never tracked, written in full at each occurrence...
+_UNTRACKED = (
+    int, float, str, bool, type(None), complex, Decimal, date, time, UUID, bytes, Enum, type
+)
+
+# --------------------------------------------------------------------------------------------- #
+
+_MISSING = object()
+
+# --------------------------------------------------------------------------------------------- #
+
+
+class Ref():
+    """ Placeholder for a back-reference to an object that is still being decoded (a cycle). """
+
+    __slots__ = ("ref_id",)
+
+    def __init__(self, ref_id: int):
+        self.ref_id = ref_id
+
+    def __repr__(self):
+        return f"Ref({self.ref_id})"
+
+
+# --------------------------------------------------------------------------------------------- #
+
+
+class RefScope():
+    """
+    Object identities of one encode or decode call.
+
+    Encode: `id(obj)` -> `(obj, ref_id)`; objects are kept alive, so ids are not reused.
+    Decode: `ref_id` -> decoded object; back-references to objects not yet complete (cycles)
+    get a `Ref` placeholder, patched in place when the object completes.
+    """
+
+    # ----------------------------------------------------------------------------------------- #
+
+    __slots__ = ("objects", "next_id", "referenced", "pending", "tainted")
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def __init__(self):
+        """ Initializes an empty scope """
+
+        # 1. Encode: ids written as back-references too...
+        self.objects = {}
+        self.next_id = 0
+        self.referenced = set()
+
+        # 2. Decode: ids with placeholders, and decoded objects holding placeholders...
+        self.pending = set()
+        self.tainted = {}
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def lookup(self, value) -> int | None:
+        """ Encode: the id of an already written object, or None. """
+
+        # 1. ...
+        output = None
+        entry = self.objects.get(id(value))
+        if entry is not None:
+            output = entry[1]
+            self.referenced.add(output)
+
+        # 2. ...
+        return output
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def add(self, value) -> int:
+        """ Encode: records an object about to be written, and returns its new id. """
+
+        # 1. ...
+        ref_id = self.next_id
+        self.next_id += 1
+        self.objects[id(value)] = (value, ref_id)
+
+        # 2. ...
+        return ref_id
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def remove(self, value, ref_id: int):
+        """
+        Encode: forgets an object that was not written as a tagged node (no `__id__`).
+
+        Raises:
+            ValueError: If back-references to it were already written (a cycle through it).
+        """
+
+        # 1. ...
+        del self.objects[id(value)]
+        if ref_id in self.referenced:
+            raise ValueError(f"Cyclic reference through an untagged {type(value)}.")
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def resolve(self, ref_id: int):
+        """ Decode: the object for a back-reference, or a placeholder if it is not complete. """
+
+        # 1. ...
+        output = self.objects.get(ref_id, _MISSING)
+        if output is _MISSING:
+            self.pending.add(ref_id)
+            output = Ref(ref_id)
+
+        # 2. ...
+        return output
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def register(self, ref_id: int, value):
+        """ Decode: records a completed object and patches the placeholders waiting for it. """
+
+        # 1. ...
+        self.objects[ref_id] = value
+
+        # 2. Cycle: its placeholders are inside its own subtree...
+        if ref_id in self.pending:
+            self.pending.discard(ref_id)
+            self._patch(value)
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def mark(self) -> tuple:
+        """ Decode: the current state, to `rollback` to if a decode is abandoned. """
+
+        # 1. Objects and taints are only added: their counts are enough...
+        return (len(self.objects), len(self.tainted), set(self.pending))
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def rollback(self, mark: tuple):
+        """ Decode: forgets what was recorded since `mark` (dicts pop their newest items). """
+
+        # 1. ...
+        objects, tainted, pending = mark
+        while len(self.objects) > objects:
+            self.objects.popitem()
+        while len(self.tainted) > tainted:
+            self.tainted.popitem()
+        self.pending = pending
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def taint(self, node: dict, value):
+        """ Decode: marks `value` if the raw `node` it was built from holds placeholders. """
+
+        # 1. Direct children, and the items of payload lists and dicts...
+        for child in node.values():
+            if (
+                self._is_tainted(child)
+                or ((type(child) is list) and any(map(self._is_tainted, child)))
+                or ((type(child) is dict) and any(map(self._is_tainted, child.values())))
+            ):  # pylint: disable=unidiomatic-typecheck
+
+                # 1.1 ...
+                self.tainted[id(value)] = value
+                break
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _is_tainted(self, value) -> bool:
+        """ If `value` is a placeholder or holds one. """
+
+        # 1. ...
+        return (
+            (type(value) is Ref)  # pylint: disable=unidiomatic-typecheck
+            or (id(value) in self.tainted)
+        )
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _patch(self, root):
+        """ Replaces resolvable placeholders along the tainted paths below `root`. """
+
+        # 1. ...
+        stack = [root]
+        seen = set()
+        while stack:
+
+            # 1.1 ...
+            value = stack.pop()
+            if id(value) in seen:
+                continue
+            seen.add(id(value))
+
+            # 1.2 Lists, deques: in place...
+            if isinstance(value, (list, deque)):
+                for pos, item in enumerate(value):
+                    value[pos] = self._patch_item(item, stack)
+
+            # 1.3 Dictionaries: values in place...
+            elif isinstance(value, dict):
+                for key, item in value.items():
+                    value[key] = self._patch_item(item, stack)
+
+            # 1.4 Sets: placeholders are swapped...
+            elif isinstance(value, set):
+                self._patch_set(value, stack)
+
+            # 1.5 ChainMap...
+            elif isinstance(value, ChainMap):
+                stack.extend(value.maps)
+
+            # 1.6 Immutable sequences cannot be patched...
+            elif isinstance(value, (tuple, frozenset)):
+                for item in value:
+                    if type(item) is Ref:  # pylint: disable=unidiomatic-typecheck
+                        raise ValueError(f"Cyclic reference through an immutable {type(value)}.")
+                    if id(item) in self.tainted:
+                        stack.append(item)
+
+            # 1.7 Objects: their attributes...
+            elif isinstance(getattr(value, "__dict__", None), dict):
+                stack.append(value.__dict__)
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _patch_item(self, item, stack: list):
+        """ Returns the resolved item, queueing tainted children. """
+
+        # 1. Placeholder...
+        output = item
+        if type(item) is Ref:  # pylint: disable=unidiomatic-typecheck
+            output = self.objects.get(item.ref_id, item)
+
+        # 2. Holds placeholders...
+        elif id(item) in self.tainted:
+            stack.append(item)
+
+        # 3. ...
+        return output
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _patch_set(self, value: set, stack: list):
+        """ Swaps resolvable placeholders in a set; targets must be hashable. """
+
+        # 1. ...
+        for item in list(value):
+            resolved = self._patch_item(item, stack)
+
+            # 1.1 ...
+            if resolved is not item:
+                try:
+                    value.add(resolved)
+                    value.discard(item)
+                except TypeError:
+                    logger.error("Cyclic reference to an unhashable set item: %s", type(resolved))
+
+    # ----------------------------------------------------------------------------------------- #
+
+
+# --------------------------------------------------------------------------------------------- #
+
+
+def is_tracked(cls: type) -> bool:
+    """ If instances of `cls` get identities: containers and objects, not value types. """
+
+    # 1. ...
+    return not issubclass(cls, _UNTRACKED)
+
+
+# --------------------------------------------------------------------------------------------- #
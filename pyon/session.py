@@ -0,0 +1,443 @@
+""" Pyon: Python Object Notation - Session """
+# --------------------------------------------------------------------------------------------- #
+
+import logging
+import os
+import threading
+
+# --------------------------------------------------------------------------------------------- #
+
+from contextlib import nullcontext
+from io import TextIOWrapper
+
+# --------------------------------------------------------------------------------------------- #
+
+from .binary import BINARY_MAGIC
+from .compression import CODECS, open_reader, open_writer
+from .encoder import PyonEncoder
+from .frame import FrameStore
+from .frame.store import ROW_GROUP_SIZE
+from .reader import PyonReader
+from .sidecar import Sidecar
+
+# --------------------------------------------------------------------------------------------- #
+
+logger = logging.getLogger(__name__)
+
+# --------------------------------------------------------------------------------------------- #
+
+# Output formats: JSON text, or the binary container...
+_FORMATS = ("text", "binary")
+
+# --------------------------------------------------------------------------------------------- #
+
+
+class Pyon:
+    """
+    Reusable Pyon session.
+
+    Holds one `PyonEncoder`, so its dispatch tables and per-class caches stay warm across
+    calls. Use `Pyon.get()` for the shared instance of a flag combination; the module-level
+    `pyon.encode`, `pyon.decode`, `pyon.to_file` and `pyon.from_file` route through it.
+    """
+
+    # ----------------------------------------------------------------------------------------- #
+
+    _sessions: dict = {}
+    _lock = threading.Lock()
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def __init__(
+        self,
+        enc_protected: bool = False,
+        enc_private: bool = False,
+        native: bool = False,
+        refs: bool = False,
+    ):
+        """
+        Initializes a Pyon session.
+
+        Args:
+            enc_protected (bool): Whether to encode protected attributes.
+            enc_private (bool): Whether to encode private attributes.
+            native (bool): Writes subtrees made only of JSON-native types untagged.
+            refs (bool): Writes shared and cyclic references once, then as back-references.
+        """
+
+        # 1. ...
+        self.enc_protected = enc_protected
+        self.enc_private = enc_private
+        self.native = native
+        self.refs = refs
+
+        # 2. ...
+        self.encoder = PyonEncoder(
+            enc_protected=enc_protected, enc_private=enc_private, native=native, refs=refs
+        )
+        self.frames = FrameStore(self.encoder)
+
+    # ----------------------------------------------------------------------------------------- #
+
+    @classmethod
+    def get(
+        cls,
+        enc_protected: bool = False,
+        enc_private: bool = False,
+        native: bool = False,
+        refs: bool = False,
+    ) -> "Pyon":
+        """
+        Returns the shared session for a flag combination, creating it on first use.
+
+        Args:
+            enc_protected (bool): Whether to encode protected attributes.
+            enc_private (bool): Whether to encode private attributes.
+            native (bool): Writes subtrees made only of JSON-native types untagged.
+            refs (bool): Writes shared and cyclic references once, then as back-references.
+
+        Returns:
+            Pyon: The cached session.
+        """
+
+        # 1. ...
+        key = (bool(enc_protected), bool(enc_private), bool(native), bool(refs))
+        session = cls._sessions.get(key)
+
+        # 2. ...
+        if session is None:
+            with cls._lock:
+
+                # 1.1 Another thread may have created it meanwhile...
+                session = cls._sessions.get(key)
+                if session is None:
+                    session = cls(*key)
+                    cls._sessions[key] = session
+
+        # 3. ...
+        return session
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def encode(
+        self,
+        obj,
+        compact: bool = False,
+        short_tags: bool = False,
+        format: str = "text",  # pylint: disable=redefined-builtin
+    ) -> str | bytes | None:
+        """
+        Encodes a Python object into a Pyon-formatted string.
+
+        Args:
+            obj: The Python object to encode.
+            compact (bool): Minimal separators and no indentation.
+            short_tags (bool): Writes short tags (`~T`, `~D`, ...) instead of `__type__`, ...
+            format (str): `text`, or `binary` for the binary container (returns bytes).
+
+        Returns:
+            str, bytes or None: The encoded Pyon document, or None if obj is None.
+        """
+
+        # 1. ...
+        output = None
+        if (obj is not None) and self._is_binary(format):
+            output = self.encoder.encode_bytes(obj)
+        elif obj is not None:
+            output = self.encoder.encode_str(obj, compact=compact, short_tags=short_tags)
+
+        # 2. ...
+        return output
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def decode(self, pyon_str: str | bytes | None):
+        """
+        Decodes a Pyon-formatted string into a Python object.
+
+        Args:
+            pyon_str (str | bytes | None): The Pyon document to decode: text, UTF-8 bytes,
+                or a binary container document.
+
+        Returns:
+            The decoded Python object, or None if pyon_str is None.
+        """
+
+        # 1. Binary container...
+        output = None
+        if isinstance(pyon_str, (bytes, bytearray, memoryview)):
+            if bytes(pyon_str[:len(BINARY_MAGIC)]) == BINARY_MAGIC:
+                output = self.encoder.decode_bytes(pyon_str)
+            else:
+                output = self.encoder.decode_str(bytes(pyon_str).decode("utf-8"))
+
+        # 2. Text...
+        elif pyon_str is not None:
+            output = self.encoder.decode_str(pyon_str)
+
+        # 3. ...
+        return output
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def dump(
+        self,
+        obj,
+        fp,
+        compact: bool = False,
+        short_tags: bool = False,
+        format: str = "text",  # pylint: disable=redefined-builtin
+    ):
+        """
+        Encodes a Python object and writes it to a file object, chunk by chunk.
+
+        Args:
+            obj: The Python object to encode.
+            fp: Writable text or binary file object (file, pipe, socket file, `BytesIO`...).
+            compact (bool): Minimal separators and no indentation.
+            short_tags (bool): Writes short tags (`~T`, `~D`, ...) instead of `__type__`, ...
+            format (str): `text`, or `binary` for the binary container (binary file objects).
+        """
+
+        # 1. ...
+        binary = self._is_binary(format)
+        if not self.encoder.dump(obj, fp, compact=compact, short_tags=short_tags, binary=binary):
+            raise ValueError(f"Object could not be encoded: '{type(obj).__name__}'")
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def load(self, fp):
+        """
+        Reads and decodes a Pyon document from a file object.
+
+        Args:
+            fp: Readable text or binary file object (UTF-8 text, or the binary container).
+
+        Returns:
+            The decoded Python object, or None if the file object is empty.
+        """
+
+        # 1. ...
+        return self.encoder.load(fp)
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def to_file(
+        self,
+        obj,
+        file_path: str = "./data.pyon",
+        verbose: bool = True,
+        compact: bool = False,
+        short_tags: bool = False,
+        extern_threshold: int | None = None,
+        format: str = "text",  # pylint: disable=redefined-builtin
+        compression: str | None = None,
+    ):
+        """
+        Saves to file, streaming the text. Returns the file path (0.2.6 and earlier: the text).
+
+        With `extern_threshold`, buffers (arrays, bytes...) larger than it, in bytes, are
+        written as raw files in a `<file>.d` directory next to the document, which only
+        references them. Buffer files of a previous write are removed. With `format` set to
+        `binary`, the binary container is written instead of text. With `compression`
+        (`gzip`, `bz2`, `lzma` or `zlib`), the document is compressed as it is written, in
+        blocks compressed in parallel; buffer files stay uncompressed.
+        """
+
+        # 1. ...
+        if (obj is None) or (not file_path):
+            raise ValueError(f"Not a valid pyon output file: '{file_path}'")
+        if (compression is not None) and (compression not in CODECS):
+            raise ValueError(f"Invalid compression: '{compression}'. Expected one of: {CODECS}")
+        binary = self._is_binary(format)
+
+        # 2. ...
+        directory = os.path.dirname(file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # 3. ...
+        sidecar = Sidecar(file_path, threshold=extern_threshold)
+        sidecar.clear()
+        try:
+            with (
+                open(file_path, "wb") as file,
+                open_writer(file, compression) if compression else nullcontext(file) as fp,
+            ):
+                if not self.encoder.dump(
+                    obj, fp, compact=compact, short_tags=short_tags, sidecar=sidecar,
+                    binary=binary,
+                ):
+                    raise ValueError(f"Object could not be encoded: '{type(obj).__name__}'")
+
+        # 4. Does not leave partial files behind...
+        except BaseException:
+            if os.path.isfile(file_path):
+                os.remove(file_path)
+            sidecar.clear()
+            raise
+
+        # 5. ...
+        if verbose:
+            logger.info("Data saved at %s", file_path)
+
+        # 6. ...
+        return file_path
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def from_file(self, file_path: str, mmap: bool = False):
+        """
+        Loads and decodes a Pyon-formatted file into a Python object.
+
+        Args:
+            file_path (str): The path to the Pyon file: text, binary container or frame
+                file, compressed or not (detected by their magic bytes).
+            mmap (bool): Maps external buffers (see `to_file`) instead of reading them:
+                arrays are backed by the files, and pages are read on access. Writes to
+                them stay in memory.
+
+        Returns:
+            The decoded Python object, or None if the file does not exist or is invalid.
+        """
+
+        # 1. ...
+        output = None
+        if os.path.isfile(file_path):
+
+            # 1.1 Chunked frame files...
+            if self.frames.is_frame_file(file_path):
+                output = self.frames.read(file_path)
+
+            # 1.2 ...
+            else:
+                with open(file=file_path, mode="rb") as file, open_reader(file) as stream:
+                    output = self.encoder.load(stream, sidecar=Sidecar(file_path, use_mmap=mmap))
+
+        # 2. ...
+        return output
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def write_frame(self, frame, file_path: str, row_group_size: int = ROW_GROUP_SIZE):
+        """
+        Writes a DataFrame as a chunked frame file: row groups, each with one chunk per
+        column, readable in part with `read_frame`. Returns the file path.
+
+        Args:
+            frame (pandas.DataFrame): The frame to write.
+            file_path (str): The output path.
+            row_group_size (int): Rows per group.
+        """
+
+        # 1. ...
+        self.frames.write(frame, file_path, row_group_size=row_group_size)
+
+        # 2. ...
+        return file_path
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def append_frame(self, frame, file_path: str, row_group_size: int = ROW_GROUP_SIZE):
+        """
+        Appends rows to a frame file as new groups, writing only them and the footer.
+        Returns the file path.
+
+        Args:
+            frame (pandas.DataFrame): The rows to append, with the columns, dtypes and index
+                levels of the file.
+            file_path (str): The frame file; written as new if missing.
+            row_group_size (int): Rows per new group.
+        """
+
+        # 1. ...
+        self.frames.append(frame, file_path, row_group_size=row_group_size)
+
+        # 2. ...
+        return file_path
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def compact_frame(self, file_path: str, row_group_size: int = ROW_GROUP_SIZE):
+        """
+        Rewrites a frame file with its groups merged into groups of `row_group_size` rows.
+        Returns the file path.
+
+        Args:
+            file_path (str): The frame file.
+            row_group_size (int): Rows per group.
+        """
+
+        # 1. ...
+        self.frames.compact(file_path, row_group_size=row_group_size)
+
+        # 2. ...
+        return file_path
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def read_frame(
+        self,
+        file_path: str,
+        columns: list | None = None,
+        rows: slice | None = None,
+        filters: list | None = None,
+    ):
+        """
+        Reads columns and rows of a frame file, decoding only the chunks that hold them.
+
+        Args:
+            file_path (str): The frame file.
+            columns (list | None): Column labels, in the order wanted. All if None.
+            rows (slice | None): Row positions. All if None.
+            filters (list | None): `(column, op, value)` conditions rows must all meet.
+
+        Returns:
+            pandas.DataFrame: The selected part of the frame.
+        """
+
+        # 1. ...
+        return self.frames.read(file_path, columns=columns, rows=rows, filters=filters)
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def iter_file(self, file_path: str, mmap: bool = False):
+        """
+        Iterates a Pyon file whose top level is a collection, decoding one entry at a time.
+
+        Args:
+            file_path (str): The path to the Pyon file.
+            mmap (bool): Maps external buffers instead of reading them.
+
+        Yields:
+            The elements of a top-level list, tuple, set, frozenset or deque, or the
+            `(key, value)` pairs of a top-level dict.
+        """
+
+        # 1. Decompressed as it is read...
+        with open(file=file_path, mode="rb") as file, open_reader(file) as stream:
+
+            # 1.1 Text only...
+            if stream.peek(len(BINARY_MAGIC))[:len(BINARY_MAGIC)] == BINARY_MAGIC:
+                raise ValueError("Binary Pyon files cannot be iterated: use `from_file`.")
+
+            # 1.2 ...
+            with TextIOWrapper(stream, encoding="utf-8") as text:
+                yield from PyonReader(self.encoder, text, Sidecar(file_path, use_mmap=mmap))
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def _is_binary(self, format: str) -> bool:  # pylint: disable=redefined-builtin
+        """ Checks an output format; True for the binary container. """
+
+        # 1. ...
+        if format not in _FORMATS:
+            raise ValueError(f"Invalid format: '{format}'. Expected one of: {_FORMATS}")
+
+        # 2. ...
+        return format == "binary"
+
+    # ----------------------------------------------------------------------------------------- #
+
+
+# --------------------------------------------------------------------------------------------- #
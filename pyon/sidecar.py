@@ -0,0 +1,151 @@
+""" Pyon: Python Object Notation - Out-of-band Buffer Storage """
+# --------------------------------------------------------------------------------------------- #
+
+import logging
+import mmap
+import os
+import re
+
+# --------------------------------------------------------------------------------------------- #
+
+from .utils import EConst
+
+# --------------------------------------------------------------------------------------------- #
+
+logger = logging.getLogger(__name__)
+
+# --------------------------------------------------------------------------------------------- #
+
+# Bundle directory next to the document, and the names of the buffer files in it...
+_BUNDLE_SUFFIX = ".d"
+_BUFFER_NAME = re.compile(r"^\d+\.bin$")
+
+# --------------------------------------------------------------------------------------------- #
+
+
+class Sidecar():
+    """
+    Stores large buffers of a document outside of it, in a bundle directory.
+
+    `data.pyon` keeps its buffers above `threshold` bytes in `data.pyon.d/0.bin`,
+    `data.pyon.d/1.bin`, ..., referenced in the text as `{"__extern__": "data.pyon.d/0.bin"}`.
+    Files hold the raw bytes at offset 0, so they can be memory-mapped on load.
+    """
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def __init__(self, file_path: str, threshold: int | None = None, use_mmap: bool = False):
+        """
+        Initializes the storage of one document.
+
+        Args:
+            file_path (str): The document path.
+            threshold (int | None): Encode: buffers larger than this (bytes) are written
+                out; None keeps them all inline.
+            use_mmap (bool): Decode: maps the buffer files (copy-on-write) instead of
+                reading them.
+        """
+
+        # 1. ...
+        if (threshold is not None) and (threshold < 0):
+            raise ValueError(f"Invalid sidecar threshold: {threshold}")
+
+        # 2. ...
+        self.base_dir = os.path.dirname(file_path)
+        self.bundle = os.path.basename(file_path) + _BUNDLE_SUFFIX
+        self.threshold = threshold
+        self.use_mmap = use_mmap
+        self.count = 0
+
+    # ----------------------------------------------------------------------------------------- #
+
+    @property
+    def bundle_dir(self) -> str:
+        """ The bundle directory. """
+        return os.path.join(self.base_dir, self.bundle)
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def accepts(self, nbytes: int) -> bool:
+        """ If a buffer of `nbytes` goes to a sidecar file. """
+
+        # 1. ...
+        return (self.threshold is not None) and (nbytes > self.threshold)
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def write(self, data) -> dict:
+        """ Writes a buffer to the next file of the bundle. Returns its reference. """
+
+        # 1. ...
+        os.makedirs(self.bundle_dir, exist_ok=True)
+        name = f"{self.count}.bin"
+        self.count += 1
+
+        # 2. ...
+        with open(os.path.join(self.bundle_dir, name), "wb") as file:
+            file.write(data)
+
+        # 3. ...
+        return {EConst.EXTERN: f"{self.bundle}/{name}"}
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def read(self, value: dict):
+        """ Returns the buffer of a reference: a mapped `memoryview`, or a `bytearray`. """
+
+        # 1. Only relative paths below the document directory...
+        output = None
+        ref = value.get(EConst.EXTERN)
+        path = os.path.normpath(ref) if isinstance(ref, str) else ""
+        if path and (not os.path.isabs(path)) and (path.split(os.sep)[0] != os.pardir):
+
+            # 1.1 ...
+            try:
+                with open(os.path.join(self.base_dir, path), "rb") as file:
+                    size = os.fstat(file.fileno()).st_size
+
+                    # 2.1 Mapped: pages are read on access; writes stay private...
+                    if self.use_mmap and size:
+                        output = memoryview(
+                            mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY)
+                        )
+
+                    # 2.2 ...
+                    else:
+                        output = bytearray(size)
+                        file.readinto(output)
+
+            # 1.2 ...
+            except OSError as err:
+                logger.error("Sidecar buffer could not be read: %s (%s)", ref, err)
+
+        # 2. ...
+        else:
+            logger.error("Invalid sidecar reference: %s", ref)
+
+        # 3. ...
+        return output
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def clear(self):
+        """
+        Removes the buffer files of a previous write. Files are unlinked, so arrays still
+        mapped from them stay valid.
+        """
+
+        # 1. ...
+        if os.path.isdir(self.bundle_dir):
+            for name in os.listdir(self.bundle_dir):
+                if _BUFFER_NAME.match(name):
+                    os.remove(os.path.join(self.bundle_dir, name))
+
+            # 1.1 Only if empty...
+            if not os.listdir(self.bundle_dir):
+                os.rmdir(self.bundle_dir)
+
+    # ----------------------------------------------------------------------------------------- #
+
+
+# --------------------------------------------------------------------------------------------- #
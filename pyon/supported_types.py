@@ -28,10 +28,12 @@ class SupportedTypes(Enum):
     DEQUE = "deque"
     DICT = "dict"
     ENUM = "enum"
+    EXTARRAY = "extarray"
     FILE = "file"
     FLAG = "flag"
     FLOAT = "float"
     FROZENSET = "frozenset"
+    INDEX = "index"
     INT = "int"
     INTENUM = "intenum"
     LIST = "list"
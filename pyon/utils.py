@@ -17,6 +17,12 @@ PYON_EXT = "pyon"
 
 # --------------------------------------------------------------------------------------------- #
 
+# Resolved classes and qualified names, shared by every encoder...
+_CLASSES: dict[str, type] = {}
+_CLASS_NAMES: dict[tuple[type, bool], str] = {}
+
+# --------------------------------------------------------------------------------------------- #
+
 
 class EConst:
     """ Constants used for encoding e decoding data in pyon source. """
@@ -31,9 +37,35 @@ class EConst:
     CLASS = "__class__"
     DATA = "__data__"
     DICT = "__dict__"
+    EXTERN = "__extern__"
+    ID = "__id__"
+    NATIVE = "__native__"
+    REF = "__ref__"
     TYPE = "__type__"
     FIELDS = "_fields"
+    KEY = "~"
+
+
+# --------------------------------------------------------------------------------------------- #
 
+# Short-tag dialect: two-character keys, never produced by `~` encoded dictionary keys...
+SHORT_TAGS = {
+    EConst.TYPE: "~T",
+    EConst.CLASS: "~C",
+    EConst.DATA: "~D",
+    EConst.DICT: "~O",
+    EConst.NATIVE: "~N",
+    EConst.ID: "~I",
+    EConst.REF: "~R",
+    EConst.AUX1: "~a",
+    EConst.AUX2: "~b",
+    EConst.AUX3: "~c",
+    EConst.AUX4: "~d",
+    EConst.AUX5: "~e",
+    EConst.AUX6: "~f",
+    EConst.AUX7: "~g",
+}
+LONG_TAGS = {short: long for long, short in SHORT_TAGS.items()}
 
 # --------------------------------------------------------------------------------------------- #
 
@@ -59,19 +91,21 @@ def get_class_name(obj):
         str: A string representing the fully qualified class name, including the module name.
     """
 
-    # 1. ...
-    module, name = None, None
+    # 1. Classes use the qualified name, instances the class name...
+    is_class = isinstance(obj, type)
+    cls = obj if is_class else obj.__class__
 
-    # 2. ...
-    if isinstance(obj, type):
-        module, name = f"{obj.__module__}", f"{obj.__qualname__}"
+    # 2. Cached per class...
+    output = _CLASS_NAMES.get((cls, is_class))
+    if output is None:
 
-    # 3. ...
-    else:
-        module, name = f"{obj.__class__.__module__}", f"{obj.__class__.__name__}"
+        # 1.1 ...
+        name = cls.__qualname__ if is_class else cls.__name__
+        output = f"{cls.__module__}.{name}"
+        _CLASS_NAMES[(cls, is_class)] = output
 
-    # 4. ...
-    return f"{module}.{name}"
+    # 3. ...
+    return output
 
 
 # --------------------------------------------------------------------------------------------- #
@@ -94,17 +128,19 @@ def get_class(obj):
 
         # 1.1 ...
         class_name = obj[EConst.CLASS]
-        if "." in class_name:
+        cls = _CLASSES.get(class_name)
+        if (cls is None) and isinstance(class_name, str) and ("." in class_name):
 
             # 2.1 ...
             try:
 
                 # 3.1 ...
-                module_name, class_name = class_name.rsplit(".", 1)
+                module_name, attr_name = class_name.rsplit(".", 1)
                 module = importlib.import_module(module_name)
 
-                # 3.2 ...
-                cls = getattr(module, class_name)
+                # 3.2 Only successful lookups are cached...
+                cls = getattr(module, attr_name)
+                _CLASSES[class_name] = cls
 
             # 2.2 ...
             except (ModuleNotFoundError, AttributeError):
@@ -133,6 +133,28 @@ class TestPyonEncodeDecode:
 
     # ----------------------------------------------------------------------------------------- #
 
+    @pytest.mark.parametrize("endian", ["big", "little"])
+    @pytest.mark.parametrize("size", [0, 1, 7, 8, 9, 1001])
+    def test_bitarray_packed(self, endian, size):
+        """ Bitarrays are packed into bytes, with bit order and padding. """
+
+        # 1. Prepare...
+        value = bitarray([(i * 7) % 3 == 0 for i in range(size)], endian=endian)
+
+        # 2. Encode: base64 of the bytes, not one character per bit...
+        encoded = pyon.encode(value)
+        assert (size < 64) or (value.to01()[:64] not in encoded)
+
+        # 3. Decode...
+        decoded = pyon.decode(encoded)
+        assert (decoded == value) and (decoded.tobytes() == value.tobytes())
+
+        # 4. Legacy: a string of 0s and 1s...
+        legacy = '{"__type__": "bitarray", "__data__": "%s"}' % value.to01()
+        assert pyon.decode(legacy) == value
+
+    # ----------------------------------------------------------------------------------------- #
+
     @pytest.mark.parametrize("value", [bytearray(b"hello"), None, "invalid", 10, 3.14])
 
     def test_bytearray(self, value: bytearray | None | float | Literal['invalid'] | Literal[10]):
@@ -273,6 +295,73 @@ class TestPyonEncodeDecode:
 
     # ----------------------------------------------------------------------------------------- #
 
+    @pytest.mark.parametrize(
+        "value",
+        [
+            {"plain": 1, "~tilde": 2, "~~double": 3},
+            {1: "int", 2.5: "float", None: "none", True: "bool"},
+            {(1, "a"): "tuple", Color.RED: "enum", date(2025, 1, 1): "date"},
+            Counter({1: 2, "a": 3}),
+            defaultdict(list, {(1, 2): [3]}),
+        ]
+    )
+    def test_dict_keys(self, value: dict):
+        """ Test encoding and decoding of dictionary keys. """
+
+        # 1. Encode, Decode...
+        encoded = pyon.encode(value)
+        decoded = pyon.decode(encoded)
+
+        # 2. Asserts: string keys are written as they are...
+        assert isinstance(encoded, str)
+        for key in value:
+            if isinstance(key, str) and not key.startswith("~"):
+                assert f'"{key}"' in encoded
+
+        # 3. Asserts: decoded...
+        assert type(decoded) is type(value)
+        assert decoded == value
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def test_dict_keys_json(self):
+        """ Test string keys that may read as JSON texts (0.2.6 keys) are written tagged. """
+
+        # 1. Encode, Decode...
+        value = {"2": 1, "true": 2, '"q"': 3, "-1.5": 4, "2024-01-01": 5, "name": 6, "~x": 7}
+        encoded = pyon.encode(value, compact=True)
+
+        # 2. Asserts...
+        assert '"~\\"2\\""' in encoded and '"~\\"2024-01-01\\""' in encoded
+        assert '"name"' in encoded and '"~~x"' in encoded
+        assert pyon.decode(encoded) == value
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def test_dict_keys_legacy(self):
+        """ Test keys written by 0.2.6 (JSON texts) still decode. """
+
+        # 1. Written by the 0.2.6 encoder...
+        decoded = pyon.from_file("./tests/data/keys_0.2.6.pyon")
+
+        # 2. Asserts...
+        assert decoded == {
+            "a": 1,
+            2: (1, 2),
+            (1, "b"): "tuple key",
+            1.5: None,
+            True: "bool key",
+            date(2024, 1, 2): "date key",
+            "~x": "tilde",
+            "2": "digit string",
+            "nested": {"x": [1, 2], 3: {"y": "z"}},
+            "counter": Counter({"a": 2, "1": 1, "~x": 3}),
+            "defaultdict": defaultdict(list, {"k": [1], "~y": [2]}),
+            "chainmap": ChainMap({"a": 1}, {"c": "b", "~z": 4}),
+        }
+
+    # ----------------------------------------------------------------------------------------- #
+
     @pytest.mark.parametrize("value", [Color.RED, None, "invalid", 10, 3.14])
 
     def test_enum(self, value: None | Color | str | int | float):
@@ -441,6 +530,55 @@ class TestPyonEncodeDecode:
 
     # ----------------------------------------------------------------------------------------- #
 
+    @pytest.mark.parametrize(
+        "value",
+        [
+            np.arange(6, dtype=np.float32).reshape(2, 3),
+            np.arange(256, dtype=np.uint8),
+            np.arange(6, dtype=">i4").reshape(3, 2),
+            np.asfortranarray(np.arange(12.0).reshape(3, 4)),
+            np.arange(20)[::3],
+            np.array(["2024-01-01", "NaT"], dtype="datetime64[ns]"),
+            np.array([True, False, True]),
+            np.array([1 + 2j, 3 - 4j]),
+            np.array(["ab", "cde"]),
+            np.zeros((0, 3)),
+            np.array([(1, (2.0, 3.0))], dtype=[("a", "<i4"), ("b", "<f8", (2,))]),
+        ],
+    )
+
+    def test_ndarray_buffer(self, value: NDArray):
+        """ Test ndarrays encoded as raw buffers keep dtype, shape and memory order. """
+
+        # 1. Encode, Decode...
+        encoded = pyon.encode(value)
+        decoded = pyon.decode(encoded)
+
+        # 2. Asserts: dtype, shape, order...
+        assert decoded.dtype == value.dtype
+        assert decoded.shape == value.shape
+        assert decoded.flags.f_contiguous == (value.flags.f_contiguous and value.ndim > 1) \
+            or (value.ndim < 2)
+        assert decoded.flags.writeable
+
+        # 3. Asserts: values (NaT compares unequal)...
+        assert value.tobytes() == decoded.tobytes()
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def test_ndarray_legacy(self):
+        """ Test ndarrays written as nested lists, and object arrays, still decode. """
+
+        # 1. Legacy format...
+        legacy = '{"__type__": "ndarray", "__aux1__": [2, 2], "__data__": [1, 2, 3, 4]}'
+        assert np.array_equal(pyon.decode(legacy), np.array([[1, 2], [3, 4]]))
+
+        # 2. Object arrays: nested lists...
+        value = np.array([1, "a", None], dtype=object)
+        assert list(pyon.decode(pyon.encode(value))) == [1, "a", None]
+
+    # ----------------------------------------------------------------------------------------- #
+
     @pytest.mark.parametrize(
         "value",
         [
@@ -562,6 +700,192 @@ class TestPyonEncodeDecode:
 
     # ----------------------------------------------------------------------------------------- #
 
+    @pytest.mark.parametrize(
+        "value",
+        [
+            pd.DataFrame({
+                "f32": np.arange(4, dtype=np.float32),
+                "i8": np.arange(4, dtype=np.int8),
+                "u64": np.arange(4, dtype=np.uint64),
+                "bool": [True, False, True, False],
+                "ts": pd.date_range("2024-01-01", periods=4, freq="h"),
+                "td": pd.to_timedelta([1, 2, 3, 4], unit="s"),
+                "str": ["a", "b", None, "~d"],
+                "obj": [Decimal("1.5"), (1, 2), "x", 3],
+            }),
+            pd.DataFrame([[1, 2.5], [3, 4.5]], columns=["a", "a"]),
+            pd.DataFrame({"a": pd.Series([], dtype=np.int32)}),
+            pd.DataFrame(index=[1, 2, 3]),
+        ],
+    )
+
+    def test_dataframe_columnar(self, value: pd.DataFrame):
+        """ Test DataFrames are written column by column, keeping numpy dtypes. """
+
+        # 1. Encode, Decode...
+        encoded = pyon.encode(value, compact=True)
+        decoded = pyon.decode(encoded)
+
+        # 2. Asserts: no per-row records...
+        assert '"__type__":"dict"' not in encoded
+
+        # 3. Asserts: decoded...
+        pd.testing.assert_frame_equal(decoded, value)
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def test_dataframe_records(self):
+        """ Test DataFrames written as row records by 0.2.6 still decode. """
+
+        # 1. Written by the 0.2.6 encoder: records with JSON-text keys...
+        decoded = pyon.from_file("./tests/data/dataframe_0.2.6.pyon")
+        expected = pd.DataFrame(
+            {
+                "a": [1, 2, 3],
+                "b": ["x", "y", None],
+                "c": [1.5, np.nan, 2.5],
+                3: [True, False, True],
+                "ts": pd.to_datetime(["2024-01-01", "2024-01-02", "2024-01-03"]),
+            },
+            index=pd.Index([10, 20, 30], name="k"),
+        )
+
+        # 2. Asserts...
+        pd.testing.assert_frame_equal(decoded, expected)
+
+    # ----------------------------------------------------------------------------------------- #
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            pd.Categorical(["a", "b", None, "a"], categories=["b", "a"], ordered=True),
+            pd.Categorical([10, 20, 10, 20]),
+            pd.array([1, None, 3, 4], dtype="Int64"),
+            pd.array([1, None, 3, 4], dtype="UInt8"),
+            pd.array([1.5, None, 3.0, 4.0], dtype="Float32"),
+            pd.array([True, None, False, True], dtype="boolean"),
+            pd.array(["x", None, "z", "~w"], dtype="string"),
+            pd.date_range("2024-03-30", periods=4, freq="12h", tz="Europe/Paris").array,
+            pd.to_timedelta([1, 2, None, 4], unit="s").array,
+            pd.period_range("2020-01", periods=4, freq="M").array,
+            pd.arrays.SparseArray([0.0, 0.0, 1.5, 0.0]),
+            pd.arrays.SparseArray([0, 0, 1, 0], fill_value=0),
+            pd.arrays.IntervalArray.from_breaks([0, 1, 2, 3, 4], closed="left"),
+            np.array([1, "a", None, (1, 2)], dtype=object),
+        ],
+    )
+
+    def test_pandas_dtypes(self, value):
+        """ Test DataFrame columns and Series keep their exact dtype. """
+
+        # 1. Prepare...
+        frame = pd.DataFrame({"col": value, "other": np.arange(4)})
+        series = pd.Series(value, name="col")
+
+        # 2. Asserts: frames...
+        for options in ({}, {"compact": True, "short_tags": True}, {"native": True}):
+            pd.testing.assert_frame_equal(pyon.decode(pyon.encode(frame, **options)), frame)
+
+        # 3. Asserts: series...
+        pd.testing.assert_series_equal(pyon.decode(pyon.encode(series)), series)
+
+    # ----------------------------------------------------------------------------------------- #
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            pd.to_timedelta([1, 2, None, 4], unit="s").array,
+            pd.array(pd.to_datetime(["2024-01-01", None, "2024-01-03"])),
+            pd.array(pd.to_datetime(["2024-01-01", "2024-01-02"]).as_unit("s")),
+            pd.date_range("2024-03-30", periods=4, freq="12h", tz="Europe/Paris").array,
+            pd.arrays.NumpyExtensionArray(np.array([1, 2, 3])),
+            pd.arrays.NumpyExtensionArray(np.array([1.5, np.nan], dtype=np.float32)),
+            pd.arrays.NumpyExtensionArray(np.array(["a", 1, None], dtype=object)),
+            pd.array([1, None, 3, 4], dtype="Int64"),
+            pd.Categorical(["a", "b", None, "a"]),
+        ],
+    )
+    def test_pandas_arrays(self, value):
+        """ Test extension arrays encoded on their own keep their class and dtype. """
+
+        # 1. Encode, Decode...
+        decoded = pyon.decode(pyon.encode(value))
+
+        # 2. Asserts...
+        assert type(decoded) is type(value)
+        pd.testing.assert_extension_array_equal(decoded, value)
+
+    # ----------------------------------------------------------------------------------------- #
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            pd.RangeIndex(5, 105, 5, name="r"),
+            pd.RangeIndex(0),
+            pd.date_range("2024-03-30", periods=50, freq="h", tz="Europe/Paris", name="t"),
+            pd.date_range("2024-01-01", periods=10, freq="B", unit="s"),
+            pd.DatetimeIndex(["2024-01-01", "2024-01-05", None]),
+            pd.DatetimeIndex(["2024-01-01", "2024-01-05"]).tz_localize("US/Eastern"),
+            pd.period_range("2020Q1", periods=8, freq="Q"),
+            pd.period_range("2020-01", periods=5, freq="2M"),
+            pd.PeriodIndex(["2020-01", "2020-03"], freq="M"),
+            pd.timedelta_range("1D", periods=4, freq="6h"),
+            pd.Index([1.5, 2.5], dtype="float32"),
+            pd.Index(["a", None]),
+            pd.CategoricalIndex(["a", "b", "a"]),
+            pd.MultiIndex.from_product([["a", "b"], [1, 2]], names=["x", "y"]),
+        ],
+    )
+
+    def test_pandas_index(self, value: pd.Index):
+        """ Test indexes keep their type, dtype, names and frequency, on rows and columns. """
+
+        # 1. Index...
+        decoded = pyon.decode(pyon.encode(value))
+        pd.testing.assert_index_equal(decoded, value, exact=True)
+        assert getattr(decoded, "freq", None) == getattr(value, "freq", None)
+
+        # 2. Frame rows and columns, Series...
+        frame = pd.DataFrame({"a": range(len(value))}, index=value)
+        pd.testing.assert_frame_equal(pyon.decode(pyon.encode(frame)), frame)
+        pd.testing.assert_frame_equal(pyon.decode(pyon.encode(frame.T)), frame.T)
+        series = frame["a"]
+        pd.testing.assert_series_equal(pyon.decode(pyon.encode(series)), series)
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def test_pandas_multiindex(self):
+        """ Test MultiIndex is written as levels and codes, with missing values. """
+
+        # 1. Prepare...
+        value = pd.MultiIndex.from_arrays(
+            [[1.0, np.nan, 1.0, 2.0], ["a", "b", None, "a"], pd.date_range("2024", periods=4)],
+            names=["x", None, "t"],
+        )
+
+        # 2. Asserts...
+        encoded = pyon.encode(value, compact=True)
+        decoded = pyon.decode(encoded)
+        pd.testing.assert_index_equal(decoded, value, exact=True)
+        assert all(np.array_equal(a, b) for a, b in zip(decoded.codes, value.codes))
+        assert '"__type__":"tuple"' not in encoded
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def test_pandas_index_size(self):
+        """ Test regular indexes are written in constant size. """
+
+        # 1. Asserts...
+        for length in (10, 100000):
+            for index in (
+                pd.RangeIndex(length),
+                pd.date_range("2020-01-01", periods=length, freq="s", tz="UTC"),
+                pd.period_range("2020-01-01", periods=length, freq="D"),
+            ):
+                assert len(pyon.encode(index, compact=True)) < 200
+
+    # ----------------------------------------------------------------------------------------- #
+
     @pytest.mark.parametrize(
         "value",
         [
@@ -735,6 +1059,11 @@ class TestPyonEncodeDecode:
                     )
                 )
 
+            # 1.7 Binary container: decodes to the same object...
+            binary = pyon.encode(value, format="binary")
+            assert isinstance(binary, bytes)
+            assert pyon.encode(pyon.decode(binary)) == pyon.encode(decoded)
+
         # 2. None, Other...
         else:
 
@@ -1,5 +1,368 @@
 # --------------------------------------------------------------------------------------------- #
-""" future tests for: encoder.py """
+""" Tests for Pyon: Encoder """
 # --------------------------------------------------------------------------------------------- #
+
+import json
+import threading
+
+# --------------------------------------------------------------------------------------------- #
+
+from collections import OrderedDict, deque
+from datetime import datetime
+from enum import IntEnum
+
 # --------------------------------------------------------------------------------------------- #
 
+import pytest
+
+# --------------------------------------------------------------------------------------------- #
+
+from pyon.encoder import PyonEncoder
+
+# --------------------------------------------------------------------------------------------- #
+
+
+class Level(IntEnum):
+    """ IntEnum: an `int` subclass """
+    LOW = 1
+    HIGH = 2
+
+
+# --------------------------------------------------------------------------------------------- #
+
+
+class Stamp(datetime):
+    """ A `datetime` subclass """
+
+
+# --------------------------------------------------------------------------------------------- #
+
+
+class Node:
+    """ Tree node with a back-reference to its parent """
+
+    def __init__(self, name, parent=None):
+        self.name = name
+        self.parent = parent
+        self.children = []
+        if parent is not None:
+            parent.children.append(self)
+
+
+# --------------------------------------------------------------------------------------------- #
+
+
+class TestPyonEncoderDispatch:
+    """ Test suite for the type dispatch tables of PyonEncoder """
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def test_subclass_resolution_is_cached(self):
+        """ Subclasses are resolved once through the chain, then looked up by type. """
+
+        # 1. Prepare...
+        encoder = PyonEncoder()
+        value = Stamp(2025, 1, 2, 3, 4, 5)
+
+        # 2. Encode twice...
+        first = encoder.encode_dict(value)
+        second = encoder.encode_dict(value)
+
+        # 3. Validate...
+        assert Stamp in encoder._encoders  # pylint: disable=protected-access
+        assert first == second
+        assert encoder.decode_dict(first) == value
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def test_subclass_keeps_chain_order(self):
+        """ Resolution follows the same precedence as the `is_encode` chain. """
+
+        # 1. IntEnum is an `int`: Base Types come first...
+        encoder = PyonEncoder()
+        assert encoder.encode_dict(Level.HIGH) == 2
+
+        # 2. OrderedDict is a `dict`: Mapping Types...
+        encoded = encoder.encode_dict(OrderedDict(a=1))
+        assert encoded["__type__"] == "dict"
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def test_unsupported_type(self):
+        """ Unsupported types are cached as unresolved and encode to None. """
+
+        # 1. Prepare...
+        encoder = PyonEncoder()
+        value = object()
+
+        # 2. Validate...
+        assert encoder.encode_dict(value) is None
+        assert encoder.encode_dict(value) is None
+        assert encoder.decode_dict({"__type__": "unknown"}) is None
+
+    # ----------------------------------------------------------------------------------------- #
+
+
+# --------------------------------------------------------------------------------------------- #
+
+
+class TestPyonEncoderNative:
+    """ Test suite for the JSON-native passthrough mode """
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def test_native_subtrees_are_untagged(self):
+        """ Lists and dicts of JSON-native types are written as they are. """
+
+        # 1. Prepare...
+        encoder = PyonEncoder(native=True)
+        value = {"ids": [1, 2, 3], "meta": {"name": "x", "ok": True, "ratio": None}}
+
+        # 2. Validate...
+        assert encoder.encode_dict(value) is value
+        assert encoder.encode_str(value, compact=True) == (
+            '{"ids":[1,2,3],"meta":{"name":"x","ok":true,"ratio":null}}'
+        )
+        assert encoder.decode_str(encoder.encode_str(value)) == value
+
+    # ----------------------------------------------------------------------------------------- #
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            (1, "a", None),
+            {1.5, 2.5},
+            frozenset(["a", "b"]),
+            deque([True, False]),
+            [1, (2, 3), {4}],
+            {"a": [1, datetime(2025, 1, 2)], "b": {"c": Level.LOW}},
+            {"~x": 1, 3: [4], "y": []},
+        ],
+    )
+    def test_native_roundtrip(self, value):
+        """ Marked sequences and mixed subtrees round-trip with their exact types. """
+
+        # 1. Encode, Decode...
+        encoder = PyonEncoder(native=True)
+        decoded = encoder.decode_str(encoder.encode_str(value))
+
+        # 2. Validate...
+        assert type(decoded) is type(value)
+        assert decoded == value
+        if isinstance(value, dict):
+            assert all(type(decoded[k]) is type(v) for k, v in value.items())
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def test_native_cycles_fall_back(self):
+        """ Self-referencing containers are not taken as native. """
+
+        # 1. Prepare...
+        encoder = PyonEncoder(native=True)
+        value = [1, 2]
+        value.append(value)
+
+        # 2. Validate...
+        assert encoder._encode_native(value) is None  # pylint: disable=protected-access
+
+    # ----------------------------------------------------------------------------------------- #
+
+
+# --------------------------------------------------------------------------------------------- #
+
+
+class TestPyonEncoderDecode:
+    """ Test suite for single-pass decoding """
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def test_parsed_tree_still_decodes(self):
+        """ `decode_dict` keeps decoding trees that were parsed separately. """
+
+        # 1. Prepare...
+        encoder = PyonEncoder()
+        value = {"a": [(1, datetime(2025, 1, 2))], (2, 3): {Level.LOW}}
+        pyon_str = encoder.encode_str(value)
+
+        # 2. Validate: single pass and tree walk agree...
+        assert encoder.decode_str(pyon_str) == value
+        assert encoder.decode_dict(json.loads(pyon_str)) == value
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def test_tag_named_keys(self):
+        """ String keys named like tags are not read as tagged nodes. """
+
+        # 1. Prepare...
+        encoder = PyonEncoder(enc_private=True)
+        value = {"__type__": "list", "__class__": 1, "x": {"__class__": "builtins.int"}}
+
+        # 2. Validate...
+        assert encoder.decode_str(encoder.encode_str(value)) == value
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def test_tagged_key_with_tagged_items(self):
+        """ Tagged keys decode the same inside and outside of a parse. """
+
+        # 1. Prepare...
+        encoder = PyonEncoder()
+        key = (datetime(2025, 1, 2), 1)
+
+        # 2. Validate...
+        assert encoder.decode_key(encoder.encode_key(key)) == key
+
+    # ----------------------------------------------------------------------------------------- #
+
+    @pytest.mark.parametrize("short_tags", [False, True])
+    def test_dialects(self, short_tags):
+        """ Both tag dialects decode through one pass, whatever strings the data holds. """
+
+        # 1. Prepare...
+        encoder = PyonEncoder()
+        value = {"~T": "~C", "~R": ("~T", {"~C": 1}), "text": '"~T"'}
+
+        # 2. Validate...
+        assert encoder.decode_str(encoder.encode_str(value, short_tags=short_tags)) == value
+
+    # ----------------------------------------------------------------------------------------- #
+
+
+# --------------------------------------------------------------------------------------------- #
+
+
+class TestPyonEncoderStream:
+    """ Test suite for single-pass encoding """
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def test_stream_matches_tree(self):
+        """ Streamed text equals the serialized tree built by `encode_dict`. """
+
+        # 1. Prepare...
+        encoder = PyonEncoder()
+        value = {"a": [(1, datetime(2025, 1, 2))], (2, 3): {Level.LOW}, "b": [int, None]}
+
+        # 2. Encode: streamed, then as a tree...
+        streamed = encoder.encode_str(value, compact=True)
+        tree = encoder.encode_dict(value)
+
+        # 3. Validate...
+        assert streamed == json.dumps(tree, ensure_ascii=False, separators=(",", ":"))
+        assert "_Deferred" not in repr(tree)
+        assert encoder.decode_str(streamed) == value
+
+    # ----------------------------------------------------------------------------------------- #
+
+
+# --------------------------------------------------------------------------------------------- #
+
+
+class TestPyonEncoderRefs:
+    """ Test suite for shared and cyclic references """
+
+    # ----------------------------------------------------------------------------------------- #
+
+    @pytest.mark.parametrize("short_tags", [False, True])
+    def test_cycles(self, short_tags):
+        """ Parent/child cycles and self-referencing containers are restored. """
+
+        # 1. Prepare...
+        encoder = PyonEncoder(refs=True)
+        root = Node("root")
+        for i in range(3):
+            Node(f"child-{i}", root).children.append(root)
+        loop = [1]
+        loop.append(loop)
+
+        # 2. Encode, Decode...
+        pyon_str = encoder.encode_str({"root": root, "loop": loop}, short_tags=short_tags)
+        decoded = encoder.decode_str(pyon_str)
+
+        # 3. Validate...
+        root = decoded["root"]
+        assert [child.name for child in root.children] == ["child-0", "child-1", "child-2"]
+        assert all(child.parent is root for child in root.children)
+        assert all(child.children[0] is root for child in root.children)
+        assert decoded["loop"][1] is decoded["loop"]
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def test_untagged_nodes(self):
+        """ Objects written untagged (here: unsupported, as null) get no id to refer to. """
+
+        # 1. Prepare...
+        encoder = PyonEncoder(refs=True)
+        lock = threading.Lock()
+
+        # 2. Validate...
+        pyon_str = encoder.encode_str([lock, lock, [lock]], compact=True)
+        assert '"__ref__"' not in pyon_str
+        assert encoder.decode_str(pyon_str) == [None, None, [None]]
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def test_immutable_cycles(self):
+        """ Cycles through tuples cannot be restored: decoding fails instead of leaking `Ref`. """
+
+        # 1. Prepare...
+        encoder = PyonEncoder(refs=True)
+        loop = []
+        loop.append((1, loop))
+
+        # 2. Validate...
+        pyon_str = encoder.encode_str(loop)
+        with pytest.raises(ValueError):
+            encoder.decode_str(pyon_str)
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def test_shared(self):
+        """ Shared objects are written once and decoded as one object. """
+
+        # 1. Prepare...
+        encoder = PyonEncoder(refs=True)
+        shared = {"values": list(range(100))}
+        value = [shared] * 50
+
+        # 2. Encode, Decode...
+        pyon_str = encoder.encode_str(value, compact=True)
+        decoded = encoder.decode_str(pyon_str)
+
+        # 3. Validate: once in the text, one object after decoding...
+        assert pyon_str.count('"values"') == 1
+        assert decoded == value
+        assert all(item is decoded[0] for item in decoded)
+
+        # 4. Validate: tree mode agrees...
+        assert encoder.decode_dict(encoder.encode_dict(value))[1] is not None
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def test_cycle_without_refs(self):
+        """ Without `refs`, cycles fail with a clear error. """
+
+        # 1. Prepare...
+        loop = []
+        loop.append(loop)
+
+        # 2. Validate...
+        with pytest.raises(ValueError):
+            PyonEncoder().encode_str(loop)
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def test_tag_keys(self):
+        """ Plain keys named like reference tags are not read as references. """
+
+        # 1. Prepare...
+        encoder = PyonEncoder(enc_private=True, refs=True)
+        value = {"__ref__": 0, "x": {"__id__": 1}}
+
+        # 2. Validate...
+        assert encoder.decode_str(encoder.encode_str(value)) == value
+
+    # ----------------------------------------------------------------------------------------- #
+
+
+# --------------------------------------------------------------------------------------------- #
@@ -1,4 +1,300 @@
 # --------------------------------------------------------------------------------------------- #
-""" future tests for: file.py """
+""" Tests for Pyon: File """
 # --------------------------------------------------------------------------------------------- #
+
+import copy
+import hashlib
+import os
+import pickle
+import shutil
+import threading
+
+# --------------------------------------------------------------------------------------------- #
+
+import pytest
+
+# --------------------------------------------------------------------------------------------- #
+
+from pyon.file import File
+from pyon.file import api as file_api
+
+# --------------------------------------------------------------------------------------------- #
+
+# A WebP image, named as a JPEG...
+IMAGE_PATH = "./tests/data/img.jpg"
+
+# --------------------------------------------------------------------------------------------- #
+
+
+class TestFileMime:
+    """ Test suite for File MIME detection """
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def test_mime_extension(self, tmp_path, monkeypatch):
+        """ Known extensions skip libmagic, unless sniffing is forced. """
+
+        # 1. Extension only...
+        calls = []
+        get_magic = File._get_magic
+        monkeypatch.setattr(File, "_get_magic", lambda: calls.append(1) or get_magic())
+        assert File(IMAGE_PATH).mime == "image/jpeg"
+        assert File(content=b"x", path=str(tmp_path / "a.txt")).mime == "text/plain"
+        assert not calls
+
+        # 2. Wrong extension: sniffed on request...
+        path = str(tmp_path / "img.txt")
+        shutil.copy(IMAGE_PATH, path)
+        assert File(path).mime == "text/plain"
+        assert File(path, sniff=True).mime == "image/webp"
+        assert calls
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def test_mime_cache(self, tmp_path, monkeypatch):
+        """ Sniffed types are cached by path, size and mtime, or by content prefix. """
+
+        # 1. Prepare...
+        monkeypatch.setattr(file_api, "_MIME_CACHE", {})
+        with open(IMAGE_PATH, "rb") as file:
+            content = file.read()
+        path = str(tmp_path / "data")
+        shutil.copy(IMAGE_PATH, path)
+
+        # 2. Cached...
+        assert File.get_mime_from_path(path) == "image/webp"
+        assert File.get_mime_from_content(content) == "image/webp"
+        assert File(content=content).mime == "image/webp"
+        assert len(file_api._MIME_CACHE) == 2
+
+        # 3. Changed files are sniffed again...
+        with open(path, "w", encoding="utf-8") as file:
+            file.write("plain text")
+        assert File.get_mime_from_path(path) == "text/plain"
+        assert File(content=b"plain text").mime == "text/plain"
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def test_mime_threads(self):
+        """ Each thread sniffs with its own libmagic handle. """
+
+        # 1. ...
+        handles = []
+        thread = threading.Thread(target=lambda: handles.append(File._get_magic()))
+        thread.start()
+        thread.join()
+
+        # 2. ...
+        assert File._get_magic() is File._get_magic()
+        assert handles[0] is not File._get_magic()
+
+    # ----------------------------------------------------------------------------------------- #
+
+
+# --------------------------------------------------------------------------------------------- #
+
+
+class TestFileIO:
+    """ Test suite for File chunked I/O and digests """
+
+    # ----------------------------------------------------------------------------------------- #
+
+    @pytest.mark.parametrize("kernel", [True, False])
+    def test_copy(self, tmp_path, monkeypatch, kernel):
+        """ Path to path copies: kernel offload or user space, with the digest in one pass. """
+
+        # 1. Prepare: several chunks, and a last partial one...
+        monkeypatch.setattr(file_api, "CHUNK_SIZE", 1000)
+        if not kernel:
+            monkeypatch.delattr(os, "copy_file_range", raising=False)
+            monkeypatch.delattr(os, "sendfile", raising=False)
+        data = os.urandom(10500)
+        source = tmp_path / "a.bin"
+        source.write_bytes(data)
+        os.chmod(source, 0o640)
+
+        # 2. Copies...
+        file = File(str(source))
+        assert file.write(str(tmp_path / "b.bin"))
+        assert file.write(str(tmp_path / "c.bin"), digest="sha256")
+        assert (tmp_path / "b.bin").read_bytes() == data == (tmp_path / "c.bin").read_bytes()
+        assert (os.stat(tmp_path / "b.bin").st_mode & 0o777) == 0o640
+
+        # 3. Digest: kept from the copy, not read again...
+        monkeypatch.setattr(file_api.File, "iter_chunks", None)
+        assert file.get_digest() == hashlib.sha256(data).hexdigest()
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def test_digest(self, tmp_path, monkeypatch):
+        """ Digests from loads and writes, recomputed when the content changes. """
+
+        # 1. Load...
+        monkeypatch.setattr(file_api, "CHUNK_SIZE", 1000)
+        data = os.urandom(4321)
+        (tmp_path / "a.bin").write_bytes(data)
+        file = File(str(tmp_path / "a.bin"))
+        assert file.load(digest="md5")
+        assert file._digest[2] == hashlib.md5(data).hexdigest()
+        assert file.get_digest("md5") == hashlib.md5(data).hexdigest()
+        assert file.get_digest() == hashlib.sha256(data).hexdigest()
+
+        # 2. Unloads: the digest holds no reference to the content...
+        assert not any(isinstance(item, (bytes, memoryview)) for item in file._digest)
+        assert file.unload() and (file._digest is None)
+
+        # 3. Write from content; changed content and files...
+        file.content = data[::-1]
+        assert file._digest is None
+        assert file.write(str(tmp_path / "b.bin"), digest="sha256")
+        assert file.get_digest() == hashlib.sha256(data[::-1]).hexdigest()
+        other = File(str(tmp_path / "b.bin"))
+        (tmp_path / "b.bin").write_bytes(b"new")
+        assert other.get_digest() == hashlib.sha256(b"new").hexdigest()
+        assert File(content=b"", path=str(tmp_path / "none.bin")).get_digest() is None
+
+        # 4. Mutable content: hashed on each call...
+        mutable = File(content=bytearray(b"abc"))
+        assert mutable.get_digest() == hashlib.sha256(b"abc").hexdigest()
+        mutable.content[0] = ord("z")
+        assert mutable.get_digest() == hashlib.sha256(b"zbc").hexdigest()
+
+    # ----------------------------------------------------------------------------------------- #
+
+
+# --------------------------------------------------------------------------------------------- #
+
+
+class TestFileRanges:
+    """ Test suite for File ranged, chunked and memory-mapped reads """
+
+    # ----------------------------------------------------------------------------------------- #
+
+    @pytest.mark.parametrize("loaded", [False, True])
+    def test_read_chunks(self, tmp_path, loaded):
+        """ Ranged reads and chunks, from memory or from the file. """
+
+        # 1. Prepare...
+        data = os.urandom(10000)
+        (tmp_path / "a.bin").write_bytes(data)
+        file = File(str(tmp_path / "a.bin"))
+        if loaded:
+            file.load()
+
+        # 2. Ranges...
+        assert file.read(0, 16) == data[:16]
+        assert file.read(9990, 100) == data[9990:]
+        assert file.read(20000, 10) == b""
+        assert file.read(5000) == data[5000:]
+        with pytest.raises(ValueError):
+            file.read(-1)
+
+        # 3. Chunks...
+        chunks = list(file.iter_chunks(3000))
+        assert [len(chunk) for chunk in chunks] == [3000, 3000, 3000, 1000]
+        assert b"".join(chunks) == data
+        with pytest.raises(ValueError):
+            list(file.iter_chunks(0))
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def test_mmap(self, tmp_path):
+        """ Mapped content: read-only views of the file, usable as loaded content. """
+
+        # 1. Maps...
+        data = os.urandom(5000)
+        (tmp_path / "a.bin").write_bytes(data)
+        file = File(str(tmp_path / "a.bin"))
+        with file.open_mmap() as mapped:
+            assert mapped[100:200] == data[100:200]
+
+        # 2. Loads mapped...
+        assert file.load(use_mmap=True, digest="sha256")
+        assert isinstance(file.content, memoryview) and file.content.readonly
+        assert (len(file) == 5000) and (file.read(10, 5) == data[10:15])
+        assert file.get_digest() == hashlib.sha256(data).hexdigest()
+
+        # 3. Copies and pickles read the map...
+        for other in (copy.deepcopy(file), pickle.loads(pickle.dumps(file))):
+            assert isinstance(other.content, bytes) and (other.content == data)
+            assert other.get_digest() == hashlib.sha256(data).hexdigest()
+
+        # 4. Writes and unloads, onto itself too: the map is closed...
+        mapped = file.content.obj
+        assert file.write(str(tmp_path / "b.bin"))
+        assert file.unload(update=True) and mapped.closed
+        assert (tmp_path / "a.bin").read_bytes() == data == (tmp_path / "b.bin").read_bytes()
+
+        # 5. ...unless views of it are in use...
+        assert file.load(use_mmap=True)
+        head = file.content[:10]
+        assert file.unload() and not head.obj.closed and (head == data[:10])
+
+        # 6. Nothing to map...
+        with pytest.raises(FileNotFoundError):
+            File(content=b"abc").open_mmap()
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def test_compare(self, tmp_path, monkeypatch):
+        """ Sizes without reading; contents compared in chunks, loaded or not. """
+
+        # 1. Prepare...
+        monkeypatch.setattr(file_api, "CHUNK_SIZE", 1000)
+        data = os.urandom(5000)
+        (tmp_path / "a.bin").write_bytes(data)
+        on_disk = File(str(tmp_path / "a.bin"))
+
+        # 2. ...
+        assert len(on_disk) == 5000 and not on_disk.loaded
+        assert File(content=data) == on_disk
+        assert File(content=data[:-1] + b"x") != on_disk
+        assert File(content=data[:-1]) != on_disk
+        assert File(content=data) < File(content=data + b"x")
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def test_mime_head(self, tmp_path, monkeypatch):
+        """ MIME sniffing reads the first bytes of files only. """
+
+        # 1. ...
+        sniffed = []
+        get_magic = File._get_magic
+        monkeypatch.setattr(file_api, "_MIME_CACHE", {})
+        monkeypatch.setattr(File, "_get_magic", lambda: _Recorder(get_magic(), sniffed))
+        path = str(tmp_path / "data")
+        shutil.copy(IMAGE_PATH, path)
+
+        # 2. ...
+        assert File(path).mime == "image/webp"
+        assert len(sniffed) == 1
+        assert len(sniffed[0]) == file_api.MIME_SNIFF_SIZE < os.path.getsize(path)
+
+    # ----------------------------------------------------------------------------------------- #
+
+
+# --------------------------------------------------------------------------------------------- #
+
+
+class _Recorder:
+    """ libmagic handle recording the buffers it sniffs """
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def __init__(self, handle, buffers: list):
+        self.handle = handle
+        self.buffers = buffers
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def from_buffer(self, buffer: bytes) -> str:
+        """ Records, then sniffs. """
+
+        # 1. ...
+        self.buffers.append(buffer)
+        return self.handle.from_buffer(buffer)
+
+    # ----------------------------------------------------------------------------------------- #
+
+
 # --------------------------------------------------------------------------------------------- #
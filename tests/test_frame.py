@@ -0,0 +1,309 @@
+# --------------------------------------------------------------------------------------------- #
+""" Tests for Pyon: Chunked DataFrame Files """
+# --------------------------------------------------------------------------------------------- #
+
+import os
+
+# --------------------------------------------------------------------------------------------- #
+
+import numpy as np
+import pandas as pd
+import pytest
+import pyon
+
+# --------------------------------------------------------------------------------------------- #
+
+
+def _frame(rows: int = 100) -> pd.DataFrame:
+    """ Mixed-dtype frame over a stepped range index """
+
+    # 1. ...
+    return pd.DataFrame(
+        {
+            "f": np.arange(rows, dtype=np.float32) / 2,
+            "i": np.arange(rows),
+            "sym": pd.Categorical(np.array(["A", "B", "C"])[np.arange(rows) % 3]),
+            "ts": pd.date_range("2024-01-01", periods=rows, freq="min", tz="UTC"),
+            "s": [f"s{i}" if i % 7 else None for i in range(rows)],
+            "n": pd.array([i if i % 5 else None for i in range(rows)], dtype="Int64"),
+        },
+        index=pd.RangeIndex(10, 10 + 2 * rows, 2, name="k"),
+    )
+
+
+# --------------------------------------------------------------------------------------------- #
+
+
+class TestPyonFrame:
+    """ Test suite for chunked DataFrame files """
+
+    # ----------------------------------------------------------------------------------------- #
+
+    @pytest.mark.parametrize("row_group_size", [1, 7, 100, 1000])
+    def test_roundtrip(self, tmp_path, row_group_size):
+        """ Whole frames read back with dtypes and index, through `from_file` too. """
+
+        # 1. Prepare...
+        file_path = str(tmp_path / "frame.pyon")
+        frame = _frame()
+        assert pyon.write_frame(frame, file_path, row_group_size=row_group_size) == file_path
+
+        # 2. Asserts...
+        pd.testing.assert_frame_equal(pyon.read_frame(file_path), frame)
+        pd.testing.assert_frame_equal(pyon.from_file(file_path), frame)
+
+    # ----------------------------------------------------------------------------------------- #
+
+    @pytest.mark.parametrize("columns", [None, ["ts"], ["s", "f"], []])
+    @pytest.mark.parametrize(
+        "rows", [None, slice(0, 10), slice(15, 16), slice(5, 95, 4), slice(-3, None),
+                 slice(None, None, -1), slice(50, 50)]
+    )
+    def test_projection(self, tmp_path, columns, rows):
+        """ Column and row selections match pandas indexing. """
+
+        # 1. Prepare...
+        file_path = str(tmp_path / "frame.pyon")
+        frame = _frame()
+        pyon.write_frame(frame, file_path, row_group_size=16)
+
+        # 2. Expected...
+        expected = frame if columns is None else frame[columns]
+        expected = expected if rows is None else expected.iloc[rows]
+
+        # 3. Asserts...
+        decoded = pyon.read_frame(file_path, columns=columns, rows=rows)
+        pd.testing.assert_frame_equal(decoded, expected)
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def test_reads_only_needed_chunks(self, tmp_path, monkeypatch):
+        """ Only the chunks of the selected columns and groups are decoded. """
+
+        # 1. Prepare...
+        file_path = str(tmp_path / "frame.pyon")
+        pyon.write_frame(_frame(), file_path, row_group_size=10)
+
+        # 2. Counts chunk reads...
+        reads = []
+        store = pyon.Pyon.get().frames
+        read_chunk = store._read_chunk
+        monkeypatch.setattr(
+            store, "_read_chunk", lambda fp, loc: reads.append(loc) or read_chunk(fp, loc)
+        )
+
+        # 3. Two columns of two groups (rows 25-34), each with its index, plus the footer...
+        pyon.read_frame(file_path, columns=["i", "sym"], rows=slice(25, 35))
+        assert len(reads) == 1 + 2 * 3
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def test_special_frames(self, tmp_path):
+        """ Empty frames, duplicate and multi-level column labels. """
+
+        # 1. Empty: dtypes are kept...
+        file_path = str(tmp_path / "frame.pyon")
+        frame = _frame().iloc[:0]
+        pyon.write_frame(frame, file_path)
+        pd.testing.assert_frame_equal(pyon.read_frame(file_path), frame)
+
+        # 2. Duplicate labels: all matching columns...
+        frame = pd.DataFrame([[1, 2.5, "x"]], columns=["a", "a", "b"])
+        pyon.write_frame(frame, file_path)
+        pd.testing.assert_frame_equal(pyon.read_frame(file_path, columns=["a"]), frame[["a"]])
+
+        # 3. MultiIndex columns and rows...
+        frame = pd.DataFrame(
+            np.arange(12).reshape(3, 4),
+            columns=pd.MultiIndex.from_product([["x", "y"], [1, 2]]),
+            index=pd.MultiIndex.from_tuples([("a", 1), ("a", 2), ("b", 1)]),
+        )
+        pyon.write_frame(frame, file_path, row_group_size=2)
+        pd.testing.assert_frame_equal(pyon.read_frame(file_path), frame)
+        pd.testing.assert_frame_equal(
+            pyon.read_frame(file_path, columns=[("y", 1)], rows=slice(1, 3)),
+            frame[[("y", 1)]].iloc[1:3],
+        )
+
+    # ----------------------------------------------------------------------------------------- #
+
+    @pytest.mark.parametrize(
+        "filters",
+        [
+            [("i", ">=", 40), ("i", "<", 45)],
+            [("sym", "==", "B"), ("f", ">", 30)],
+            [("ts", ">=", pd.Timestamp("2024-01-01 01:00", tz="UTC"))],
+            [("s", "in", ["s1", "s99", "x"])],
+            [("n", "!=", 3), ("i", "<=", 10)],
+            [("sym", "not in", ["A", "C"])],
+            [("i", ">", 1000)],
+        ],
+    )
+    def test_filters(self, tmp_path, filters):
+        """ Filters keep the matching rows, like the equivalent pandas masks. """
+
+        # 1. Prepare...
+        file_path = str(tmp_path / "frame.pyon")
+        frame = _frame()
+        pyon.write_frame(frame, file_path, row_group_size=16)
+
+        # 2. Expected...
+        mask = np.ones(len(frame), dtype=bool)
+        for column, op, value in filters:
+            series = frame[column]
+            matches = {
+                "==": lambda: series == value,
+                "!=": lambda: series != value,
+                "<": lambda: series < value,
+                "<=": lambda: series <= value,
+                ">": lambda: series > value,
+                ">=": lambda: series >= value,
+                "in": lambda: series.isin(value),
+                "not in": lambda: ~series.isin(value),
+            }[op]()
+            mask &= matches.fillna(False).to_numpy(dtype=bool)
+
+        # 3. Asserts...
+        decoded = pyon.read_frame(file_path, columns=["i", "sym"], filters=filters)
+        pd.testing.assert_frame_equal(decoded, frame[["i", "sym"]][mask])
+        decoded = pyon.read_frame(file_path, rows=slice(None, None, -3), filters=filters)
+        pd.testing.assert_frame_equal(decoded, frame.iloc[::-3][mask[::-3]])
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def test_filters_skip_groups(self, tmp_path, monkeypatch):
+        """ Groups ruled out by their statistics are not decoded. """
+
+        # 1. Prepare...
+        file_path = str(tmp_path / "frame.pyon")
+        pyon.write_frame(_frame(), file_path, row_group_size=10)
+
+        # 2. Counts chunk reads...
+        reads = []
+        store = pyon.Pyon.get().frames
+        read_chunk = store._read_chunk
+        monkeypatch.setattr(
+            store, "_read_chunk", lambda fp, loc: reads.append(loc) or read_chunk(fp, loc)
+        )
+
+        # 3. One group (rows 20-29): its index, the column, the filter column, plus the footer...
+        t0 = pd.Timestamp("2024-01-01 00:20", tz="UTC")
+        filters = [("ts", ">=", t0), ("ts", "<", t0 + pd.Timedelta("10min"))]
+        decoded = pyon.read_frame(file_path, columns=["i"], filters=filters)
+        assert decoded["i"].tolist() == list(range(20, 30))
+        assert len(reads) == 1 + 3
+
+        # 4. No group matches: only the first group is read, for the dtypes...
+        reads.clear()
+        assert pyon.read_frame(file_path, filters=[("i", "==", -1)]).empty
+        assert len(reads) == 1 + 7
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def test_append_compact(self, tmp_path, monkeypatch):
+        """ Appends write only the new groups; compaction merges them, keeping the rows. """
+
+        # 1. Prepare: a missing file is created...
+        file_path = str(tmp_path / "frame.pyon")
+        frame = _frame(95)
+        parts = [frame.iloc[start:start + 10] for start in range(0, len(frame), 10)]
+        for part in parts:
+            pyon.append_frame(part, file_path, row_group_size=4)
+        pyon.append_frame(frame.iloc[:0], file_path)
+
+        # 2. Validate: appends do not decode existing groups (only the schema, in the footer)...
+        reads = []
+        store = pyon.Pyon.get().frames
+        read_chunk = store._read_chunk
+        monkeypatch.setattr(
+            store, "_read_chunk", lambda fp, loc: reads.append(loc) or read_chunk(fp, loc)
+        )
+        pyon.append_frame(_frame(5), file_path, row_group_size=4)
+        assert len(reads) == 1
+        monkeypatch.undo()
+
+        # 3. Validate: rows, and filters over old and new groups...
+        expected = pd.concat([frame, _frame(5)])
+        pd.testing.assert_frame_equal(pyon.read_frame(file_path), expected)
+        pd.testing.assert_frame_equal(
+            pyon.read_frame(file_path, filters=[("i", "<", 3)]), expected[expected["i"] < 3]
+        )
+
+        # 4. Compaction...
+        size = os.path.getsize(file_path)
+        assert pyon.compact_frame(file_path, row_group_size=32) == file_path
+        assert os.path.getsize(file_path) < size
+        assert not os.path.exists(file_path + ".compact")
+        pd.testing.assert_frame_equal(pyon.read_frame(file_path), expected)
+        pd.testing.assert_frame_equal(
+            pyon.read_frame(file_path, rows=slice(30, 70), filters=[("sym", "==", "A")]),
+            expected.iloc[30:70][expected.iloc[30:70]["sym"] == "A"],
+        )
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def test_append_invalid(self, tmp_path, monkeypatch):
+        """ Rows that do not match the file are rejected, and the file is left as it was. """
+
+        # 1. Prepare...
+        file_path = str(tmp_path / "frame.pyon")
+        frame = _frame(20)
+        pyon.write_frame(frame, file_path)
+        with open(file_path, "rb") as file:
+            data = file.read()
+
+        # 2. Columns, dtypes, index...
+        with pytest.raises(ValueError):
+            pyon.append_frame(frame[["i", "f"]], file_path)
+        with pytest.raises(ValueError):
+            pyon.append_frame(frame.astype({"i": "float64"}), file_path)
+        with pytest.raises(ValueError):
+            pyon.append_frame(frame.assign(sym=frame["sym"].cat.add_categories("D")), file_path)
+        with pytest.raises(ValueError):
+            pyon.append_frame(frame.reset_index(drop=True), file_path)
+        with pytest.raises(ValueError):
+            pyon.append_frame(frame.set_index("ts"), file_path)
+
+        # 3. Failed write, after the new groups...
+        def fail(fp, footer):
+            raise OSError("disk full")
+        monkeypatch.setattr(pyon.Pyon.get().frames, "_write_footer", fail)
+        with pytest.raises(OSError):
+            pyon.append_frame(frame, file_path)
+        with open(file_path, "rb") as file:
+            assert file.read() == data
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def test_invalid(self, tmp_path):
+        """ Invalid inputs and files are rejected. """
+
+        # 1. Prepare...
+        file_path = str(tmp_path / "frame.pyon")
+
+        # 2. Writes...
+        with pytest.raises(ValueError):
+            pyon.write_frame([1, 2], file_path)
+        with pytest.raises(ValueError):
+            pyon.write_frame(_frame(), file_path, row_group_size=0)
+
+        # 3. Reads...
+        pyon.write_frame(_frame(), file_path)
+        with pytest.raises(KeyError):
+            pyon.read_frame(file_path, columns=["missing"])
+        with pytest.raises(ValueError):
+            pyon.read_frame(file_path, rows=[1, 2])
+        with pytest.raises(ValueError):
+            pyon.read_frame(file_path, filters=[("i", "~", 1)])
+        with pytest.raises(KeyError):
+            pyon.read_frame(file_path, filters=[("missing", "==", 1)])
+
+        # 4. Not a frame file...
+        pyon.to_file(_frame(), file_path, verbose=False)
+        with pytest.raises(ValueError):
+            pyon.read_frame(file_path)
+
+    # ----------------------------------------------------------------------------------------- #
+
+
+# --------------------------------------------------------------------------------------------- #
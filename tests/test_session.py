@@ -0,0 +1,538 @@
+# --------------------------------------------------------------------------------------------- #
+""" Tests for Pyon: Session """
+# --------------------------------------------------------------------------------------------- #
+
+import bz2
+import gzip
+import io
+import lzma
+import os
+import zlib
+
+# --------------------------------------------------------------------------------------------- #
+
+from dataclasses import dataclass
+
+# --------------------------------------------------------------------------------------------- #
+
+import numpy as np
+import pytest
+import pyon
+import pyon.compression
+
+# --------------------------------------------------------------------------------------------- #
+
+from pyon import Pyon
+
+# --------------------------------------------------------------------------------------------- #
+
+
+@dataclass
+class Point:
+    """ For Session Test """
+    x: int
+    y: int
+
+
+# --------------------------------------------------------------------------------------------- #
+
+
+class TestPyonSession:
+    """ Test suite for reusable Pyon sessions """
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def test_get_is_cached_per_flags(self):
+        """ The same flag combination always returns the same session. """
+
+        # 1. Validate...
+        assert Pyon.get() is Pyon.get(enc_protected=False, enc_private=False)
+        assert Pyon.get(enc_protected=True) is Pyon.get(enc_protected=True)
+        assert Pyon.get(enc_protected=True) is not Pyon.get()
+        assert Pyon.get(enc_private=True).encoder.map_enc.enc_private
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def test_session_roundtrip(self):
+        """ Sessions encode and decode like the module-level functions. """
+
+        # 1. Prepare...
+        session = Pyon()
+        value = [Point(1, 2), Point(3, 4)]
+
+        # 2. Encode twice (warm caches)...
+        encoded = session.encode(value)
+        assert session.encode(value) == encoded
+        assert pyon.encode(value) == encoded
+
+        # 3. Validate...
+        assert session.decode(encoded) == value
+        assert session.encode(None) is None
+        assert session.decode(None) is None
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def test_compact_and_short_tags(self):
+        """ Compact output and the short-tag dialect round-trip, both dialects decode. """
+
+        # 1. Prepare...
+        session = Pyon()
+        value = {"~T": Point(1, 2), 3: (4, 5.5), "points": [Point(3, 4)]}
+
+        # 2. Encode...
+        readable = session.encode(value)
+        compact = session.encode(value, compact=True)
+        short = session.encode(value, compact=True, short_tags=True)
+
+        # 3. Validate: no layout whitespace, no long tags...
+        assert "\n" not in compact
+        assert len(short) < len(compact) < len(readable)
+        assert "__type__" not in short and "__data__" not in short
+
+        # 4. Validate: both dialects decode...
+        assert session.decode(readable) == value
+        assert session.decode(compact) == value
+        assert session.decode(short) == value
+        assert pyon.decode(pyon.encode(value, short_tags=True)) == value
+
+    # ----------------------------------------------------------------------------------------- #
+
+
+# --------------------------------------------------------------------------------------------- #
+
+
+class TestPyonStreams:
+    """ Test suite for dump/load on file objects """
+
+    # ----------------------------------------------------------------------------------------- #
+
+    @pytest.mark.parametrize("stream", [io.BytesIO, io.StringIO])
+    def test_dump_load(self, stream):
+        """ Binary and text file objects round-trip, in chunks larger than one write. """
+
+        # 1. Prepare...
+        value = {"points": [Point(i, -i) for i in range(5000)], "name": "ção"}
+        fp = stream()
+
+        # 2. Dump, Load...
+        pyon.dump(value, fp, compact=True)
+        fp.seek(0)
+        decoded = pyon.load(fp)
+
+        # 3. Validate...
+        assert decoded == value
+        assert fp.getvalue()[:1] in ("{", b"{")
+
+    # ----------------------------------------------------------------------------------------- #
+
+    @pytest.mark.parametrize("options", [{}, {"compact": True}, {"compact": True, "refs": True}])
+    def test_dump_bounded(self, monkeypatch, options):
+        """ Writes stay small whatever the shape: nested large collections are walked. """
+
+        # 1. Prepare: small batches and writes...
+        monkeypatch.setattr("pyon.encoder._STREAM_NODES", 64)
+        monkeypatch.setattr("pyon.encoder._WRITE_CHUNK_SIZE", 1000)
+        shared = Point(0, 0)
+        value = {"k": [{"a": i, "p": [Point(i, i), shared]} for i in range(2000)], "s": shared}
+        writes = []
+        fp = io.StringIO()
+        monkeypatch.setattr(fp, "write", lambda text: writes.append(text) or len(text))
+
+        # 2. Dump...
+        pyon.dump(value, fp, **options)
+        text = "".join(writes)
+
+        # 3. Validate...
+        assert max(map(len, writes)) < 5000 < len(text)
+        assert text == pyon.encode(value, **options)
+        decoded = pyon.decode(text)
+        assert decoded == value
+        assert (decoded["k"][0]["p"][1] is decoded["s"]) == bool(options.get("refs"))
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def test_dump_invalid(self):
+        """ Nothing is written when the object cannot be encoded. """
+
+        # 1. Validate...
+        fp = io.BytesIO()
+        with pytest.raises(ValueError):
+            pyon.dump(None, fp)
+        assert fp.getvalue() == b""
+        assert pyon.load(fp) is None
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def test_to_file_from_file(self, tmp_path, monkeypatch):
+        """ Files are streamed: nested directories are created, bare names are accepted. """
+
+        # 1. Nested directory...
+        value = [Point(1, 2), {"a": (1, 2)}]
+        file_path = str(tmp_path / "a" / "b" / "data.pyon")
+        assert pyon.to_file(value, file_path, verbose=False) == file_path
+        assert pyon.from_file(file_path) == value
+
+        # 2. Bare file name, any extension...
+        monkeypatch.chdir(tmp_path)
+        pyon.to_file(value, "data.json", verbose=False, short_tags=True)
+        assert os.path.isfile(tmp_path / "data.json")
+        assert pyon.from_file("data.json") == value
+
+        # 3. Invalid...
+        with pytest.raises(ValueError):
+            pyon.to_file(None, file_path)
+        assert pyon.from_file(str(tmp_path / "missing.pyon")) is None
+
+    # ----------------------------------------------------------------------------------------- #
+
+
+# --------------------------------------------------------------------------------------------- #
+
+
+class TestPyonIterFile:
+    """ Test suite for incremental file iteration """
+
+    # ----------------------------------------------------------------------------------------- #
+
+    @pytest.mark.parametrize(
+        "options",
+        [
+            {},
+            {"compact": True},
+            {"short_tags": True},
+            {"native": True, "compact": True},
+            {"refs": True, "compact": True},
+        ],
+    )
+    @pytest.mark.parametrize(
+        "value",
+        [
+            [Point(i, i * 10) for i in range(50)] + [12345, -1.5e10, "a,]}", None, [1, [2]]],
+            (1, "two", (3, 4)),
+            {"a": Point(1, 2), (1, 2): [1, 2], 3: {"x": "}"}, "~k": 1.25},
+            {"a": 1, "b": [1, 2]},
+            {"1": 1, "true": [2], "c": 3},
+            [],
+            {},
+        ],
+    )
+    def test_iter_file(self, tmp_path, monkeypatch, value, options):
+        """ Entries decode one at a time, across read boundaries. """
+
+        # 1. Tiny reads: values span many refills...
+        monkeypatch.setattr("pyon.reader._READ_CHUNK_SIZE", 7)
+        file_path = str(tmp_path / "data.pyon")
+        pyon.to_file(value, file_path, verbose=False, **options)
+
+        # 2. Iterates...
+        entries = list(pyon.iter_file(file_path))
+
+        # 3. Validate...
+        if isinstance(value, dict):
+            assert dict(entries) == value
+        else:
+            assert entries == list(value)
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def test_iter_file_refs(self, tmp_path):
+        """ Cycles and shared objects keep their identity in elements spanning refills. """
+
+        # 1. Prepare: elements larger than a read...
+        shared = Point(0, "shared")
+        value = [[Point(None, i), "x" * 100_000] for i in range(5)]
+        for point, _ in value:
+            point.x = point
+        value.append([shared, "x" * 100_000, shared])
+        value.append(shared)
+        file_path = str(tmp_path / "data.pyon")
+        pyon.to_file(value, file_path, verbose=False, refs=True)
+
+        # 2. Iterates...
+        entries = list(pyon.iter_file(file_path))
+
+        # 3. Validate...
+        assert all(point.x is point for point, _ in entries[:5])
+        assert entries[5][0] is entries[5][2] is entries[6]
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def test_iter_file_not_collection(self, tmp_path):
+        """ Documents that are not a top-level collection are rejected. """
+
+        # 1. Prepare...
+        file_path = str(tmp_path / "data.pyon")
+        pyon.to_file(Point(1, 2), file_path, verbose=False)
+
+        # 2. Validate...
+        with pytest.raises(ValueError):
+            list(pyon.iter_file(file_path))
+
+    # ----------------------------------------------------------------------------------------- #
+
+
+# --------------------------------------------------------------------------------------------- #
+
+
+class TestPyonSidecar:
+    """ Test suite for out-of-band buffers """
+
+    # ----------------------------------------------------------------------------------------- #
+
+    @pytest.mark.parametrize("mmap", [False, True])
+    def test_sidecar_roundtrip(self, tmp_path, mmap):
+        """ Large buffers go to the bundle directory; small ones stay inline. """
+
+        # 1. Prepare...
+        file_path = str(tmp_path / "data.pyon")
+        value = {
+            "c": np.arange(5000, dtype=np.float32).reshape(50, 100),
+            "f": np.asfortranarray(np.arange(5000, dtype=">i4").reshape(50, 100)),
+            "bytes": b"x" * 2000,
+            "small": np.arange(3, dtype=np.uint8),
+        }
+        pyon.to_file(value, file_path, verbose=False, extern_threshold=1024)
+
+        # 2. Bundle...
+        assert sorted(os.listdir(tmp_path / "data.pyon.d")) == ["0.bin", "1.bin", "2.bin"]
+        assert os.path.getsize(file_path) < 1024
+
+        # 3. Decodes...
+        decoded = pyon.from_file(file_path, mmap=mmap)
+        for key in ("c", "f", "small"):
+            assert decoded[key].dtype == value[key].dtype
+            assert np.array_equal(decoded[key], value[key])
+        assert decoded["f"].flags.f_contiguous
+        assert decoded["bytes"] == value["bytes"]
+
+        # 4. Mapped arrays are copy-on-write...
+        decoded["c"][0, 0] = -1
+        assert pyon.from_file(file_path)["c"][0, 0] == 0
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def test_sidecar_rewrite(self, tmp_path):
+        """ Rewriting removes stale buffer files; mapped arrays stay valid. """
+
+        # 1. Prepare...
+        file_path = str(tmp_path / "data.pyon")
+        value = [np.ones(1000), np.zeros(1000)]
+        pyon.to_file(value, file_path, verbose=False, extern_threshold=0)
+        mapped = pyon.from_file(file_path, mmap=True)
+
+        # 2. Inline rewrite...
+        pyon.to_file(value, file_path, verbose=False)
+        assert not os.path.exists(tmp_path / "data.pyon.d")
+        assert np.array_equal(mapped[0], value[0])
+        assert np.array_equal(pyon.from_file(file_path)[1], value[1])
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def test_sidecar_iter_file(self, tmp_path):
+        """ External buffers are read while iterating. """
+
+        # 1. Prepare...
+        file_path = str(tmp_path / "data.pyon")
+        value = [np.arange(i * 100) for i in range(1, 4)]
+        pyon.to_file(value, file_path, verbose=False, extern_threshold=0, short_tags=True)
+
+        # 2. Validate...
+        entries = list(pyon.iter_file(file_path, mmap=True))
+        assert all(np.array_equal(a, b) for a, b in zip(entries, value))
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def test_sidecar_invalid_reference(self, tmp_path):
+        """ References outside the document directory, or without a file, are not read. """
+
+        # 1. Escaping path...
+        file_path = tmp_path / "data.pyon"
+        file_path.write_text('{"__type__": "bytes", "__data__": {"__extern__": "../x.bin"}}')
+        assert pyon.from_file(str(file_path)) is None
+
+        # 2. No file...
+        assert pyon.decode(file_path.read_text()) is None
+
+    # ----------------------------------------------------------------------------------------- #
+
+
+# --------------------------------------------------------------------------------------------- #
+
+
+class TestPyonBinary:
+    """ Test suite for the binary container format """
+
+    # ----------------------------------------------------------------------------------------- #
+
+    @pytest.mark.parametrize("refs", [False, True])
+    def test_binary_roundtrip(self, refs):
+        """ Binary documents decode like text ones; buffers are raw and writable. """
+
+        # 1. Prepare...
+        shared = [Point(1, 2)]
+        value = {
+            "points": [Point(i, -i) for i in range(100)],
+            "numbers": [0, -1, 2 ** 63 - 1, -2 ** 63, 2 ** 100, -2 ** 100, 1.5, float("inf")],
+            "text": ["ção", "", "x" * 1000, "~k", None, True, False],
+            (1, "a"): {frozenset({1, 2}), (3, 4)},
+            "array": np.arange(10000, dtype=np.float32).reshape(100, 100),
+            "bytes": b"\x00\xff" * 1000,
+            "shared": [shared, shared],
+        }
+
+        # 2. Encode: raw buffers, no Base64...
+        encoded = pyon.encode(value, format="binary", refs=refs)
+        text = pyon.encode(value, compact=True, refs=refs)
+        assert encoded.startswith(b"\x89PYON")
+        assert len(encoded) < 0.8 * len(text.encode("utf-8"))
+
+        # 3. Decode: read-only documents stay unchanged...
+        pyon.decode(encoded)["array"][0, 0] = -1
+        decoded = pyon.decode(encoded)
+        assert decoded["array"].flags.writeable
+        assert np.array_equal(decoded.pop("array"), value.pop("array"))
+        assert decoded == value
+        assert (decoded["shared"][0] is decoded["shared"][1]) == refs
+
+    # ----------------------------------------------------------------------------------------- #
+
+    @pytest.mark.parametrize("mmap", [False, True])
+    def test_binary_files(self, tmp_path, mmap):
+        """ Files and streams: detected by their magic bytes, with or without a sidecar. """
+
+        # 1. Files...
+        file_path = str(tmp_path / "data.pyon")
+        value = {"c": np.arange(5000), "small": np.arange(3), "p": Point(1, 2)}
+        pyon.to_file(value, file_path, verbose=False, format="binary", extern_threshold=1024)
+        assert os.listdir(tmp_path / "data.pyon.d") == ["0.bin"]
+        decoded = pyon.from_file(file_path, mmap=mmap)
+        assert np.array_equal(decoded["c"], value["c"]) and (decoded["p"] == value["p"])
+        assert decoded["small"].flags.writeable and (decoded["small"].base is not None)
+
+        # 2. Streams: plain, and longer than their file (compressed)...
+        fp = io.BytesIO()
+        pyon.dump(value["p"], fp, format="binary")
+        fp.seek(0)
+        assert pyon.load(fp) == value["p"]
+        with open(file_path, "wb") as file, gzip.GzipFile(fileobj=file, mode="wb") as stream:
+            pyon.dump(value["c"], stream, format="binary")
+        assert np.array_equal(pyon.from_file(file_path), value["c"])
+
+        # 3. Not iterable...
+        with pytest.raises(ValueError):
+            list(pyon.iter_file(file_path))
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def test_binary_invalid(self):
+        """ Invalid formats, text targets and damaged documents are rejected. """
+
+        # 1. Options...
+        with pytest.raises(ValueError):
+            pyon.encode(Point(1, 2), format="xml")
+        with pytest.raises(ValueError):
+            pyon.dump(Point(1, 2), io.StringIO(), format="binary")
+
+        # 2. Damaged documents...
+        encoded = pyon.encode([Point(1, 2), "abc"], format="binary")
+        for damaged in (encoded[:-1], encoded + b"\x00", encoded[:8] + b"\x02" + encoded[9:]):
+            with pytest.raises(ValueError):
+                pyon.decode(damaged)
+
+        # 3. Crafted ones: a list as a dict key, deep nesting...
+        header = encoded[:9]
+        for crafted in (header + b"\x0b\x01\x0a\x00\x00", header + b"\x0a\x01" * 100000):
+            with pytest.raises(ValueError):
+                pyon.decode(crafted)
+
+    # ----------------------------------------------------------------------------------------- #
+
+
+# --------------------------------------------------------------------------------------------- #
+
+
+class TestPyonCompression:
+    """ Test suite for compressed files """
+
+    # ----------------------------------------------------------------------------------------- #
+
+    @pytest.mark.parametrize("compression", ["gzip", "bz2", "lzma", "zlib"])
+    @pytest.mark.parametrize("fmt", ["text", "binary"])
+    def test_compression_roundtrip(self, tmp_path, compression, fmt):
+        """ Compressed files are detected by their magic bytes and read back, by stdlib too. """
+
+        # 1. Write...
+        file_path = str(tmp_path / "data.pyon")
+        value = {"points": [Point(i, i % 7) for i in range(2000)], "array": np.zeros(10000)}
+        pyon.to_file(value, file_path, verbose=False, format=fmt, compression=compression)
+        plain = pyon.encode(value, format=fmt)
+        plain = plain if isinstance(plain, bytes) else plain.encode("utf-8")
+        assert os.path.getsize(file_path) < len(plain) / 5
+
+        # 2. Read, by Pyon and by the standard library...
+        decoded = pyon.from_file(file_path)
+        assert np.array_equal(decoded.pop("array"), value["array"])
+        assert decoded["points"] == value["points"]
+        with open(file_path, "rb") as file:
+            data = file.read()
+        decompress = {
+            "gzip": gzip.decompress, "bz2": bz2.decompress,
+            "lzma": lzma.decompress, "zlib": zlib.decompress,
+        }[compression]
+        assert pyon.decode(decompress(data))["points"] == value["points"]
+
+    # ----------------------------------------------------------------------------------------- #
+
+    @pytest.mark.parametrize("compression", ["gzip", "bz2", "lzma", "zlib"])
+    def test_compression_blocks(self, tmp_path, monkeypatch, compression):
+        """ Large documents are compressed in blocks on a thread pool, and iterated. """
+
+        # 1. Many small blocks...
+        monkeypatch.setattr(pyon.compression, "_BLOCK_SIZE", 4096)
+        file_path = str(tmp_path / "data.pyon")
+        value = [Point(i, -i) for i in range(5000)]
+        pyon.to_file(value, file_path, verbose=False, compression=compression)
+
+        # 2. Read whole, and iterated...
+        assert pyon.from_file(file_path) == value
+        assert list(pyon.iter_file(file_path)) == value
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def test_compression_inflate(self):
+        """ Highly compressed zlib input is inflated one read buffer at a time. """
+
+        # 1. Prepare: 16 MB of zeros, in a few KB...
+        data = zlib.compress(bytes(1 << 24))
+        reader = pyon.compression.open_reader(io.BufferedReader(io.BytesIO(data)))
+        raw = reader.raw
+
+        # 2. ...
+        buffer = bytearray(1000)
+        assert raw.readinto(buffer) == 1000
+        assert len(raw.decompressor.unconsumed_tail) > 0
+        assert reader.read() == bytes((1 << 24) - 1000)
+
+    # ----------------------------------------------------------------------------------------- #
+
+    def test_compression_invalid(self, tmp_path, monkeypatch):
+        """ Invalid codecs are rejected; failed writes leave no file. """
+
+        # 1. Codec...
+        file_path = str(tmp_path / "data.pyon")
+        with pytest.raises(ValueError):
+            pyon.to_file(Point(1, 2), file_path, verbose=False, compression="zip")
+
+        # 2. Failed compression...
+        def fail(*_):
+            raise OSError("No space left on device")
+
+        monkeypatch.setattr(pyon.compression, "_compress_block", fail)
+        with pytest.raises(OSError):
+            pyon.to_file(Point(1, 2), file_path, verbose=False, compression="gzip")
+        assert not os.path.exists(file_path)
+
+    # ----------------------------------------------------------------------------------------- #
+
+
+# --------------------------------------------------------------------------------------------- #